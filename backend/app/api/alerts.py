@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import update
 from typing import List
 
 from app.database import get_db
 from app.models.alert import Alert, AlertFrequency
-from app.schemas.alert import AlertCreate, AlertUpdate, AlertResponse
+from app.schemas.alert import AlertCreate, AlertUpdate, AlertResponse, AlertResponseList
 
 router = APIRouter()
 
@@ -14,65 +16,39 @@ router = APIRouter()
 DEFAULT_USER_ID = 1
 
 
+def _get_user_alert(db: Session, alert_id: int) -> Alert:
+    """Load an alert owned by the current user, or raise 404.
+
+    Uses a primary-key get, which is answered from the session's identity map
+    when the alert is already loaded in this request.
+    """
+    alert = db.get(Alert, alert_id)
+
+    if not alert or alert.user_id != DEFAULT_USER_ID:
+        raise HTTPException(status_code=404, detail="Alert not found")
+
+    return alert
+
+
 @router.get("/", response_model=List[AlertResponse])
 async def get_alerts(db: Session = Depends(get_db)):
     """Get all alerts for the current user"""
+    # Ordered scan of ix_alerts_user_created, no separate sort
     alerts = db.query(Alert).filter(
         Alert.user_id == DEFAULT_USER_ID
     ).order_by(Alert.created_at.desc()).all()
 
-    return [
-        AlertResponse(
-            id=alert.id,
-            user_id=alert.user_id,
-            name=alert.name,
-            regions=alert.regions or [],
-            countries=alert.countries or [],
-            themes=alert.themes or [],
-            domains=alert.domains or [],
-            keywords=alert.keywords or [],
-            min_relevance=alert.min_relevance,
-            frequency=alert.frequency,
-            is_active=alert.is_active,
-            email_enabled=alert.email_enabled,
-            last_triggered_at=alert.last_triggered_at,
-            trigger_count=alert.trigger_count,
-            created_at=alert.created_at,
-            updated_at=alert.updated_at
-        )
-        for alert in alerts
-    ]
+    return ORJSONResponse(AlertResponseList.dump_python([
+        AlertResponse.from_orm_fast(alert) for alert in alerts
+    ]))
 
 
 @router.get("/{alert_id}", response_model=AlertResponse)
 async def get_alert(alert_id: int, db: Session = Depends(get_db)):
     """Get a single alert by ID"""
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.user_id == DEFAULT_USER_ID
-    ).first()
-
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
+    alert = _get_user_alert(db, alert_id)
 
-    return AlertResponse(
-        id=alert.id,
-        user_id=alert.user_id,
-        name=alert.name,
-        regions=alert.regions or [],
-        countries=alert.countries or [],
-        themes=alert.themes or [],
-        domains=alert.domains or [],
-        keywords=alert.keywords or [],
-        min_relevance=alert.min_relevance,
-        frequency=alert.frequency,
-        is_active=alert.is_active,
-        email_enabled=alert.email_enabled,
-        last_triggered_at=alert.last_triggered_at,
-        trigger_count=alert.trigger_count,
-        created_at=alert.created_at,
-        updated_at=alert.updated_at
-    )
+    return AlertResponse.from_orm_fast(alert)
 
 
 @router.post("/", response_model=AlertResponse)
@@ -96,24 +72,7 @@ async def create_alert(alert_data: AlertCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(alert)
 
-    return AlertResponse(
-        id=alert.id,
-        user_id=alert.user_id,
-        name=alert.name,
-        regions=alert.regions or [],
-        countries=alert.countries or [],
-        themes=alert.themes or [],
-        domains=alert.domains or [],
-        keywords=alert.keywords or [],
-        min_relevance=alert.min_relevance,
-        frequency=alert.frequency,
-        is_active=alert.is_active,
-        email_enabled=alert.email_enabled,
-        last_triggered_at=alert.last_triggered_at,
-        trigger_count=alert.trigger_count,
-        created_at=alert.created_at,
-        updated_at=alert.updated_at
-    )
+    return AlertResponse.from_orm_fast(alert)
 
 
 @router.put("/{alert_id}", response_model=AlertResponse)
@@ -123,54 +82,29 @@ async def update_alert(
     db: Session = Depends(get_db)
 ):
     """Update an existing alert"""
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.user_id == DEFAULT_USER_ID
-    ).first()
-
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
+    update_data = alert_data.model_dump(exclude_unset=True, exclude_none=True)
+    if "frequency" in update_data:
+        update_data["frequency"] = AlertFrequency(update_data["frequency"])
+
+    # Apply the changes as one UPDATE rather than loading and dirtying the row
+    if update_data:
+        db.execute(
+            update(Alert)
+            .where(Alert.id == alert_id, Alert.user_id == DEFAULT_USER_ID)
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
 
-    update_data = alert_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        if value is not None:
-            if field == "frequency":
-                value = AlertFrequency(value)
-            setattr(alert, field, value)
+    alert = _get_user_alert(db, alert_id)
 
-    db.commit()
-    db.refresh(alert)
-
-    return AlertResponse(
-        id=alert.id,
-        user_id=alert.user_id,
-        name=alert.name,
-        regions=alert.regions or [],
-        countries=alert.countries or [],
-        themes=alert.themes or [],
-        domains=alert.domains or [],
-        keywords=alert.keywords or [],
-        min_relevance=alert.min_relevance,
-        frequency=alert.frequency,
-        is_active=alert.is_active,
-        email_enabled=alert.email_enabled,
-        last_triggered_at=alert.last_triggered_at,
-        trigger_count=alert.trigger_count,
-        created_at=alert.created_at,
-        updated_at=alert.updated_at
-    )
+    return AlertResponse.from_orm_fast(alert)
 
 
 @router.delete("/{alert_id}")
 async def delete_alert(alert_id: int, db: Session = Depends(get_db)):
     """Delete an alert"""
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.user_id == DEFAULT_USER_ID
-    ).first()
-
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
+    alert = _get_user_alert(db, alert_id)
 
     db.delete(alert)
     db.commit()
@@ -181,13 +115,7 @@ async def delete_alert(alert_id: int, db: Session = Depends(get_db)):
 @router.post("/{alert_id}/toggle")
 async def toggle_alert(alert_id: int, db: Session = Depends(get_db)):
     """Toggle alert active status"""
-    alert = db.query(Alert).filter(
-        Alert.id == alert_id,
-        Alert.user_id == DEFAULT_USER_ID
-    ).first()
-
-    if not alert:
-        raise HTTPException(status_code=404, detail="Alert not found")
+    alert = _get_user_alert(db, alert_id)
 
     alert.is_active = not alert.is_active
     db.commit()
@@ -1,37 +1,164 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_
+from sqlalchemy.orm import Session, joinedload, raiseload, undefer_group
+from sqlalchemy import REAL, cast, desc, or_, func, false, literal_column, null, select, tuple_
 from typing import Optional, List
 from datetime import datetime
+import base64
+import json
 
+from app.cache import cached, invalidate_response_cache, ARTICLES_CACHE_PREFIX
+from app.config import settings
 from app.database import get_db
 from app.models.article import Article, RelevanceLevel
+from app.models.article_entity import ArticleEntity
 from app.models.source import Source
-from app.schemas.article import ArticleResponse, ArticleListResponse
+from app.schemas.article import ArticleResponse, ArticleListResponse, EntityModel
 
 router = APIRouter()
 
+# Sort key for article lists: priority articles (India & neighbors) first, then
+# relevance and recency, with id as tie-breaker. NULLs are coalesced so the key
+# can be compared as a row value for keyset pagination; the partial expression
+# index ix_articles_processed_feed_order (and ix_articles_processed_region_feed_order
+# for region-filtered feeds) in migrations/ matches it.
+FEED_SORT_KEY = (
+    func.coalesce(Article.is_priority, false()),
+    func.coalesce(Article.relevance_score, literal_column("0")),
+    func.coalesce(Article.published_at, Article.created_at),
+    Article.id,
+)
+FEED_ORDER_BY = [desc(col) for col in FEED_SORT_KEY]
+
+# Columns served by the list endpoints, with the source name joined in. Lists
+# are read as plain rows and serialized directly, skipping ORM objects and
+# per-row ArticleResponse construction.
+LIST_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    # Lists show a preview only; truncating in SQL avoids shipping full bodies
+    func.substr(Article.original_content, 1, 500).label("original_content"),
+    Article.published_at,
+    Article.author,
+    Article.image_url,
+    Article.source_id,
+    Source.name.label("source_name"),
+    Article.summary_bullets,
+    Article.summary_what_happened,  # Preview fallback when there are no bullets
+    # The long-form analysis is only shown on the detail page
+    null().label("summary_why_matters"),
+    null().label("summary_india_implications"),
+    null().label("summary_future_developments"),
+    Article.relevance_level,
+    Article.relevance_score,
+    Article.geo_score,
+    Article.military_score,
+    Article.diplomatic_score,
+    Article.economic_score,
+    Article.is_priority,
+    Article.region,
+    Article.country,
+    Article.theme,
+    Article.domain,
+    Article.entities,
+    Article.is_processed,
+    Article.created_at,
+    Article.updated_at,
+)
+SCORE_FIELDS = (
+    "relevance_score", "geo_score", "military_score", "diplomatic_score", "economic_score"
+)
+
+
+def _article_row_to_dict(row) -> dict:
+    """Shape a LIST_COLUMNS row like ArticleResponse, applying its defaults"""
+    article = row._asdict()
+    article.pop("total", None)
+    article["original_content"] = article["original_content"] or None
+    article["relevance_level"] = article["relevance_level"] or RelevanceLevel.LOW
+    for field in SCORE_FIELDS:
+        article[field] = article[field] or 0.0
+    article["is_priority"] = article["is_priority"] or False
+    article["entities"] = article["entities"] or []
+    return article
+
+
+def _encode_cursor(article: dict) -> str:
+    """Serialize an article's sort key into an opaque pagination cursor"""
+    sort_time = article["published_at"] or article["created_at"]
+    values = [
+        bool(article["is_priority"]),
+        article["relevance_score"] or 0.0,
+        sort_time.isoformat() if sort_time else None,
+        article["id"],
+    ]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Parse a cursor produced by _encode_cursor back into sort key values"""
+    try:
+        is_priority, relevance_score, sort_time, article_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return (
+            bool(is_priority),
+            float(relevance_score),
+            datetime.fromisoformat(sort_time),
+            int(article_id),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_cursor(cursor: str):
+    """Keyset filter for the rows sorting after the cursor's article"""
+    is_priority, relevance_score, sort_time, article_id = _decode_cursor(cursor)
+    # relevance_score is REAL: bind the cursor value as REAL too, otherwise Postgres
+    # widens the column to float8 and e.g. 0.7::real sorts below the cursor's 0.7,
+    # so rows tied on that score would come back on every following page
+    return tuple_(*FEED_SORT_KEY) < tuple_(
+        is_priority, cast(relevance_score, REAL), sort_time, article_id
+    )
+
+
+def _article_load_options():
+    """Eager-load the source and the deferred content columns with the article"""
+    options = [joinedload(Article.source), undefer_group("content")]
+    if settings.sql_raiseload:
+        # Fail loudly on any other lazy load so N+1 regressions surface in dev
+        options.append(raiseload("*"))
+    return options
+
 
 @router.get("/", response_model=ArticleListResponse)
-async def get_articles(
+@cached(prefix=f"{ARTICLES_CACHE_PREFIX}:list", ttl=45)
+def get_articles(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     region: Optional[str] = None,
     country: Optional[str] = None,
     theme: Optional[str] = None,
     domain: Optional[str] = None,
     relevance_level: Optional[str] = None,
     source_id: Optional[int] = None,
+    entity: Optional[str] = None,
     search: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     processed_only: bool = True,
+    include_total: bool = True,
     db: Session = Depends(get_db)
 ):
     """
     Get paginated list of articles with optional filters.
+
+    Pass the returned next_cursor as `cursor` to fetch the following page with
+    keyset pagination; `page` is kept as an OFFSET fallback for page-number UIs.
+    Feeds that only need has_more can pass include_total=false to skip counting.
     """
-    query = db.query(Article)
+    query = db.query(*LIST_COLUMNS).outerjoin(Source, Source.id == Article.source_id)
 
     # Apply filters
     if processed_only:
@@ -55,7 +182,21 @@ async def get_articles(
     if source_id:
         query = query.filter(Article.source_id == source_id)
 
-    if search:
+    if entity:
+        # Probes ix_article_entities_name_type instead of inspecting each row's JSON
+        query = query.filter(Article.id.in_(
+            select(ArticleEntity.article_id).where(ArticleEntity.name == entity)
+        ))
+
+    search_rank = None
+    if search and len(search.split()) > 1:
+        # Multi-word searches use the full-text index and are ranked by match
+        ts_query = func.plainto_tsquery("english", search)
+        query = query.filter(Article.search_vec.op("@@")(ts_query))
+        search_rank = func.ts_rank(Article.search_vec, ts_query)
+    elif search:
+        # Single terms may be partial words: substring match served by the
+        # pg_trgm GIN indexes on title and original_content
         search_term = f"%{search}%"
         query = query.filter(
             or_(
@@ -70,128 +211,92 @@ async def get_articles(
     if end_date:
         query = query.filter(Article.published_at <= end_date)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination and ordering - Priority articles (India & neighbors) first
-    articles = query.order_by(
-        desc(Article.is_priority),  # Priority articles first
-        desc(Article.relevance_score),
-        desc(Article.published_at)
-    ).offset((page - 1) * page_size).limit(page_size).all()
-
-    # Build response with source names
-    article_responses = []
-    for article in articles:
-        source = db.query(Source).filter(Source.id == article.source_id).first()
-        response = ArticleResponse(
-            id=article.id,
-            title=article.title,
-            url=article.url,
-            original_content=article.original_content[:500] if article.original_content else None,
-            published_at=article.published_at,
-            author=article.author,
-            image_url=article.image_url,
-            source_id=article.source_id,
-            source_name=source.name if source else None,
-            summary_bullets=article.summary_bullets,
-            summary_what_happened=article.summary_what_happened,
-            summary_why_matters=article.summary_why_matters,
-            summary_india_implications=article.summary_india_implications,
-            summary_future_developments=article.summary_future_developments,
-            relevance_level=article.relevance_level or RelevanceLevel.LOW,
-            relevance_score=article.relevance_score or 0.0,
-            geo_score=article.geo_score or 0.0,
-            military_score=article.military_score or 0.0,
-            diplomatic_score=article.diplomatic_score or 0.0,
-            economic_score=article.economic_score or 0.0,
-            is_priority=article.is_priority or False,
-            region=article.region,
-            country=article.country,
-            theme=article.theme,
-            domain=article.domain,
-            entities=article.entities or [],
-            is_processed=article.is_processed,
-            created_at=article.created_at,
-            updated_at=article.updated_at
+    # Apply pagination and ordering - Priority articles (India & neighbors) first.
+    # One extra row is fetched to know whether another page follows.
+    if search_rank is not None:
+        query = query.order_by(desc(search_rank), *FEED_ORDER_BY)
+    else:
+        query = query.order_by(*FEED_ORDER_BY)
+
+    if cursor and search_rank is not None:
+        raise HTTPException(
+            status_code=400,
+            detail="Ranked search results are paginated by page, not cursor"
         )
-        article_responses.append(response)
-
-    total_pages = (total + page_size - 1) // page_size
-
-    return ArticleListResponse(
-        articles=article_responses,
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages
-    )
+    elif cursor:
+        # Keyset pages skip the total: counting would rescan the whole filtered set
+        articles = query.filter(_after_cursor(cursor)).limit(page_size + 1).all()
+        total = None
+    elif not include_total:
+        # Without the window count the scan stops after page_size + 1 rows
+        articles = query.offset((page - 1) * page_size).limit(page_size + 1).all()
+        total = None
+    else:
+        # count() OVER () returns the filtered total alongside each row,
+        # saving a separate COUNT query over the same filters
+        rows = query.add_columns(func.count().over().label("total")).offset(
+            (page - 1) * page_size
+        ).limit(page_size + 1).all()
+        articles = rows
+        if rows:
+            total = rows[0].total
+        else:
+            total = query.count() if page > 1 else 0
+
+    articles = [_article_row_to_dict(row) for row in articles]
+
+    next_cursor = None
+    has_more = len(articles) > page_size
+    if has_more:
+        articles = articles[:page_size]
+        if search_rank is None:
+            next_cursor = _encode_cursor(articles[-1])
+
+    total_pages = (total + page_size - 1) // page_size if total is not None else None
+
+    # @cached returns the orjson-encoded body directly, skipping FastAPI's
+    # jsonable_encoder walk and response_model validation; response_model stays for docs.
+    return {
+        "articles": articles,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "next_cursor": next_cursor,
+        "has_more": has_more
+    }
 
 
 @router.get("/high-relevance", response_model=List[ArticleResponse])
-async def get_high_relevance_articles(
+@cached(prefix=f"{ARTICLES_CACHE_PREFIX}:high_relevance", ttl=45)
+def get_high_relevance_articles(
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db)
 ):
     """Get top high-relevance articles - India & neighbors prioritized"""
-    articles = db.query(Article).filter(
+    rows = db.query(*LIST_COLUMNS).outerjoin(
+        Source, Source.id == Article.source_id
+    ).filter(
         Article.is_processed == 1,
         Article.relevance_level == RelevanceLevel.HIGH
-    ).order_by(
-        desc(Article.is_priority),  # Priority articles first
-        desc(Article.relevance_score),
-        desc(Article.published_at)
-    ).limit(limit).all()
-
-    responses = []
-    for article in articles:
-        source = db.query(Source).filter(Source.id == article.source_id).first()
-        responses.append(ArticleResponse(
-            id=article.id,
-            title=article.title,
-            url=article.url,
-            original_content=article.original_content[:500] if article.original_content else None,
-            published_at=article.published_at,
-            author=article.author,
-            image_url=article.image_url,
-            source_id=article.source_id,
-            source_name=source.name if source else None,
-            summary_bullets=article.summary_bullets,
-            summary_what_happened=article.summary_what_happened,
-            summary_why_matters=article.summary_why_matters,
-            summary_india_implications=article.summary_india_implications,
-            summary_future_developments=article.summary_future_developments,
-            relevance_level=article.relevance_level or RelevanceLevel.LOW,
-            relevance_score=article.relevance_score or 0.0,
-            geo_score=article.geo_score or 0.0,
-            military_score=article.military_score or 0.0,
-            diplomatic_score=article.diplomatic_score or 0.0,
-            economic_score=article.economic_score or 0.0,
-            is_priority=article.is_priority or False,
-            region=article.region,
-            country=article.country,
-            theme=article.theme,
-            domain=article.domain,
-            entities=article.entities or [],
-            is_processed=article.is_processed,
-            created_at=article.created_at,
-            updated_at=article.updated_at
-        ))
+    ).order_by(*FEED_ORDER_BY).limit(limit).all()
 
-    return responses
+    return [_article_row_to_dict(row) for row in rows]
 
 
 @router.get("/{article_id}", response_model=ArticleResponse)
 async def get_article(article_id: int, db: Session = Depends(get_db)):
     """Get a single article by ID"""
-    article = db.query(Article).filter(Article.id == article_id).first()
+    article = db.query(Article).options(*_article_load_options()).filter(
+        Article.id == article_id
+    ).first()
 
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    source = db.query(Source).filter(Source.id == article.source_id).first()
+    source = article.source
 
-    return ArticleResponse(
+    return ArticleResponse.model_construct(
         id=article.id,
         title=article.title,
         url=article.url,
@@ -217,7 +322,11 @@ async def get_article(article_id: int, db: Session = Depends(get_db)):
         country=article.country,
         theme=article.theme,
         domain=article.domain,
-        entities=article.entities or [],
+        entities=[
+            EntityModel.model_construct(type=e.get("type", ""), name=e.get("name", ""))
+            for e in article.entities or []
+            if isinstance(e, dict)
+        ],
         is_processed=article.is_processed,
         created_at=article.created_at,
         updated_at=article.updated_at
@@ -229,7 +338,7 @@ async def get_regions(db: Session = Depends(get_db)):
     """Get list of all regions with article counts"""
     results = db.query(
         Article.region,
-        db.query(Article).filter(Article.region == Article.region).count()
+        func.count(Article.id)
     ).filter(
         Article.region.isnot(None),
         Article.is_processed == 1
@@ -243,7 +352,7 @@ async def get_themes(db: Session = Depends(get_db)):
     """Get list of all themes with article counts"""
     results = db.query(
         Article.theme,
-        db.query(Article).filter(Article.theme == Article.theme).count()
+        func.count(Article.id)
     ).filter(
         Article.theme.isnot(None),
         Article.is_processed == 1
@@ -264,6 +373,7 @@ async def reprocess_all_articles(db: Session = Depends(get_db)):
             Article.is_processed: 0
         })
         db.commit()
+        invalidate_response_cache()
         return {
             "status": "success",
             "message": f"Marked {count} articles for reprocessing",
@@ -279,14 +389,16 @@ async def reprocess_articles_without_summary(db: Session = Depends(get_db)):
     Reprocess only articles that don't have bullet summaries yet.
     """
     try:
-        # Find articles without bullet summary
+        # Find articles without bullet summary. Missing summaries are always
+        # NULL, so this is served by the ix_articles_missing_summary partial index.
         count = db.query(Article).filter(
             Article.is_processed == 1,
-            (Article.summary_bullets.is_(None)) | (Article.summary_bullets == "")
+            Article.summary_bullets.is_(None)
         ).update({
             Article.is_processed: 0
         })
         db.commit()
+        invalidate_response_cache()
         return {
             "status": "success",
             "message": f"Marked {count} articles for reprocessing",
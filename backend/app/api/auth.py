@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
+import time
 
 from app.database import get_db
 from app.config import settings
@@ -28,7 +32,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 
@@ -41,15 +45,37 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     return encoded_jwt
 
 
-def decode_token(token: str) -> dict:
-    """Decode and verify a JWT token"""
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> Optional[dict]:
+    """Verify a token's signature once; repeat requests with it hit the cache"""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        return payload
+        return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
     except JWTError:
         return None
 
 
+def decode_token(token: str) -> dict:
+    """Decode and verify a JWT token"""
+    payload = _decode_token_cached(token)
+    # Cached payloads outlive the token, so expiry is re-checked on every call
+    if payload is None or payload.get("exp", 0) <= time.time():
+        return None
+    return payload
+
+
+def get_token_user(token: str, payload: dict, db: Session) -> Optional[User]:
+    """Resolve the user for a decoded token"""
+    user_id = payload.get("user_id")
+    if user_id is not None:
+        # Primary-key lookup from the token's user_id claim; served from the
+        # identity map if already loaded. The username check rejects a token
+        # whose id now belongs to a different account.
+        user = db.get(User, user_id)
+        return user if user and user.username == payload.get("sub") else None
+
+    return db.query(User).filter(User.username == payload.get("sub")).first()
+
+
 async def get_current_user_from_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -68,8 +94,7 @@ async def get_current_user_from_token(
             detail="Invalid or expired token"
         )
 
-    username = payload.get("sub")
-    user = db.query(User).filter(User.username == username).first()
+    user = get_token_user(credentials.credentials, payload, db)
 
     if not user:
         raise HTTPException(
@@ -103,9 +128,10 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Determine role based on invite code
-    user_count = db.query(User).count()
+    # (existence check reads at most one row instead of counting the table)
+    has_users = db.query(User.id).limit(1).first() is not None
 
-    if user_count == 0:
+    if not has_users:
         # First user is always admin
         role = UserRole.ADMIN
     elif user_data.role == UserRole.ADMIN:
@@ -142,10 +168,11 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", response_model=Token)
 async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     """Login and get access token"""
-    # Try to find user by username or email
-    user = db.query(User).filter(
-        (User.username == login_data.username) | (User.email == login_data.username)
-    ).first()
+    # Try to find user by username, then by email. Two single-column lookups
+    # each use their unique index, unlike an OR across both columns.
+    user = db.query(User).filter(User.username == login_data.username).first()
+    if not user:
+        user = db.query(User).filter(User.email == login_data.username).first()
 
     if not user or not verify_password(login_data.password, user.hashed_password):
         raise HTTPException(
@@ -193,8 +220,7 @@ async def get_current_user(
             detail="Invalid or expired token"
         )
 
-    username = payload.get("sub")
-    user = db.query(User).filter(User.username == username).first()
+    user = get_token_user(credentials.credentials, payload, db)
 
     if not user:
         raise HTTPException(
@@ -247,13 +273,13 @@ async def setup_default_accounts(db: Session = Depends(get_db)):
     if created:
         db.commit()
 
-    return {
+    return ORJSONResponse({
         "message": f"Created {len(created)} accounts" if created else "Accounts already exist",
         "accounts": created if created else [
             {"username": "admin", "role": "admin"},
             {"username": "analyst", "role": "analyst"}
         ]
-    }
+    })
 
 
 @router.put("/users/{user_id}/role")
@@ -307,17 +333,15 @@ async def list_users(
             detail="Only admins can view all users"
         )
 
-    users = db.query(User).all()
-    return [
-        {
-            "id": u.id,
-            "username": u.username,
-            "email": u.email,
-            "full_name": u.full_name,
-            "role": u.role.value,
-            "is_active": u.is_active,
-            "created_at": u.created_at,
-            "last_login_at": u.last_login_at
-        }
-        for u in users
-    ]
+    # Select only the listed columns; orjson serializes the UserRole enum by value
+    rows = db.query(
+        User.id,
+        User.username,
+        User.email,
+        User.full_name,
+        User.role,
+        User.is_active,
+        User.created_at,
+        User.last_login_at
+    ).all()
+    return ORJSONResponse([row._asdict() for row in rows])
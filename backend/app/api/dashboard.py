@@ -1,392 +1,495 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, case, and_, values, table, column, Integer, String, Float
 from datetime import datetime, timedelta
+from collections import namedtuple
+from types import MappingProxyType
 from typing import List, Dict, Any
 
 from app.database import get_db
+from app.cache import cached, DASHBOARD_CACHE_PREFIX
 from app.models.article import Article, RelevanceLevel
 from app.models.source import Source
 
 router = APIRouter()
 
 
+def _count_where(*conditions):
+    """COUNT of rows matching all conditions, for use in a single aggregate query"""
+    return func.count(case((and_(*conditions), 1)))
+
+
+def _rows_payload(columns: tuple, rows: List[list], columnar: bool):
+    """
+    Rows as {"columns": [...], "rows": [[...], ...]} when columnar is requested,
+    otherwise the usual list of objects
+    """
+    if columnar:
+        return {"columns": list(columns), "rows": rows}
+    return [dict(zip(columns, row)) for row in rows]
+
+
+# Immutable coordinate entry for the map endpoints
+Coord = namedtuple("Coord", "lat lng zoom", defaults=(None,))
+
+# Coordinates (and default map zoom) for major geopolitical regions
+REGION_COORDS = MappingProxyType({
+    "South Asia": Coord(20.5937, 78.9629, zoom=4),
+    "East Asia": Coord(35.8617, 104.1954, zoom=4),
+    "Indo-Pacific": Coord(0, 120, zoom=3),
+    "Middle East": Coord(29.2985, 42.5510, zoom=5),
+    "Europe": Coord(54.5260, 15.2551, zoom=4),
+    "Central Asia": Coord(45.0, 68.0, zoom=4),
+    "Africa": Coord(-8.7832, 34.5085, zoom=3),
+    "Americas": Coord(37.0902, -95.7129, zoom=3),
+})
+
+# Coordinates for countries, keyed by canonical name
+COUNTRY_COORDS = MappingProxyType({
+    # Asia
+    "India": Coord(20.5937, 78.9629),
+    "China": Coord(35.8617, 104.1954),
+    "Pakistan": Coord(30.3753, 69.3451),
+    "Bangladesh": Coord(23.685, 90.3563),
+    "Nepal": Coord(28.3949, 84.124),
+    "Sri Lanka": Coord(7.8731, 80.7718),
+    "Myanmar": Coord(21.9162, 95.956),
+    "Thailand": Coord(15.87, 100.9925),
+    "Vietnam": Coord(14.0583, 108.2772),
+    "Indonesia": Coord(-0.7893, 113.9213),
+    "Malaysia": Coord(4.2105, 101.9758),
+    "Philippines": Coord(12.8797, 121.774),
+    "Japan": Coord(36.2048, 138.2529),
+    "South Korea": Coord(35.9078, 127.7669),
+    "North Korea": Coord(40.3399, 127.5101),
+    "Taiwan": Coord(23.6978, 120.9605),
+    "Singapore": Coord(1.3521, 103.8198),
+    "Afghanistan": Coord(33.9391, 67.71),
+    # Middle East
+    "Iran": Coord(32.4279, 53.688),
+    "Iraq": Coord(33.2232, 43.6793),
+    "Syria": Coord(34.8021, 38.9968),
+    "Israel": Coord(31.0461, 34.8516),
+    "Palestine": Coord(31.9522, 35.2332),
+    "Saudi Arabia": Coord(23.8859, 45.0792),
+    "UAE": Coord(23.4241, 53.8478),
+    "Turkey": Coord(38.9637, 35.2433),
+    "Yemen": Coord(15.5527, 48.5164),
+    "Lebanon": Coord(33.8547, 35.8623),
+    "Jordan": Coord(30.5852, 36.2384),
+    "Qatar": Coord(25.3548, 51.1839),
+    "Kuwait": Coord(29.3117, 47.4818),
+    "Oman": Coord(21.4735, 55.9754),
+    "Bahrain": Coord(26.0667, 50.5577),
+    # Europe
+    "Russia": Coord(61.524, 105.3188),
+    "Ukraine": Coord(48.3794, 31.1656),
+    "United Kingdom": Coord(55.3781, -3.436),
+    "Germany": Coord(51.1657, 10.4515),
+    "France": Coord(46.2276, 2.2137),
+    "Italy": Coord(41.8719, 12.5674),
+    "Poland": Coord(51.9194, 19.1451),
+    "Spain": Coord(40.4637, -3.7492),
+    "Netherlands": Coord(52.1326, 5.2913),
+    "Belgium": Coord(50.5039, 4.4699),
+    "Sweden": Coord(60.1282, 18.6435),
+    "Norway": Coord(60.472, 8.4689),
+    "Finland": Coord(61.9241, 25.7482),
+    "Greece": Coord(39.0742, 21.8243),
+    "Serbia": Coord(44.0165, 21.0059),
+    "Hungary": Coord(47.1625, 19.5033),
+    "Romania": Coord(45.9432, 24.9668),
+    "Belarus": Coord(53.7098, 27.9534),
+    # Americas
+    "United States": Coord(37.0902, -95.7129),
+    "Canada": Coord(56.1304, -106.3468),
+    "Mexico": Coord(23.6345, -102.5528),
+    "Brazil": Coord(-14.235, -51.9253),
+    "Argentina": Coord(-38.4161, -63.6167),
+    "Colombia": Coord(4.5709, -74.2973),
+    "Venezuela": Coord(6.4238, -66.5897),
+    "Chile": Coord(-35.6751, -71.543),
+    "Peru": Coord(-9.19, -75.0152),
+    "Cuba": Coord(21.5218, -77.7812),
+    # Africa
+    "Egypt": Coord(26.8206, 30.8025),
+    "South Africa": Coord(-30.5595, 22.9375),
+    "Nigeria": Coord(9.082, 8.6753),
+    "Kenya": Coord(-0.0236, 37.9062),
+    "Ethiopia": Coord(9.145, 40.4897),
+    "Sudan": Coord(12.8628, 30.2176),
+    "Libya": Coord(26.3351, 17.2283),
+    "Morocco": Coord(31.7917, -7.0926),
+    "Algeria": Coord(28.0339, 1.6596),
+    "Tunisia": Coord(33.8869, 9.5375),
+    # Central Asia
+    "Kazakhstan": Coord(48.0196, 66.9237),
+    "Uzbekistan": Coord(41.3775, 64.5853),
+    "Turkmenistan": Coord(38.9697, 59.5563),
+    "Tajikistan": Coord(38.861, 71.2761),
+    "Kyrgyzstan": Coord(41.2044, 74.7661),
+    # Oceania
+    "Australia": Coord(-25.2744, 133.7751),
+    "New Zealand": Coord(-40.9006, 174.886),
+})
+
+# Alternate spellings the analyzer emits, mapped to a canonical COUNTRY_COORDS key.
+# Matching is exact on lower-cased names, so long forms need their own entry.
+COUNTRY_ALIASES = MappingProxyType({
+    "UK": "United Kingdom",
+    "U.K.": "United Kingdom",
+    "Britain": "United Kingdom",
+    "Great Britain": "United Kingdom",
+    "USA": "United States",
+    "US": "United States",
+    "U.S.": "United States",
+    "U.S.A.": "United States",
+    "United States of America": "United States",
+    "America": "United States",
+    "PRC": "China",
+    "People's Republic of China": "China",
+    "Russian Federation": "Russia",
+    "Republic of Korea": "South Korea",
+    "DPRK": "North Korea",
+    "Burma": "Myanmar",
+    "United Arab Emirates": "UAE",
+    "Türkiye": "Turkey",
+    "Gaza": "Palestine",
+    "Islamic Republic of Iran": "Iran",
+})
+
+# COUNTRY_COORDS plus aliases as an inline VALUES table, so country hotspots
+# are resolved with a join in the database instead of a Python lookup loop
+_country_coord_rows = [
+    (name.lower(), name, coords.lat, coords.lng)
+    for name, coords in COUNTRY_COORDS.items()
+] + [
+    (alias.lower(), name, COUNTRY_COORDS[name].lat, COUNTRY_COORDS[name].lng)
+    for alias, name in COUNTRY_ALIASES.items()
+]
+country_coords_table = values(
+    column("name", String),
+    column("canonical", String),
+    column("lat", Float),
+    column("lng", Float),
+    name="country_coords"
+).data(_country_coord_rows)
+
+# Read-only handles on the tables/views created by the Alembic migrations
+article_counters = table(
+    "article_counters",
+    column("key", String),
+    column("value", Integer)
+)
+
+country_hotspots_view = table(
+    "mv_country_hotspots",
+    column("country_key", String),
+    column("total", Integer),
+    column("high_count", Integer)
+)
+
+
 @router.get("/stats")
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:stats", ttl=60)
+def get_dashboard_stats(db: Session = Depends(get_db)):
     """Get overall dashboard statistics"""
     now = datetime.utcnow()
     last_24h = now - timedelta(hours=24)
     last_7d = now - timedelta(days=7)
 
-    # Total articles
-    total_articles = db.query(Article).count()
-
-    # Articles by relevance
-    high_relevance = db.query(Article).filter(
-        Article.relevance_level == RelevanceLevel.HIGH,
-        Article.is_processed == 1
-    ).count()
-
-    medium_relevance = db.query(Article).filter(
-        Article.relevance_level == RelevanceLevel.MEDIUM,
-        Article.is_processed == 1
-    ).count()
-
-    low_relevance = db.query(Article).filter(
-        Article.relevance_level == RelevanceLevel.LOW,
-        Article.is_processed == 1
-    ).count()
-
-    # Recent activity
-    articles_24h = db.query(Article).filter(
-        Article.created_at >= last_24h
-    ).count()
+    # Totals come from the trigger-maintained counter table (O(1) read)
+    counters = dict(db.query(article_counters.c.key, article_counters.c.value).all())
 
-    articles_7d = db.query(Article).filter(
+    # Time windows are a range count on the created_at index; COUNT(CASE ...)
+    # skips the NULLs produced by non-matching rows and is portable across dialects.
+    recent_counts = db.query(
+        _count_where(Article.created_at >= last_24h).label("last_24h"),
+        func.count(Article.id).label("last_7d"),
+    ).filter(
         Article.created_at >= last_7d
-    ).count()
-
-    # Active sources
-    active_sources = db.query(Source).filter(Source.is_active == True).count()
-    total_sources = db.query(Source).count()
+    ).one()
 
-    # Pending processing
-    pending_processing = db.query(Article).filter(
-        Article.is_processed == 0
-    ).count()
+    source_counts = db.query(
+        func.count(Source.id).label("total"),
+        _count_where(Source.is_active == True).label("active"),
+    ).one()
 
     return {
-        "total_articles": total_articles,
+        "total_articles": counters.get("total", 0),
         "relevance_breakdown": {
-            "high": high_relevance,
-            "medium": medium_relevance,
-            "low": low_relevance
+            "high": counters.get("high", 0),
+            "medium": counters.get("medium", 0),
+            "low": counters.get("low", 0)
         },
         "recent_activity": {
-            "last_24h": articles_24h,
-            "last_7d": articles_7d
+            "last_24h": recent_counts.last_24h,
+            "last_7d": recent_counts.last_7d
         },
         "sources": {
-            "active": active_sources,
-            "total": total_sources
+            "active": source_counts.active,
+            "total": source_counts.total
         },
-        "pending_processing": pending_processing
+        "pending_processing": counters.get("pending", 0)
     }
 
 
 @router.get("/trends")
-async def get_trends(days: int = 7, db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:trends", ttl=300)
+def get_trends(days: int = 7, columnar: bool = False, db: Session = Depends(get_db)):
     """Get article trends over time"""
-    now = datetime.utcnow()
-    start_date = now - timedelta(days=days)
+    today = datetime.utcnow().date()
+    first_day = today - timedelta(days=days - 1)
+    start_date = datetime.combine(first_day, datetime.min.time())
 
-    # Get daily counts
-    daily_counts = []
-
-    for i in range(days):
-        day_start = start_date + timedelta(days=i)
-        day_end = day_start + timedelta(days=1)
-
-        count = db.query(Article).filter(
-            Article.created_at >= day_start,
-            Article.created_at < day_end
-        ).count()
+    # One grouped query for the whole window instead of two per day
+    day = func.date(Article.created_at).label("day")
+    results = db.query(
+        day,
+        func.count(Article.id).label("total"),
+        _count_where(Article.relevance_level == RelevanceLevel.HIGH).label("high_count")
+    ).filter(
+        Article.created_at >= start_date
+    ).group_by(day).all()
 
-        high_count = db.query(Article).filter(
-            Article.created_at >= day_start,
-            Article.created_at < day_end,
-            Article.relevance_level == RelevanceLevel.HIGH
-        ).count()
+    # date() comes back as a date on Postgres and a string on SQLite
+    by_day = {str(r.day): r for r in results}
 
-        daily_counts.append({
-            "date": day_start.strftime("%Y-%m-%d"),
-            "total": count,
-            "high_relevance": high_count
-        })
+    # Zero-fill days without articles so the series has no gaps
+    daily_counts = []
+    for i in range(days):
+        date_key = (first_day + timedelta(days=i)).strftime("%Y-%m-%d")
+        row = by_day.get(date_key)
+        daily_counts.append([
+            date_key,
+            row.total if row else 0,
+            row.high_count if row else 0
+        ])
 
-    return daily_counts
+    return _rows_payload(("date", "total", "high_relevance"), daily_counts, columnar)
 
 
-@router.get("/regions")
-async def get_region_stats(db: Session = Depends(get_db)):
-    """Get article distribution by region"""
+def _dimension_stats(db: Session, country_limit: int) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Region, theme and country distributions of processed articles from one
+    GROUPING SETS query, so the table is scanned once for all three.
+    """
     results = db.query(
         Article.region,
+        Article.theme,
+        Article.country,
+        func.grouping(Article.region).label("by_region"),
+        func.grouping(Article.theme).label("by_theme"),
+        func.count(Article.id).label("count"),
+        func.avg(Article.relevance_score).label("avg_relevance")
+    ).filter(
+        Article.is_processed == 1
+    ).group_by(
+        func.grouping_sets(Article.region, Article.theme, Article.country)
+    ).order_by(desc("count"))
+
+    regions, themes, countries = [], [], []
+    # Stream rows from a server-side cursor rather than materializing them first
+    for r in results.yield_per(200):
+        # grouping() is 0 for the column a row is grouped by
+        if r.by_region == 0:
+            if r.region and r.region.strip():  # Filter out empty strings
+                regions.append({
+                    "region": r.region,
+                    "count": r.count,
+                    "avg_relevance": round(r.avg_relevance or 0, 3)
+                })
+        elif r.by_theme == 0:
+            if r.theme is not None:
+                themes.append({
+                    "theme": r.theme,
+                    "count": r.count,
+                    "avg_relevance": round(r.avg_relevance or 0, 3)
+                })
+        elif r.country and r.country.strip() and len(countries) < country_limit:
+            countries.append({"country": r.country, "count": r.count})
+
+    return {"regions": regions, "themes": themes, "countries": countries}
+
+
+@router.get("/dimensions")
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:dimensions", ttl=300)
+def get_dimension_stats(country_limit: int = 20, db: Session = Depends(get_db)):
+    """Get region, theme and country distributions in one call"""
+    return _dimension_stats(db, country_limit)
+
+
+def _column_stats(db: Session, column):
+    """Counts and mean relevance of processed articles grouped by a single column"""
+    return db.query(
+        column.label("value"),
         func.count(Article.id).label("count"),
         func.avg(Article.relevance_score).label("avg_relevance")
     ).filter(
-        Article.region.isnot(None),
-        Article.region != "",
+        column.isnot(None),
         Article.is_processed == 1
-    ).group_by(Article.region).all()
+    ).group_by(column).order_by(desc("count")).all()
 
+
+@router.get("/regions")
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:regions", ttl=300)
+def get_region_stats(db: Session = Depends(get_db)):
+    """Get article distribution by region"""
     return [
-        {
-            "region": r.region if r.region else "Unknown",
-            "count": r.count,
-            "avg_relevance": round(r.avg_relevance or 0, 3)
-        }
-        for r in results
-        if r.region and r.region.strip()  # Filter out empty strings
+        {"region": r.value, "count": r.count, "avg_relevance": round(r.avg_relevance or 0, 3)}
+        for r in _column_stats(db, Article.region)
+        if r.value.strip()  # Filter out empty strings
     ]
 
 
 @router.get("/themes")
-async def get_theme_stats(db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:themes", ttl=300)
+def get_theme_stats(db: Session = Depends(get_db)):
     """Get article distribution by theme"""
-    results = db.query(
-        Article.theme,
-        func.count(Article.id).label("count"),
-        func.avg(Article.relevance_score).label("avg_relevance")
-    ).filter(
-        Article.theme.isnot(None),
-        Article.is_processed == 1
-    ).group_by(Article.theme).all()
-
     return [
-        {
-            "theme": r.theme,
-            "count": r.count,
-            "avg_relevance": round(r.avg_relevance or 0, 3)
-        }
-        for r in results
+        {"theme": r.value, "count": r.count, "avg_relevance": round(r.avg_relevance or 0, 3)}
+        for r in _column_stats(db, Article.theme)
     ]
 
 
 @router.get("/countries")
-async def get_country_stats(limit: int = 20, db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:countries", ttl=300)
+def get_country_stats(limit: int = 20, columnar: bool = False, db: Session = Depends(get_db)):
     """Get top countries by article count"""
-    results = db.query(
+    # Blank countries are excluded in SQL so they don't take LIMIT slots
+    rows = db.query(
         Article.country,
         func.count(Article.id).label("count")
     ).filter(
-        Article.country.isnot(None),
-        Article.country != "",
+        func.trim(Article.country) != "",
         Article.is_processed == 1
-    ).group_by(Article.country).order_by(
-        desc(func.count(Article.id))
-    ).limit(limit).all()
-
-    return [
-        {"country": r.country if r.country else "Unknown", "count": r.count}
-        for r in results
-        if r.country and r.country.strip()  # Filter out empty strings
-    ]
+    ).group_by(Article.country).order_by(desc("count")).limit(limit).all()
+    return _rows_payload(("country", "count"), [[r.country, r.count] for r in rows], columnar)
 
 
 @router.get("/hotspots")
-async def get_geopolitical_hotspots(db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:hotspots", ttl=120)
+def get_geopolitical_hotspots(db: Session = Depends(get_db)):
     """
     Get geopolitical hotspots based on high-relevance article concentration.
     Returns data suitable for map visualization.
     """
-    # Coordinates for major geopolitical regions
-    region_coords = {
-        "South Asia": {"lat": 20.5937, "lng": 78.9629, "zoom": 4},
-        "East Asia": {"lat": 35.8617, "lng": 104.1954, "zoom": 4},
-        "Indo-Pacific": {"lat": 0, "lng": 120, "zoom": 3},
-        "Middle East": {"lat": 29.2985, "lng": 42.5510, "zoom": 5},
-        "Europe": {"lat": 54.5260, "lng": 15.2551, "zoom": 4},
-        "Central Asia": {"lat": 45.0, "lng": 68.0, "zoom": 4},
-        "Africa": {"lat": -8.7832, "lng": 34.5085, "zoom": 3},
-        "Americas": {"lat": 37.0902, "lng": -95.7129, "zoom": 3}
-    }
-
     # Get articles by region with high relevance
     results = db.query(
         Article.region,
         func.count(Article.id).label("total"),
-        func.sum(
-            func.cast(Article.relevance_level == RelevanceLevel.HIGH, db.bind.dialect.name != 'sqlite' and Integer or Integer)
-        ).label("high_count")
+        _count_where(Article.relevance_level == RelevanceLevel.HIGH).label("high_count")
     ).filter(
-        Article.region.isnot(None),
+        Article.region.in_(list(REGION_COORDS)),
         Article.is_processed == 1
-    ).group_by(Article.region).all()
-
-    hotspots = []
-    for r in results:
-        if r.region in region_coords:
-            coords = region_coords[r.region]
-            intensity = min((r.high_count or 0) / 10, 1.0)  # Normalize intensity
+    ).group_by(Article.region).order_by(desc("high_count")).all()
 
-            hotspots.append({
-                "region": r.region,
-                "lat": coords["lat"],
-                "lng": coords["lng"],
-                "total_articles": r.total,
-                "high_relevance": r.high_count or 0,
-                "intensity": round(intensity, 2)
-            })
-
-    return sorted(hotspots, key=lambda x: x["high_relevance"], reverse=True)
+    return [
+        {
+            "region": r.region,
+            "lat": REGION_COORDS[r.region].lat,
+            "lng": REGION_COORDS[r.region].lng,
+            "total_articles": r.total,
+            "high_relevance": r.high_count,
+            "intensity": round(min(r.high_count / 10, 1.0), 2)  # Normalize intensity
+        }
+        for r in results
+    ]
 
 
 @router.get("/country-hotspots")
-async def get_country_hotspots(limit: int = 30, db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:country_hotspots", ttl=120)
+def get_country_hotspots(limit: int = 30, columnar: bool = False, db: Session = Depends(get_db)):
     """
     Get country-wise hotspots with coordinates for map visualization.
     """
-    # Coordinates for countries (lat, lng)
-    country_coords = {
-        # Asia
-        "India": {"lat": 20.5937, "lng": 78.9629},
-        "China": {"lat": 35.8617, "lng": 104.1954},
-        "Pakistan": {"lat": 30.3753, "lng": 69.3451},
-        "Bangladesh": {"lat": 23.685, "lng": 90.3563},
-        "Nepal": {"lat": 28.3949, "lng": 84.124},
-        "Sri Lanka": {"lat": 7.8731, "lng": 80.7718},
-        "Myanmar": {"lat": 21.9162, "lng": 95.956},
-        "Thailand": {"lat": 15.87, "lng": 100.9925},
-        "Vietnam": {"lat": 14.0583, "lng": 108.2772},
-        "Indonesia": {"lat": -0.7893, "lng": 113.9213},
-        "Malaysia": {"lat": 4.2105, "lng": 101.9758},
-        "Philippines": {"lat": 12.8797, "lng": 121.774},
-        "Japan": {"lat": 36.2048, "lng": 138.2529},
-        "South Korea": {"lat": 35.9078, "lng": 127.7669},
-        "North Korea": {"lat": 40.3399, "lng": 127.5101},
-        "Taiwan": {"lat": 23.6978, "lng": 120.9605},
-        "Singapore": {"lat": 1.3521, "lng": 103.8198},
-        "Afghanistan": {"lat": 33.9391, "lng": 67.71},
-        # Middle East
-        "Iran": {"lat": 32.4279, "lng": 53.688},
-        "Iraq": {"lat": 33.2232, "lng": 43.6793},
-        "Syria": {"lat": 34.8021, "lng": 38.9968},
-        "Israel": {"lat": 31.0461, "lng": 34.8516},
-        "Palestine": {"lat": 31.9522, "lng": 35.2332},
-        "Saudi Arabia": {"lat": 23.8859, "lng": 45.0792},
-        "UAE": {"lat": 23.4241, "lng": 53.8478},
-        "Turkey": {"lat": 38.9637, "lng": 35.2433},
-        "Yemen": {"lat": 15.5527, "lng": 48.5164},
-        "Lebanon": {"lat": 33.8547, "lng": 35.8623},
-        "Jordan": {"lat": 30.5852, "lng": 36.2384},
-        "Qatar": {"lat": 25.3548, "lng": 51.1839},
-        "Kuwait": {"lat": 29.3117, "lng": 47.4818},
-        "Oman": {"lat": 21.4735, "lng": 55.9754},
-        "Bahrain": {"lat": 26.0667, "lng": 50.5577},
-        # Europe
-        "Russia": {"lat": 61.524, "lng": 105.3188},
-        "Ukraine": {"lat": 48.3794, "lng": 31.1656},
-        "United Kingdom": {"lat": 55.3781, "lng": -3.436},
-        "UK": {"lat": 55.3781, "lng": -3.436},
-        "Germany": {"lat": 51.1657, "lng": 10.4515},
-        "France": {"lat": 46.2276, "lng": 2.2137},
-        "Italy": {"lat": 41.8719, "lng": 12.5674},
-        "Poland": {"lat": 51.9194, "lng": 19.1451},
-        "Spain": {"lat": 40.4637, "lng": -3.7492},
-        "Netherlands": {"lat": 52.1326, "lng": 5.2913},
-        "Belgium": {"lat": 50.5039, "lng": 4.4699},
-        "Sweden": {"lat": 60.1282, "lng": 18.6435},
-        "Norway": {"lat": 60.472, "lng": 8.4689},
-        "Finland": {"lat": 61.9241, "lng": 25.7482},
-        "Greece": {"lat": 39.0742, "lng": 21.8243},
-        "Serbia": {"lat": 44.0165, "lng": 21.0059},
-        "Hungary": {"lat": 47.1625, "lng": 19.5033},
-        "Romania": {"lat": 45.9432, "lng": 24.9668},
-        "Belarus": {"lat": 53.7098, "lng": 27.9534},
-        # Americas
-        "United States": {"lat": 37.0902, "lng": -95.7129},
-        "USA": {"lat": 37.0902, "lng": -95.7129},
-        "US": {"lat": 37.0902, "lng": -95.7129},
-        "Canada": {"lat": 56.1304, "lng": -106.3468},
-        "Mexico": {"lat": 23.6345, "lng": -102.5528},
-        "Brazil": {"lat": -14.235, "lng": -51.9253},
-        "Argentina": {"lat": -38.4161, "lng": -63.6167},
-        "Colombia": {"lat": 4.5709, "lng": -74.2973},
-        "Venezuela": {"lat": 6.4238, "lng": -66.5897},
-        "Chile": {"lat": -35.6751, "lng": -71.543},
-        "Peru": {"lat": -9.19, "lng": -75.0152},
-        "Cuba": {"lat": 21.5218, "lng": -77.7812},
-        # Africa
-        "Egypt": {"lat": 26.8206, "lng": 30.8025},
-        "South Africa": {"lat": -30.5595, "lng": 22.9375},
-        "Nigeria": {"lat": 9.082, "lng": 8.6753},
-        "Kenya": {"lat": -0.0236, "lng": 37.9062},
-        "Ethiopia": {"lat": 9.145, "lng": 40.4897},
-        "Sudan": {"lat": 12.8628, "lng": 30.2176},
-        "Libya": {"lat": 26.3351, "lng": 17.2283},
-        "Morocco": {"lat": 31.7917, "lng": -7.0926},
-        "Algeria": {"lat": 28.0339, "lng": 1.6596},
-        "Tunisia": {"lat": 33.8869, "lng": 9.5375},
-        # Central Asia
-        "Kazakhstan": {"lat": 48.0196, "lng": 66.9237},
-        "Uzbekistan": {"lat": 41.3775, "lng": 64.5853},
-        "Turkmenistan": {"lat": 38.9697, "lng": 59.5563},
-        "Tajikistan": {"lat": 38.861, "lng": 71.2761},
-        "Kyrgyzstan": {"lat": 41.2044, "lng": 74.7661},
-        # Oceania
-        "Australia": {"lat": -25.2744, "lng": 133.7751},
-        "New Zealand": {"lat": -40.9006, "lng": 174.886},
-    }
-
-    # Get country stats with high relevance count
+    # Per-country counts come from mv_country_hotspots (refreshed by the
+    # refresh_country_hotspots beat task); alias keys are folded into their
+    # canonical country here
+    coords = country_coords_table
+    view = country_hotspots_view
+    total = func.sum(view.c.total)
     results = db.query(
-        Article.country,
-        func.count(Article.id).label("total"),
-        func.sum(
-            func.cast(Article.relevance_level == RelevanceLevel.HIGH, Integer)
-        ).label("high_count")
-    ).filter(
-        Article.country.isnot(None),
-        Article.country != "",
-        Article.is_processed == 1
-    ).group_by(Article.country).order_by(
-        desc(func.count(Article.id))
-    ).limit(limit).all()
-
-    hotspots = []
-    for r in results:
-        country_name = r.country.strip() if r.country else ""
-        if not country_name:
-            continue
-
-        # Try to find coordinates
-        coords = country_coords.get(country_name)
-        if not coords:
-            # Try partial match
-            for key in country_coords:
-                if key.lower() in country_name.lower() or country_name.lower() in key.lower():
-                    coords = country_coords[key]
-                    break
-
-        if coords:
-            intensity = min((r.high_count or 0) / 5, 1.0)  # Normalize intensity
-            hotspots.append({
-                "country": country_name,
-                "lat": coords["lat"],
-                "lng": coords["lng"],
-                "total_articles": r.total,
-                "high_relevance": r.high_count or 0,
-                "intensity": round(intensity, 2)
-            })
-
-    return sorted(hotspots, key=lambda x: x["total_articles"], reverse=True)
+        coords.c.canonical.label("country"),
+        coords.c.lat,
+        coords.c.lng,
+        total.label("total"),
+        func.sum(view.c.high_count).label("high_count"),
+        # Window runs before LIMIT, so this is the share across all mapped countries
+        (total * 1.0 / func.sum(total).over()).label("share")
+    ).select_from(view).join(
+        coords, view.c.country_key == coords.c.name
+    ).group_by(
+        coords.c.canonical, coords.c.lat, coords.c.lng
+    ).order_by(desc("total")).limit(limit).all()
+
+    columns = ("country", "lat", "lng", "total_articles", "high_relevance", "intensity", "share")
+    rows = [
+        [
+            r.country,
+            r.lat,
+            r.lng,
+            # SUM over bigint comes back as Decimal
+            int(r.total),
+            int(r.high_count),
+            round(min(int(r.high_count) / 5, 1.0), 2),  # Normalize intensity
+            round(float(r.share), 4)
+        ]
+        for r in results
+    ]
+    return _rows_payload(columns, rows, columnar)
 
 
 @router.get("/recent-high-impact")
-async def get_recent_high_impact(limit: int = 5, db: Session = Depends(get_db)):
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:recent_high_impact", ttl=30)
+def get_recent_high_impact(limit: int = 5, db: Session = Depends(get_db)):
     """Get most recent high-impact articles for dashboard display"""
-    articles = db.query(Article).filter(
+    # Join the source name in the same query instead of one lookup per article
+    rows = db.query(
+        Article.id,
+        Article.title,
+        Source.name.label("source_name"),
+        Article.region,
+        Article.theme,
+        Article.relevance_score,
+        Article.published_at,
+        Article.summary_what_happened
+    ).outerjoin(
+        Source, Source.id == Article.source_id
+    ).filter(
         Article.relevance_level == RelevanceLevel.HIGH,
         Article.is_processed == 1
     ).order_by(desc(Article.published_at)).limit(limit).all()
 
-    results = []
-    for article in articles:
-        source = db.query(Source).filter(Source.id == article.source_id).first()
-        results.append({
-            "id": article.id,
-            "title": article.title,
-            "source": source.name if source else "Unknown",
-            "region": article.region,
-            "theme": article.theme,
-            "relevance_score": article.relevance_score,
-            "published_at": article.published_at,
-            "summary": article.summary_what_happened
-        })
+    results = [
+        {
+            "id": r.id,
+            "title": r.title,
+            "source": r.source_name or "Unknown",
+            "region": r.region,
+            "theme": r.theme,
+            "relevance_score": r.relevance_score,
+            "published_at": r.published_at,
+            "summary": r.summary_what_happened
+        }
+        for r in rows
+    ]
 
     return results
 
 
-# Import Integer for type casting
-from sqlalchemy import Integer
+
+@router.get("/bundle")
+@cached(prefix=f"{DASHBOARD_CACHE_PREFIX}:bundle", ttl=30)
+def get_dashboard_bundle(days: int = 7, recent_limit: int = 5, db: Session = Depends(get_db)):
+    """
+    Everything the dashboard page loads, in one request and one pooled connection.
+    Calls the handlers' uncached bodies (__wrapped__) so the payload matches the
+    individual endpoints.
+    """
+    return {
+        "stats": get_dashboard_stats.__wrapped__(db=db),
+        "trends": get_trends.__wrapped__(days=days, db=db),
+        "regions": get_region_stats.__wrapped__(db=db),
+        "recent_high_impact": get_recent_high_impact.__wrapped__(limit=recent_limit, db=db)
+    }
@@ -1,22 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from typing import List
 
 from app.database import get_db
 from app.models.source import Source, SourceType, SourceCategory
-from app.models.article import Article
 from app.models.user import User, UserRole
-from app.schemas.source import SourceCreate, SourceUpdate, SourceResponse
+from app.schemas.source import SourceCreate, SourceUpdate, SourceResponse, SourceResponseList
 from app.services.news_fetcher import seed_default_sources
-from app.api.auth import decode_token
+from app.api.auth import decode_token, get_token_user
 
 router = APIRouter()
 security = HTTPBearer(auto_error=False)
 
-
-async def require_admin(
+def require_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -34,8 +33,7 @@ async def require_admin(
             detail="Invalid or expired token"
         )
 
-    username = payload.get("sub")
-    user = db.query(User).filter(User.username == username).first()
+    user = get_token_user(credentials.credentials, payload, db)
 
     if not user:
         raise HTTPException(
@@ -53,76 +51,34 @@ async def require_admin(
 
 
 @router.get("/", response_model=List[SourceResponse])
-async def get_sources(db: Session = Depends(get_db)):
-    """Get all news sources"""
-    sources = db.query(Source).order_by(Source.name).all()
-
-    responses = []
-    for source in sources:
-        article_count = db.query(Article).filter(
-            Article.source_id == source.id
-        ).count()
-
-        responses.append(SourceResponse(
-            id=source.id,
-            name=source.name,
-            url=source.url,
-            feed_url=source.feed_url,
-            source_type=source.source_type,
-            category=source.category,
-            country=source.country,
-            language=source.language,
-            description=source.description,
-            reliability_score=source.reliability_score,
-            bias_rating=source.bias_rating,
-            is_active=source.is_active,
-            fetch_interval_minutes=source.fetch_interval_minutes,
-            last_fetched_at=source.last_fetched_at,
-            last_fetch_status=source.last_fetch_status,
-            article_count=article_count,
-            created_at=source.created_at,
-            updated_at=source.updated_at
-        ))
-
-    return responses
+def get_sources(
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Get news sources (paginated)"""
+    # article_count is kept on the row by trg_source_article_count, no join needed
+    sources = db.query(Source).order_by(
+        Source.name, Source.id
+    ).limit(limit).offset(offset).all()
+    return ORJSONResponse(SourceResponseList.dump_python([
+        SourceResponse.from_source(source) for source in sources
+    ]))
 
 
 @router.get("/{source_id}", response_model=SourceResponse)
-async def get_source(source_id: int, db: Session = Depends(get_db)):
+def get_source(source_id: int, db: Session = Depends(get_db)):
     """Get a single source by ID"""
     source = db.query(Source).filter(Source.id == source_id).first()
 
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    article_count = db.query(Article).filter(
-        Article.source_id == source.id
-    ).count()
-
-    return SourceResponse(
-        id=source.id,
-        name=source.name,
-        url=source.url,
-        feed_url=source.feed_url,
-        source_type=source.source_type,
-        category=source.category,
-        country=source.country,
-        language=source.language,
-        description=source.description,
-        reliability_score=source.reliability_score,
-        bias_rating=source.bias_rating,
-        is_active=source.is_active,
-        fetch_interval_minutes=source.fetch_interval_minutes,
-        last_fetched_at=source.last_fetched_at,
-        last_fetch_status=source.last_fetch_status,
-        article_count=article_count,
-        created_at=source.created_at,
-        updated_at=source.updated_at
-    )
+    return ORJSONResponse(SourceResponse.from_source(source).model_dump())
 
 
 @router.post("/", response_model=SourceResponse)
-async def create_source(
+def create_source(
     source_data: SourceCreate,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
@@ -152,30 +108,11 @@ async def create_source(
     db.commit()
     db.refresh(source)
 
-    return SourceResponse(
-        id=source.id,
-        name=source.name,
-        url=source.url,
-        feed_url=source.feed_url,
-        source_type=source.source_type,
-        category=source.category,
-        country=source.country,
-        language=source.language,
-        description=source.description,
-        reliability_score=source.reliability_score,
-        bias_rating=source.bias_rating,
-        is_active=source.is_active,
-        fetch_interval_minutes=source.fetch_interval_minutes,
-        last_fetched_at=source.last_fetched_at,
-        last_fetch_status=source.last_fetch_status,
-        article_count=0,
-        created_at=source.created_at,
-        updated_at=source.updated_at
-    )
+    return ORJSONResponse(SourceResponse.from_source(source).model_dump())
 
 
 @router.put("/{source_id}", response_model=SourceResponse)
-async def update_source(
+def update_source(
     source_id: int,
     source_data: SourceUpdate,
     db: Session = Depends(get_db),
@@ -200,34 +137,11 @@ async def update_source(
     db.commit()
     db.refresh(source)
 
-    article_count = db.query(Article).filter(
-        Article.source_id == source.id
-    ).count()
-
-    return SourceResponse(
-        id=source.id,
-        name=source.name,
-        url=source.url,
-        feed_url=source.feed_url,
-        source_type=source.source_type,
-        category=source.category,
-        country=source.country,
-        language=source.language,
-        description=source.description,
-        reliability_score=source.reliability_score,
-        bias_rating=source.bias_rating,
-        is_active=source.is_active,
-        fetch_interval_minutes=source.fetch_interval_minutes,
-        last_fetched_at=source.last_fetched_at,
-        last_fetch_status=source.last_fetch_status,
-        article_count=article_count,
-        created_at=source.created_at,
-        updated_at=source.updated_at
-    )
+    return ORJSONResponse(SourceResponse.from_source(source).model_dump())
 
 
 @router.delete("/{source_id}")
-async def delete_source(
+def delete_source(
     source_id: int,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
@@ -245,7 +159,7 @@ async def delete_source(
 
 
 @router.post("/seed-defaults")
-async def seed_defaults(
+def seed_defaults(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
@@ -255,7 +169,7 @@ async def seed_defaults(
 
 
 @router.post("/{source_id}/toggle")
-async def toggle_source(
+def toggle_source(
     source_id: int,
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
@@ -273,7 +187,7 @@ async def toggle_source(
 
 
 @router.post("/seed-additional")
-async def seed_additional_sources(
+def seed_additional_sources(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
@@ -284,7 +198,7 @@ async def seed_additional_sources(
 
 
 @router.post("/fetch-all")
-async def fetch_all_news(
+def fetch_all_news(
     db: Session = Depends(get_db),
     admin: User = Depends(require_admin)
 ):
@@ -304,13 +218,14 @@ async def fetch_rss_sync(
     from app.services.news_fetcher import NewsFetcher, seed_default_sources
     from app.models.source import Source
 
-    # Ensure default sources exist
-    source_count = db.query(Source).count()
-    if source_count == 0:
-        seed_default_sources(db)
+    def fetch():
+        # Ensure default sources exist
+        if db.query(Source.id).limit(1).first() is None:
+            seed_default_sources(db)
+        return NewsFetcher(db).fetch_all_sources()
 
-    fetcher = NewsFetcher(db)
-    results = fetcher.fetch_all_sources()
+    # HTTP + DB work blocks, so run it in the threadpool instead of on the event loop
+    results = await run_in_threadpool(fetch)
     total = sum(results.values())
     return {"message": f"Fetched {total} articles", "by_source": results}
 
@@ -323,7 +238,7 @@ async def fetch_gdelt_news(
     """Fetch news from GDELT (Admin only)"""
     from app.services.news_api_fetcher import GDELTFetcher
     fetcher = GDELTFetcher()
-    count = fetcher.fetch_strategic_news(db)
+    count = await run_in_threadpool(fetcher.fetch_strategic_news, db)
     return {"message": f"Fetched {count} articles from GDELT"}
 
 
@@ -340,7 +255,7 @@ async def fetch_newsapi_news(
         raise HTTPException(status_code=400, detail="NewsAPI key not configured")
 
     fetcher = NewsAPIFetcher(settings.newsapi_key)
-    count = fetcher.fetch_strategic_news(db)
+    count = await run_in_threadpool(fetcher.fetch_strategic_news, db)
     return {"message": f"Fetched {count} articles from NewsAPI"}
 
 
@@ -357,189 +272,70 @@ async def fetch_twitter_news(
         raise HTTPException(status_code=400, detail="Twitter bearer token not configured")
 
     fetcher = TwitterFetcher(settings.twitter_bearer_token)
-    results = fetcher.fetch_strategic_tweets(db)
+    results = await run_in_threadpool(fetcher.fetch_strategic_tweets, db)
     total = sum(results.values())
     return {"message": f"Fetched {total} tweets", "by_account": results}
 
 
 @router.post("/cleanup-irrelevant")
-async def cleanup_irrelevant_articles(
-    db: Session = Depends(get_db),
+def cleanup_irrelevant_articles(
     admin: User = Depends(require_admin)
 ):
-    """Remove irrelevant articles (Admin only)"""
-    from app.services.relevance_filter import is_relevant_article
-
-    articles = db.query(Article).all()
-    deleted_count = 0
-    kept_count = 0
-
-    for article in articles:
-        is_relevant, reason = is_relevant_article(article.title, article.original_content)
-        if not is_relevant:
-            db.delete(article)
-            deleted_count += 1
-        else:
-            kept_count += 1
-
-    db.commit()
-    return {
-        "message": f"Cleanup complete",
-        "deleted": deleted_count,
-        "kept": kept_count
-    }
+    """Queue removal of irrelevant articles (Admin only)"""
+    from app.tasks.maintenance import cleanup_irrelevant_articles as cleanup_task
+    task = cleanup_task.delay()
+    return {"message": "Cleanup task started", "task_id": str(task.id)}
 
 
 @router.post("/cleanup-duplicates")
-async def cleanup_duplicate_articles(
-    db: Session = Depends(get_db),
+def cleanup_duplicate_articles(
     admin: User = Depends(require_admin)
 ):
-    """Remove duplicate articles (Admin only)"""
-    from app.services.news_fetcher import titles_are_similar
-
-    articles = db.query(Article).order_by(Article.created_at.asc()).all()
-    seen_titles = []
-    deleted_count = 0
-    kept_count = 0
-
-    for article in articles:
-        is_duplicate = False
-        for seen_title in seen_titles:
-            if titles_are_similar(article.title, seen_title):
-                is_duplicate = True
-                break
-
-        if is_duplicate:
-            db.delete(article)
-            deleted_count += 1
-        else:
-            seen_titles.append(article.title)
-            kept_count += 1
-
-    db.commit()
-    return {
-        "message": f"Duplicate cleanup complete",
-        "deleted": deleted_count,
-        "kept": kept_count
-    }
+    """Queue removal of duplicate articles (Admin only)"""
+    from app.tasks.maintenance import cleanup_duplicate_articles as cleanup_task
+    task = cleanup_task.delay()
+    return {"message": "Duplicate cleanup task started", "task_id": str(task.id)}
 
 
 @router.post("/reprocess-scores")
-async def reprocess_article_scores(
-    db: Session = Depends(get_db),
+def reprocess_article_scores(
     admin: User = Depends(require_admin)
 ):
-    """Recalculate relevance scores (Admin only)"""
-    from app.services.relevance_scorer import get_relevance_scorer
-    from app.models.article import RelevanceLevel
-
-    scorer = get_relevance_scorer()
-    articles = db.query(Article).all()
-    updated_count = 0
-
-    for article in articles:
-        # Recalculate scores
-        scores = scorer.calculate_scores(
-            article.title,
-            article.original_content or ""
-        )
-
-        article.geo_score = scores["geo_score"]
-        article.military_score = scores["military_score"]
-        article.diplomatic_score = scores["diplomatic_score"]
-        article.economic_score = scores["economic_score"]
-        article.relevance_score = scores["relevance_score"]
-        article.relevance_level = RelevanceLevel(scores["relevance_level"])
-
-        # Update region/theme if empty
-        if not article.region or not article.theme:
-            classification = scorer.extract_region_theme(
-                article.title,
-                article.original_content or ""
-            )
-            if not article.region:
-                article.region = classification.get("region")
-            if not article.country:
-                article.country = classification.get("country")
-            if not article.theme:
-                article.theme = classification.get("theme")
-            if not article.domain:
-                article.domain = classification.get("domain")
-
-        updated_count += 1
-
-    db.commit()
-    return {
-        "message": f"Reprocessed {updated_count} articles with keyword scoring"
-    }
+    """Queue recalculation of relevance scores (Admin only)"""
+    from app.tasks.maintenance import reprocess_article_scores as reprocess_task
+    task = reprocess_task.delay()
+    return {"message": "Reprocess task started", "task_id": str(task.id)}
 
 
 @router.post("/reprocess-llm")
-async def reprocess_with_llm(
-    db: Session = Depends(get_db),
+def reprocess_with_llm(
     limit: int = 50,
     admin: User = Depends(require_admin)
 ):
-    """Reprocess articles using LLM scoring (Admin only)"""
-    from app.services.llm_scorer import get_llm_scorer
-    from app.services.relevance_scorer import get_relevance_scorer
-    from app.models.article import RelevanceLevel
+    """Queue LLM rescoring of the lowest-scored articles (Admin only)"""
+    from app.tasks.maintenance import reprocess_with_llm as reprocess_task
     from app.config import settings
 
     if not settings.groq_api_key:
         raise HTTPException(status_code=400, detail="Groq API key not configured")
 
-    llm_scorer = get_llm_scorer()
-    keyword_scorer = get_relevance_scorer()
-
-    # Get articles to reprocess (prioritize unprocessed or low-scored)
-    articles = db.query(Article).order_by(
-        Article.relevance_score.asc()
-    ).limit(limit).all()
-
-    updated_count = 0
-    high_count = 0
-    errors = []
-
-    for article in articles:
-        try:
-            content = article.original_content or ""
+    task = reprocess_task.delay(limit=limit)
+    return {"message": "LLM reprocess task started", "task_id": str(task.id)}
 
-            # Use LLM for scoring
-            result = llm_scorer.score_article(article.title, content)
 
-            article.relevance_score = result["relevance_score"]
-            article.relevance_level = RelevanceLevel(result["relevance_level"])
-
-            # Update classification
-            classification = result.get("classification", {})
-            article.region = classification.get("region", article.region)
-            article.country = classification.get("country", article.country)
-            article.theme = classification.get("theme", article.theme)
-            article.domain = classification.get("domain", article.domain)
-
-            # Update keyword scores for display
-            keyword_scores = keyword_scorer.calculate_scores(article.title, content)
-            article.geo_score = keyword_scores["geo_score"]
-            article.military_score = keyword_scores["military_score"]
-            article.diplomatic_score = keyword_scores["diplomatic_score"]
-            article.economic_score = keyword_scores["economic_score"]
-
-            if result["relevance_level"] == "high":
-                high_count += 1
-
-            updated_count += 1
-
-        except Exception as e:
-            errors.append(f"Article {article.id}: {str(e)[:100]}")
-            continue
-
-    db.commit()
+@router.get("/tasks/{task_id}")
+def get_task_status(
+    task_id: str,
+    admin: User = Depends(require_admin)
+):
+    """Poll a background task started by one of the admin endpoints (Admin only)"""
+    from celery.result import AsyncResult
+    from app.celery_app import celery_app
 
+    result = AsyncResult(task_id, app=celery_app)
     return {
-        "message": f"LLM reprocessed {updated_count} articles",
-        "high_relevance": high_count,
-        "errors": len(errors),
-        "error_details": errors[:5] if errors else []
+        "task_id": task_id,
+        "status": result.status,
+        "result": result.result if result.successful() else None,
+        "error": str(result.result) if result.failed() else None
     }
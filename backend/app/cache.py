@@ -0,0 +1,80 @@
+import functools
+import logging
+from typing import Optional
+
+import orjson
+import redis
+from fastapi.responses import Response
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_CACHE_PREFIX = "dash"
+ARTICLES_CACHE_PREFIX = "articles"
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Shared Redis client (connections are pooled and opened lazily)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.redis_url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _client
+
+
+def _cache_key(prefix: str, params: dict) -> str:
+    # Built from the query params rather than hash() so keys match across workers
+    parts = [f"{name}={value}" for name, value in sorted(params.items()) if name != "db"]
+    return ":".join([prefix, *parts])
+
+
+def cached(prefix: str, ttl: int):
+    """
+    Read-through Redis cache for sync GET handlers (run in FastAPI's threadpool).
+    Results are serialized once with orjson and returned as raw JSON, on hits and
+    misses alike; Redis errors fall back to the handler, and results orjson can't
+    serialize are returned uncached for FastAPI to encode.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _cache_key(prefix, kwargs)
+            try:
+                hit = get_redis().get(key)
+                if hit is not None:
+                    return Response(content=hit, media_type="application/json")
+            except redis.RedisError as e:
+                logger.warning(f"Cache read failed for {key}: {e}")
+
+            result = func(*args, **kwargs)
+            try:
+                body = orjson.dumps(result)
+            except orjson.JSONEncodeError as e:
+                logger.warning(f"Not caching {key}: {e}")
+                return result
+
+            try:
+                get_redis().setex(key, ttl, body)
+            except redis.RedisError as e:
+                logger.warning(f"Cache write failed for {key}: {e}")
+            return Response(content=body, media_type="application/json")
+        return wrapper
+    return decorator
+
+
+def invalidate_response_cache():
+    """Drop all cached dashboard and article-list responses, e.g. after articles are ingested or processed"""
+    try:
+        client = get_redis()
+        for prefix in (DASHBOARD_CACHE_PREFIX, ARTICLES_CACHE_PREFIX):
+            keys = list(client.scan_iter(match=f"{prefix}:*", count=500))
+            if keys:
+                client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Could not invalidate response cache: {e}")
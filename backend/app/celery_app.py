@@ -8,7 +8,8 @@ celery_app = Celery(
     backend=settings.redis_url,
     include=[
         "app.tasks.fetch_news",
-        "app.tasks.process_articles"
+        "app.tasks.process_articles",
+        "app.tasks.maintenance"
     ]
 )
 
@@ -23,6 +24,16 @@ celery_app.conf.update(
     task_time_limit=600,  # 10 minutes max per task
     worker_prefetch_multiplier=1,
     worker_concurrency=2,
+    # Feed/API fetching is network-bound and runs on a gevent worker ("io");
+    # scoring, summarizing and maintenance stay on the prefork worker ("cpu")
+    task_default_queue="cpu",
+    task_routes={
+        "app.tasks.fetch_news.*": {"queue": "io"},
+        "app.tasks.process_articles.*": {"queue": "cpu"},
+        "app.tasks.maintenance.*": {"queue": "cpu"},
+    },
+    broker_pool_limit=100,
+    redis_max_connections=100,
 )
 
 # Scheduled tasks (beat schedule)
@@ -37,6 +48,12 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.process_articles.process_pending_articles",
         "schedule": crontab(minute="*/5"),
     },
+    # Refresh the country hotspots view once per processing cycle, offset so
+    # it runs after that cycle's processing run
+    "refresh-country-hotspots-periodic": {
+        "task": "app.tasks.maintenance.refresh_country_hotspots",
+        "schedule": crontab(minute="3-59/5"),
+    },
     # Fetch from GDELT every 2 hours (free, unlimited)
     "fetch-gdelt-periodic": {
         "task": "app.tasks.fetch_news.fetch_gdelt_news",
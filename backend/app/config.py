@@ -1,5 +1,5 @@
-from pydantic_settings import BaseSettings
-from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache, cached_property
 from typing import List, Optional
 from urllib.parse import quote_plus
 
@@ -15,14 +15,25 @@ class Settings(BaseSettings):
     # Legacy support - will be overridden by individual components if set
     database_url: Optional[str] = None
 
-    @property
+    # Connection pool (per process: each uvicorn/celery worker has its own)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Recycle before server/proxy idle timeouts close them
+    db_prepare_threshold: int = 5  # psycopg server-side prepares a statement after this many runs
+    db_statement_timeout_ms: int = 0  # Server aborts statements running longer than this (0 = no limit)
+
+    @cached_property
     def get_database_url(self) -> str:
         """Build database URL from components, properly escaping password"""
         if self.database_url and "db_host" not in str(self.database_url):
+            # Plain postgresql:// URLs would select psycopg2; use the psycopg (v3) driver
+            if self.database_url.startswith("postgresql://"):
+                return "postgresql+psycopg://" + self.database_url[len("postgresql://"):]
             return self.database_url
         # URL-encode the password to handle special characters
         encoded_password = quote_plus(self.db_password)
-        return f"postgresql://{self.db_user}:{encoded_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        return f"postgresql+psycopg://{self.db_user}:{encoded_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -33,10 +44,16 @@ class Settings(BaseSettings):
     llm_model: str = "llama-3.1-8b-instant"  # Smaller model for scoring (less tokens)
     llm_model_large: str = "llama-3.3-70b-versatile"  # Larger model for summaries
     ollama_base_url: str = "http://localhost:11434"  # For future Ollama support
+    llm_max_concurrency: int = 8  # Parallel LLM calls in bulk rescoring (bounded by Groq rate limits)
+    llm_batch_size: int = 6  # Articles analyzed per LLM call in the processing task
+    llm_cache_ttl_hours: int = 168  # How long LLM responses are cached in Redis (0 disables)
+    analysis_reuse_similarity: float = 0.8  # Title similarity at which a near-duplicate's analysis is reused (0 disables)
 
     # Application
     secret_key: str = "your-secret-key-change-in-production"
+    bcrypt_rounds: int = 12  # Password hashing cost; lower (e.g. 4) only for tests/dev
     debug: bool = True
+    sql_raiseload: bool = False  # Raise on lazy relationship loads (catches N+1 regressions)
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
 
     # News Fetching
@@ -54,13 +71,11 @@ class Settings(BaseSettings):
     diplomatic_weight: float = 0.20
     economic_weight: float = 0.15
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 @lru_cache()
@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, configure_mappers
 from app.config import settings
 import logging
 
@@ -9,14 +9,28 @@ logger = logging.getLogger(__name__)
 engine = create_engine(
     settings.get_database_url,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    connect_args={
+        "prepare_threshold": settings.db_prepare_threshold,
+        # JIT compilation only adds latency to the short queries this app runs
+        "options": f"-c jit=off -c statement_timeout={settings.db_statement_timeout_ms}"
+    }
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Default relationship loading: raise when SQL_RAISELOAD is set so any implicit
+# lazy load fails loudly, plain lazy select otherwise so a missed eager load
+# costs a query instead of a 500 and nothing is loaded that isn't read.
+# Deliberately not tied to DEBUG, which the shipped compose file enables.
+# Queries that need a relationship eager-load it explicitly.
+RELATIONSHIP_LAZY = "raise" if settings.sql_raiseload else "select"
+
 
 def get_db():
     """Dependency to get database session"""
@@ -27,42 +41,9 @@ def get_db():
         db.close()
 
 
-def run_migrations():
-    """Run database migrations for new columns"""
-    migrations = [
-        # Add is_priority column to articles table
-        {
-            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='articles' AND column_name='is_priority'",
-            "migrate": "ALTER TABLE articles ADD COLUMN is_priority BOOLEAN DEFAULT FALSE",
-            "description": "Add is_priority column to articles"
-        },
-        # Add summary_bullets column to articles table
-        {
-            "check": "SELECT column_name FROM information_schema.columns WHERE table_name='articles' AND column_name='summary_bullets'",
-            "migrate": "ALTER TABLE articles ADD COLUMN summary_bullets TEXT",
-            "description": "Add summary_bullets column to articles"
-        },
-    ]
-
-    with engine.connect() as conn:
-        for migration in migrations:
-            try:
-                # Check if migration is needed
-                result = conn.execute(text(migration["check"]))
-                if result.fetchone() is None:
-                    # Run migration
-                    conn.execute(text(migration["migrate"]))
-                    conn.commit()
-                    logger.info(f"Migration completed: {migration['description']}")
-                else:
-                    logger.debug(f"Migration not needed: {migration['description']}")
-            except Exception as e:
-                logger.error(f"Migration failed: {migration['description']} - {e}")
-
-
 def init_db():
-    """Initialize database tables"""
-    from app.models import article, source, alert, user  # noqa
-    Base.metadata.create_all(bind=engine)
-    # Run migrations for new columns
-    run_migrations()
+    """Load and configure the ORM models. The schema itself is owned by Alembic
+    (migrations/, applied with `alembic upgrade head`), so no tables are created here"""
+    from app.models import article, article_entity, source, alert, user  # noqa
+    # Resolve all relationships now so mapper errors surface at startup, not on first query
+    configure_mappers()
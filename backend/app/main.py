@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 
@@ -20,7 +21,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan events"""
     logger.info("Starting Geopolitical News Aggregator...")
     init_db()
-    logger.info("Database initialized")
+    logger.info("ORM models configured")
 
     # Trigger initial news fetch on startup
     try:
@@ -41,7 +42,8 @@ app = FastAPI(
     title="Geopolitical News Aggregator API",
     description="AI-powered strategic news aggregation and analysis platform",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -1,6 +1,21 @@
+"""
+ORM models.
+
+Relationship loading: all relationships (Article.source, Alert.user,
+Source.articles, User.alerts) use RELATIONSHIP_LAZY ("raise" when
+SQL_RAISELOAD is set, "select" otherwise).
+Queries that read a relationship eager-load it explicitly, e.g.
+.options(joinedload(Article.source)) or selectinload(User.alerts), and
+column-only queries skip relationships entirely.
+
+Enum columns are native Postgres ENUM types. Their type names are pinned to
+the ones SQLAlchemy originally generated, so renaming a Python enum class
+cannot make create_all or autogenerate expect a new type.
+"""
 from app.models.article import Article
+from app.models.article_entity import ArticleEntity
 from app.models.source import Source
 from app.models.alert import Alert
 from app.models.user import User
 
-__all__ = ["Article", "Source", "Alert", "User"]
+__all__ = ["Article", "ArticleEntity", "Source", "Alert", "User"]
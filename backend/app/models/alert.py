@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, JSON, Enum, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.database import Base
+from app.database import Base, RELATIONSHIP_LAZY
 
 
 class AlertFrequency(str, enum.Enum):
@@ -19,26 +19,26 @@ class Alert(Base):
 
     # User relationship
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    user = relationship("User", back_populates="alerts")
+    user = relationship("User", back_populates="alerts", lazy=RELATIONSHIP_LAZY)
 
     name = Column(String(255), nullable=False)
 
     # Filter criteria (all optional, combined with AND)
-    regions = Column(JSON, default=list)  # ["Indo-Pacific", "South Asia"]
-    countries = Column(JSON, default=list)  # ["China", "Pakistan"]
-    themes = Column(JSON, default=list)  # ["Great Power Competition"]
-    domains = Column(JSON, default=list)  # ["maritime", "cyber"]
-    keywords = Column(JSON, default=list)  # ["nuclear", "missile"]
-    min_relevance = Column(String(10), default="medium")  # low, medium, high
+    regions = Column(JSON, server_default=text("'[]'"))  # ["Indo-Pacific", "South Asia"]
+    countries = Column(JSON, server_default=text("'[]'"))  # ["China", "Pakistan"]
+    themes = Column(JSON, server_default=text("'[]'"))  # ["Great Power Competition"]
+    domains = Column(JSON, server_default=text("'[]'"))  # ["maritime", "cyber"]
+    keywords = Column(JSON, server_default=text("'[]'"))  # ["nuclear", "missile"]
+    min_relevance = Column(String(10), server_default=text("'medium'"))  # low, medium, high
 
     # Notification settings
-    frequency = Column(Enum(AlertFrequency), default=AlertFrequency.DAILY)
-    is_active = Column(Boolean, default=True)
-    email_enabled = Column(Boolean, default=True)
+    frequency = Column(Enum(AlertFrequency, native_enum=True, name="alertfrequency"), server_default=text("'DAILY'"))
+    is_active = Column(Boolean, server_default=text("true"))
+    email_enabled = Column(Boolean, server_default=text("true"))
 
     # Tracking
     last_triggered_at = Column(DateTime(timezone=True), nullable=True)
-    trigger_count = Column(Integer, default=0)
+    trigger_count = Column(Integer, server_default=text("0"))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
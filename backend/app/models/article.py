@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Enum, JSON, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, SmallInteger, BigInteger, String, Text, DateTime, REAL, ForeignKey, Enum, Boolean, Computed, Index, and_, literal, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import enum
-from app.database import Base
+import re
+from app.database import Base, RELATIONSHIP_LAZY
 
 
 class RelevanceLevel(str, enum.Enum):
@@ -11,47 +13,87 @@ class RelevanceLevel(str, enum.Enum):
     LOW = "low"
 
 
+# Expression behind Article.search_vec (the baseline Alembic revision inlines a copy)
+SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(original_content, ''))"
+)
+
+# Expression behind Article.url_hash (revision 0010 inlines a copy)
+URL_HASH_SQL = "hashtextextended(url, 0)"
+
+# Canonical URL: scheme and host lowercased (paths are case-sensitive), tracking
+# query parameters removed along with their trailing "&", then any "?" or "&" left
+# dangling before the fragment or end dropped, so a?utm_source=x&id=5 -> a?id=5
+URL_ORIGIN_RE = "^[^/?#]*//[^/?#]*"
+URL_TRACKING_PARAMS_RE = "(?<=[?&])(utm_[^=&#]*|fbclid|gclid)=[^&#]*&?"
+URL_DANGLING_SEPARATORS_RE = "[?&]+(#|$)"
+
+# Expression behind Article.url_canon_hash (revision 0013 inlines a copy); the
+# generated column needs immutable functions, hence coalesce/|| over concat()
+URL_CANON_HASH_SQL = (
+    "hashtextextended(regexp_replace(regexp_replace("
+    f"coalesce(lower(substring(url from '{URL_ORIGIN_RE}')), '') || "
+    f"substr(url, coalesce(length(substring(url from '{URL_ORIGIN_RE}')), 0) + 1), "
+    f"'{URL_TRACKING_PARAMS_RE}', '', 'g'), '{URL_DANGLING_SEPARATORS_RE}', '\\1'), 0)"
+)
+
+
 # India and neighboring countries - highest priority
-INDIA_NEIGHBOR_COUNTRIES = [
+INDIA_NEIGHBOR_COUNTRIES = frozenset({
     "India", "Pakistan", "China", "Bangladesh", "Nepal",
     "Sri Lanka", "Myanmar", "Afghanistan", "Maldives", "Bhutan"
-]
+})
+INDIA_NEIGHBOR_COUNTRIES_LC = frozenset(country.lower() for country in INDIA_NEIGHBOR_COUNTRIES)
 
 
 class Article(Base):
     __tablename__ = "articles"
+    # Declared here too (not only in migrations/) since it enforces URL uniqueness
+    __table_args__ = (
+        Index("ux_articles_url_hash", "url_hash", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
-    # Basic article info
+    # Basic article info. The body and the long-form summaries are deferred in the
+    # "content" group: entity queries that need them undefer_group("content")
     title = Column(String(500), nullable=False, index=True)
-    original_content = Column(Text, nullable=True)
-    url = Column(String(2000), unique=True, nullable=False)
+    original_content = deferred(Column(Text, nullable=True), group="content")
+    url = Column(String(2000), nullable=False)
+    # 64-bit hash of url. Uniqueness is enforced on this 8-byte key
+    # (ux_articles_url_hash) instead of a B-tree over the full URL; look URLs
+    # up with url_matches() so the index is used.
+    url_hash = deferred(Column(BigInteger, Computed(URL_HASH_SQL, persisted=True), nullable=False))
+    # Hash of the canonical url (see URL_CANON_HASH_SQL), so re-ingests of the same
+    # story under different tracking links match (canonical_url_matches())
+    url_canon_hash = deferred(Column(BigInteger, Computed(URL_CANON_HASH_SQL, persisted=True), nullable=False))
     published_at = Column(DateTime(timezone=True), nullable=True)
     author = Column(String(255), nullable=True)
     image_url = Column(String(2000), nullable=True)
 
     # Source relationship
     source_id = Column(Integer, ForeignKey("sources.id"), nullable=False)
-    source = relationship("Source", back_populates="articles")
+    # See app/models/__init__.py for the loading strategy
+    source = relationship("Source", back_populates="articles", lazy=RELATIONSHIP_LAZY)
 
     # AI-generated content
     summary_bullets = Column(Text, nullable=True)  # 5-line bullet point summary
-    summary_what_happened = Column(Text, nullable=True)
-    summary_why_matters = Column(Text, nullable=True)
-    summary_india_implications = Column(Text, nullable=True)
-    summary_future_developments = Column(Text, nullable=True)
-
-    # Relevance scoring
-    relevance_level = Column(Enum(RelevanceLevel), default=RelevanceLevel.LOW)
-    relevance_score = Column(Float, default=0.0)
-    geo_score = Column(Float, default=0.0)
-    military_score = Column(Float, default=0.0)
-    diplomatic_score = Column(Float, default=0.0)
-    economic_score = Column(Float, default=0.0)
+    summary_what_happened = deferred(Column(Text, nullable=True), group="content")
+    summary_why_matters = deferred(Column(Text, nullable=True), group="content")
+    summary_india_implications = deferred(Column(Text, nullable=True), group="content")
+    summary_future_developments = deferred(Column(Text, nullable=True), group="content")
+
+    # Relevance scoring. Scores are 0-1 rounded to three decimals, well within
+    # float4 (REAL) precision at half the width of float8
+    relevance_level = Column(Enum(RelevanceLevel, native_enum=True, name="relevancelevel"), server_default=text("'LOW'"))
+    relevance_score = Column(REAL, server_default=text("0"))
+    geo_score = Column(REAL, server_default=text("0"))
+    military_score = Column(REAL, server_default=text("0"))
+    diplomatic_score = Column(REAL, server_default=text("0"))
+    economic_score = Column(REAL, server_default=text("0"))
 
     # Priority flag - True for India and neighboring countries
-    is_priority = Column(Boolean, default=False, index=True)
+    is_priority = Column(Boolean, server_default=text("false"))
 
     # Classification
     region = Column(String(100), nullable=True, index=True)  # e.g., "Indo-Pacific", "South Asia"
@@ -59,11 +101,17 @@ class Article(Base):
     theme = Column(String(100), nullable=True, index=True)  # e.g., "Great Power Competition"
     domain = Column(String(50), nullable=True, index=True)  # land, maritime, air, cyber, space
 
-    # Extracted entities (JSON array)
-    entities = Column(JSON, default=list)  # [{type: "country", name: "China"}, ...]
+    # Extracted entities (JSONB array, returned as-is by the API). Mirrored row by
+    # row into article_entities for lookups by entity.
+    entities = Column(JSONB, nullable=False, server_default=text("'[]'::jsonb"))  # [{type: "country", name: "China"}, ...]
+
+    # Full-text search vector, generated and stored by Postgres.
+    # Deferred so regular article queries don't fetch it.
+    search_vec = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
 
-    # Processing status
-    is_processed = Column(Integer, default=0)  # 0: pending, 1: processed, 2: failed
+    # Processing status. Pending rows (the worker's backlog) are indexed by the
+    # partial ix_articles_pending, so polling them doesn't scan the table.
+    is_processed = Column(SmallInteger, nullable=False, server_default=text("0"))  # 0: pending, 1: processed, 2: failed
     processing_error = Column(Text, nullable=True)
 
     # Timestamps
@@ -71,4 +119,41 @@ class Article(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     def __repr__(self):
-        return f"<Article {self.id}: {self.title[:50]}...>"
+        # title may be unset on transient or partially loaded instances
+        return f"<Article {self.id}: {(self.title or '')[:50]}...>"
+
+
+def url_matches(url: str):
+    """Exact-URL filter served by ux_articles_url_hash (url is rechecked for hash collisions)"""
+    return and_(Article.url_hash == func.hashtextextended(url, 0), Article.url == url)
+
+
+def _canonical_url(url):
+    """SQL for the canonical form of url, matching URL_CANON_HASH_SQL"""
+    origin = func.substring(url, URL_ORIGIN_RE)
+    lowered = func.concat(func.lower(origin), func.substr(url, func.coalesce(func.length(origin), 0) + 1))
+    stripped = func.regexp_replace(lowered, URL_TRACKING_PARAMS_RE, "", "g")
+    return func.regexp_replace(stripped, URL_DANGLING_SEPARATORS_RE, "\\1")
+
+
+def canonical_url(url: str) -> str:
+    """Canonical form of url in Python, matching URL_CANON_HASH_SQL"""
+    origin = re.match(URL_ORIGIN_RE, url)
+    if origin:
+        url = origin.group().lower() + url[origin.end():]
+    url = re.sub(URL_TRACKING_PARAMS_RE, "", url)
+    return re.sub(URL_DANGLING_SEPARATORS_RE, r"\1", url, count=1)
+
+
+def canonical_url_matches(url):
+    """
+    Same-URL-ignoring-tracking-params filter served by ix_articles_url_canon_hash.
+    url is a string or a SQL expression (canonical URLs are rechecked for hash collisions).
+    """
+    if isinstance(url, str):
+        url = literal(url, String)
+    canonical = _canonical_url(url)
+    return and_(
+        Article.url_canon_hash == func.hashtextextended(canonical, 0),
+        _canonical_url(Article.url) == canonical
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.database import Base
+
+
+class ArticleEntity(Base):
+    """
+    One row per distinct entity of an article, mirroring Article.entities.
+    Maintained by the trg_article_entities trigger on articles (see migrations/),
+    so it is read-only from the application. Indexed on (name, type) for
+    "articles mentioning X" lookups.
+    """
+    __tablename__ = "article_entities"
+
+    article_id = Column(Integer, ForeignKey("articles.id", ondelete="CASCADE"), primary_key=True)
+    type = Column(String(20), primary_key=True)
+    name = Column(String(200), primary_key=True)
+
+    def __repr__(self):
+        return f"<ArticleEntity {self.article_id}: {self.type} {self.name}>"
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.database import Base
+from app.database import Base, RELATIONSHIP_LAZY
 
 
 class SourceType(str, enum.Enum):
@@ -28,26 +28,31 @@ class Source(Base):
     url = Column(String(2000), nullable=False)
     feed_url = Column(String(2000), nullable=True)  # RSS feed URL if applicable
 
-    source_type = Column(Enum(SourceType), default=SourceType.RSS)
-    category = Column(Enum(SourceCategory), default=SourceCategory.NEWS_AGENCY)
+    source_type = Column(Enum(SourceType, native_enum=True, name="sourcetype"), server_default=text("'RSS'"))
+    category = Column(Enum(SourceCategory, native_enum=True, name="sourcecategory"), server_default=text("'NEWS_AGENCY'"))
 
     # Source metadata
     country = Column(String(100), nullable=True)
-    language = Column(String(10), default="en")
+    language = Column(String(10), server_default=text("'en'"))
     description = Column(String(1000), nullable=True)
 
     # Reliability and bias
-    reliability_score = Column(Integer, default=5)  # 1-10 scale
+    reliability_score = Column(Integer, server_default=text("5"))  # 1-10 scale
     bias_rating = Column(String(50), nullable=True)  # e.g., "center", "left-leaning"
 
     # Fetching configuration
-    is_active = Column(Boolean, default=True)
-    fetch_interval_minutes = Column(Integer, default=30)
+    is_active = Column(Boolean, server_default=text("true"))
+    fetch_interval_minutes = Column(Integer, server_default=text("30"))
     last_fetched_at = Column(DateTime(timezone=True), nullable=True)
     last_fetch_status = Column(String(50), nullable=True)  # success, failed, timeout
 
-    # Articles relationship
-    articles = relationship("Article", back_populates="source", lazy="dynamic")
+    # Number of articles from this source, maintained by the trg_source_article_count
+    # trigger on articles (see migrations/); read-only from the application
+    article_count = Column(Integer, nullable=False, server_default=text("0"))
+
+    # Articles relationship. Too large to load implicitly: use
+    # selectinload(Source.articles) where needed, and article_count for counts
+    articles = relationship("Article", back_populates="source", lazy=RELATIONSHIP_LAZY)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
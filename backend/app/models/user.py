@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
-from app.database import Base
+from app.database import Base, RELATIONSHIP_LAZY
 
 
 class UserRole(str, enum.Enum):
@@ -24,17 +25,19 @@ class User(Base):
     organization = Column(String(255), nullable=True)
 
     # Role and permissions
-    role = Column(Enum(UserRole), default=UserRole.ANALYST)
-    is_active = Column(Boolean, default=True)
-    is_verified = Column(Boolean, default=False)
+    role = Column(Enum(UserRole, native_enum=True, name="userrole"), server_default=text("'ANALYST'"))
+    is_active = Column(Boolean, server_default=text("true"))
+    is_verified = Column(Boolean, server_default=text("false"))
 
     # Preferences
-    preferred_regions = Column(String(500), nullable=True)  # Comma-separated
-    preferred_themes = Column(String(500), nullable=True)
-    dark_mode = Column(Boolean, default=True)
-
-    # Alerts relationship
-    alerts = relationship("Alert", back_populates="user", lazy="dynamic")
+    # GIN-indexed, so users interested in a region/theme are one && (overlap) query
+    preferred_regions = Column(ARRAY(String(100)), nullable=False, server_default=text("'{}'"))
+    preferred_themes = Column(ARRAY(String(100)), nullable=False, server_default=text("'{}'"))
+    dark_mode = Column(Boolean, server_default=text("true"))
+
+    # Alerts relationship. Users are loaded on every authenticated request, so
+    # alerts should not be loaded implicitly: use selectinload(User.alerts) where needed
+    alerts = relationship("Alert", back_populates="user", lazy=RELATIONSHIP_LAZY)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -3,7 +3,8 @@ from app.schemas.article import (
     ArticleCreate,
     ArticleResponse,
     ArticleListResponse,
-    ArticleSummary
+    ArticleSummary,
+    EntityModel
 )
 from app.schemas.source import (
     SourceBase,
@@ -23,7 +24,7 @@ from app.schemas.user import (
 )
 
 __all__ = [
-    "ArticleBase", "ArticleCreate", "ArticleResponse", "ArticleListResponse", "ArticleSummary",
+    "ArticleBase", "ArticleCreate", "ArticleResponse", "ArticleListResponse", "ArticleSummary", "EntityModel",
     "SourceBase", "SourceCreate", "SourceResponse",
     "AlertBase", "AlertCreate", "AlertResponse",
     "UserBase", "UserCreate", "UserResponse", "Token"
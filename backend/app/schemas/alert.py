@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -41,6 +41,16 @@ class AlertUpdate(BaseModel):
     email_enabled: Optional[bool] = None
 
 
+# Fields copied from an Alert row into AlertResponse; the JSON list columns
+# may be NULL in the database and default to empty lists
+_ALERT_FIELDS = (
+    "id", "user_id", "name", "regions", "countries", "themes", "domains",
+    "keywords", "min_relevance", "frequency", "is_active", "email_enabled",
+    "last_triggered_at", "trigger_count", "created_at", "updated_at",
+)
+_LIST_FIELDS = ("regions", "countries", "themes", "domains", "keywords")
+
+
 class AlertResponse(AlertBase):
     id: int
     user_id: int
@@ -49,5 +59,16 @@ class AlertResponse(AlertBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, alert) -> "AlertResponse":
+        """Build a response from a trusted Alert row without re-validating it"""
+        data = {field: getattr(alert, field) for field in _ALERT_FIELDS}
+        for field in _LIST_FIELDS:
+            data[field] = data[field] or []
+        return cls.model_construct(**data)
+
+
+# Serializes a whole list of AlertResponse objects in one call
+AlertResponseList = TypeAdapter(List[AlertResponse])
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, HttpUrl
+from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -23,6 +23,13 @@ class ArticleCreate(ArticleBase):
     source_id: int
 
 
+class EntityModel(BaseModel):
+    type: str
+    name: str
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
 class ArticleSummary(BaseModel):
     what_happened: Optional[str] = None
     why_matters: Optional[str] = None
@@ -56,23 +63,24 @@ class ArticleResponse(ArticleBase):
     country: Optional[str] = None
     theme: Optional[str] = None
     domain: Optional[str] = None
-    entities: List[Dict[str, Any]] = []
+    entities: List[EntityModel] = []
 
     # Status
     is_processed: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class ArticleListResponse(BaseModel):
     articles: List[ArticleResponse]
-    total: int
+    total: Optional[int] = None  # Omitted for cursor-paginated requests
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # Opaque keyset cursor for the next page
+    has_more: bool = False  # Whether another page follows (known without counting)
 
 
 class ArticleFilters(BaseModel):
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -60,5 +60,32 @@ class SourceResponse(SourceBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+    @classmethod
+    def from_source(cls, source) -> "SourceResponse":
+        """Build a response from a trusted Source row without re-validating it"""
+        return cls.model_construct(
+            id=source.id,
+            name=source.name,
+            url=source.url,
+            feed_url=source.feed_url,
+            source_type=source.source_type,
+            category=source.category,
+            country=source.country,
+            language=source.language,
+            description=source.description,
+            reliability_score=source.reliability_score,
+            bias_rating=source.bias_rating,
+            is_active=source.is_active,
+            fetch_interval_minutes=source.fetch_interval_minutes,
+            last_fetched_at=source.last_fetched_at,
+            last_fetch_status=source.last_fetch_status,
+            article_count=source.article_count or 0,
+            created_at=source.created_at,
+            updated_at=source.updated_at
+        )
+
+
+# Serializes a whole page of SourceResponse objects in one call
+SourceResponseList = TypeAdapter(List[SourceResponse])
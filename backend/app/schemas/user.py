@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -27,8 +27,8 @@ class UserUpdate(BaseModel):
     username: Optional[str] = None
     full_name: Optional[str] = None
     organization: Optional[str] = None
-    preferred_regions: Optional[str] = None
-    preferred_themes: Optional[str] = None
+    preferred_regions: Optional[List[str]] = None
+    preferred_themes: Optional[List[str]] = None
     dark_mode: Optional[bool] = None
 
 
@@ -37,14 +37,13 @@ class UserResponse(UserBase):
     role: UserRole
     is_active: bool
     is_verified: bool
-    preferred_regions: Optional[str] = None
-    preferred_themes: Optional[str] = None
+    preferred_regions: List[str] = []
+    preferred_themes: List[str] = []
     dark_mode: bool = True
     created_at: datetime
     last_login_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class Token(BaseModel):
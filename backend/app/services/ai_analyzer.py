@@ -1,12 +1,19 @@
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Optional
-from groq import Groq
+from typing import Dict, Any, List, Optional, Tuple
+from groq import Groq, AsyncGroq
 import httpx
+from pydantic import ValidationError
 from app.config import settings
+from app.schemas.article import EntityModel
+from app.services.llm_cache import cached_call
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for Ollama requests
+OLLAMA_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
 
 class AIAnalyzer:
     """
@@ -22,8 +29,10 @@ class AIAnalyzer:
             self.client = Groq(api_key=settings.groq_api_key)
         elif self.provider == "ollama":
             self.ollama_url = settings.ollama_base_url
+            # One keep-alive pool for all sync calls instead of a connection per request
+            self._http = httpx.Client(base_url=self.ollama_url, timeout=120.0, limits=OLLAMA_LIMITS)
 
-    def _call_groq(self, prompt: str, system_prompt: str) -> str:
+    def _call_groq(self, prompt: str, system_prompt: str, max_tokens: int = 2000) -> str:
         """Call Groq API"""
         try:
             response = self.client.chat.completions.create(
@@ -33,39 +42,133 @@ class AIAnalyzer:
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=max_tokens
             )
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Groq API error: {e}")
             raise
 
-    def _call_ollama(self, prompt: str, system_prompt: str) -> str:
+    def _call_ollama(self, prompt: str, system_prompt: str, max_tokens: int = 2000) -> str:
         """Call local Ollama instance"""
         try:
-            response = httpx.post(
-                f"{self.ollama_url}/api/generate",
+            response = self._http.post(
+                "/api/generate",
                 json={
                     "model": self.model,
                     "prompt": f"{system_prompt}\n\n{prompt}",
-                    "stream": False
-                },
-                timeout=120.0
+                    "stream": False,
+                    "options": {"num_predict": max_tokens}
+                }
             )
             return response.json()["response"]
         except Exception as e:
             logger.error(f"Ollama error: {e}")
             raise
 
-    def _call_llm(self, prompt: str, system_prompt: str) -> str:
+    @cached_call
+    def _call_llm(self, prompt: str, system_prompt: str, max_tokens: int = 2000) -> str:
         """Call the configured LLM provider"""
         if self.provider == "groq":
-            return self._call_groq(prompt, system_prompt)
+            return self._call_groq(prompt, system_prompt, max_tokens)
+        elif self.provider == "ollama":
+            return self._call_ollama(prompt, system_prompt, max_tokens)
+        else:
+            raise ValueError(f"Unknown LLM provider: {self.provider}")
+
+    def async_client(self):
+        """
+        New async client for the configured provider, used as an async context manager.
+        Each asyncio.run gets its own loop, so clients are scoped to one loop, not shared.
+        """
+        if self.provider == "groq":
+            return AsyncGroq(api_key=settings.groq_api_key)
         elif self.provider == "ollama":
-            return self._call_ollama(prompt, system_prompt)
+            return httpx.AsyncClient(base_url=self.ollama_url, timeout=120.0, limits=OLLAMA_LIMITS)
         else:
             raise ValueError(f"Unknown LLM provider: {self.provider}")
 
+    async def _acall_groq(self, prompt: str, system_prompt: str, client: AsyncGroq, max_tokens: int = 2000) -> str:
+        """Call Groq API without blocking the event loop"""
+        try:
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=max_tokens
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Groq API error: {e}")
+            raise
+
+    async def _acall_ollama(self, prompt: str, system_prompt: str, client: httpx.AsyncClient, max_tokens: int = 2000) -> str:
+        """Call local Ollama instance without blocking the event loop"""
+        try:
+            response = await client.post(
+                "/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": f"{system_prompt}\n\n{prompt}",
+                    "stream": False,
+                    "options": {"num_predict": max_tokens}
+                }
+            )
+            return response.json()["response"]
+        except Exception as e:
+            logger.error(f"Ollama error: {e}")
+            raise
+
+    @cached_call
+    async def _acall_llm(self, prompt: str, system_prompt: str, client, max_tokens: int = 2000) -> str:
+        """Async variant of _call_llm; client comes from async_client()"""
+        if self.provider == "groq":
+            return await self._acall_groq(prompt, system_prompt, client, max_tokens)
+        elif self.provider == "ollama":
+            return await self._acall_ollama(prompt, system_prompt, client, max_tokens)
+        else:
+            raise ValueError(f"Unknown LLM provider: {self.provider}")
+
+    @staticmethod
+    def _extract_json(response: str) -> str:
+        """Strip the markdown code fence the model sometimes wraps JSON in"""
+        if "```json" in response:
+            response = response.split("```json")[1].split("```")[0]
+        elif "```" in response:
+            response = response.split("```")[1].split("```")[0]
+        return response.strip()
+
+    @staticmethod
+    def _format_bullets(lines) -> str:
+        """Normalize bullet lines to "• "-prefixed text, at most 5 of them"""
+        bullets = []
+        for line in lines:
+            line = str(line).strip()
+            if line:
+                # Ensure bullet format
+                if not line.startswith('•'):
+                    line = '• ' + line.lstrip('- *>')
+                bullets.append(line)
+        return '\n'.join(bullets[:5])
+
+    @classmethod
+    def _has_five_bullets(cls, response: str) -> bool:
+        """cache_if check: the reply yields a full 5-bullet summary"""
+        return bool(response) and cls._format_bullets(response.strip().split('\n')).count('\n') == 4
+
+    @classmethod
+    def _parses_as(cls, expected_type: type):
+        """cache_if check: the reply's JSON parses to expected_type"""
+        def check(response: str) -> bool:
+            try:
+                return isinstance(json.loads(cls._extract_json(response)), expected_type)
+            except (json.JSONDecodeError, TypeError):
+                return False
+        return check
+
     def generate_bullet_summary(self, title: str, content: str) -> str:
         """
         Generate a concise 5-line bullet point summary of the news article.
@@ -100,139 +203,12 @@ Example format:
 Respond with ONLY the 5 bullet points, nothing else:"""
 
         try:
-            response = self._call_llm(prompt, system_prompt)
-
-            # Clean up response
-            lines = response.strip().split('\n')
-            bullets = []
-            for line in lines:
-                line = line.strip()
-                if line:
-                    # Ensure bullet format
-                    if not line.startswith('•'):
-                        line = '• ' + line.lstrip('- *>')
-                    bullets.append(line)
-
-            # Take only first 5 bullets
-            bullets = bullets[:5]
-
-            return '\n'.join(bullets) if bullets else ""
+            response = self._call_llm(prompt, system_prompt, cache_if=self._has_five_bullets)
+            return self._format_bullets(response.strip().split('\n'))
         except Exception as e:
             logger.error(f"Error generating bullet summary: {e}")
             return ""
 
-    def generate_strategic_summary(self, title: str, content: str) -> Dict[str, str]:
-        """
-        Generate a structured strategic summary for a news article.
-
-        Returns:
-            Dict with keys: bullets, what_happened, why_matters, india_implications, future_developments
-        """
-        # First generate bullet summary
-        bullets = self.generate_bullet_summary(title, content)
-
-        system_prompt = """You are a strategic analyst specializing in geopolitical and defense affairs.
-Your task is to analyze news articles and provide concise, professional summaries suitable for
-defense analysts, military officers, and policy researchers.
-
-Focus on:
-- Factual accuracy
-- Strategic implications
-- Relevance to India's security environment
-- Professional, briefing-style language
-
-Always respond in valid JSON format."""
-
-        prompt = f"""Analyze this news article and provide a structured strategic summary.
-
-Title: {title}
-
-Content: {content[:3000]}
-
-Respond with a JSON object containing exactly these four keys:
-{{
-    "what_happened": "A concise 2-3 sentence factual summary of the event",
-    "why_matters": "Strategic context and significance (2-3 sentences)",
-    "india_implications": "Specific implications for India's security, diplomacy, or interests (2-3 sentences)",
-    "future_developments": "Likely next steps or developments to watch (2-3 sentences)"
-}}
-
-If the article has no relevance to India, still provide analysis but note limited direct implications."""
-
-        try:
-            response = self._call_llm(prompt, system_prompt)
-
-            # Parse JSON response
-            # Try to extract JSON from response
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0]
-
-            result = json.loads(response.strip())
-
-            return {
-                "bullets": bullets,
-                "what_happened": result.get("what_happened", ""),
-                "why_matters": result.get("why_matters", ""),
-                "india_implications": result.get("india_implications", ""),
-                "future_developments": result.get("future_developments", "")
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            # Return empty summary on parse error
-            return {
-                "bullets": bullets,
-                "what_happened": "",
-                "why_matters": "",
-                "india_implications": "",
-                "future_developments": ""
-            }
-        except Exception as e:
-            logger.error(f"Error generating summary: {e}")
-            raise
-
-    def extract_entities(self, title: str, content: str) -> list:
-        """
-        Extract named entities from the article.
-
-        Returns:
-            List of dicts with 'type' and 'name' keys
-        """
-        system_prompt = """You are an entity extraction specialist for geopolitical news.
-Extract key entities and respond only with valid JSON."""
-
-        prompt = f"""Extract key entities from this news article.
-
-Title: {title}
-Content: {content[:2000]}
-
-Respond with a JSON array of entities:
-[
-    {{"type": "country", "name": "China"}},
-    {{"type": "leader", "name": "Xi Jinping"}},
-    {{"type": "organization", "name": "NATO"}},
-    {{"type": "military", "name": "PLA Navy"}},
-    {{"type": "location", "name": "South China Sea"}},
-    {{"type": "weapon", "name": "Type 055 Destroyer"}}
-]
-
-Only include significant entities. Types: country, leader, organization, military, location, weapon, event"""
-
-        try:
-            response = self._call_llm(prompt, system_prompt)
-
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0]
-
-            entities = json.loads(response.strip())
-            return entities if isinstance(entities, list) else []
-        except Exception as e:
-            logger.error(f"Error extracting entities: {e}")
-            return []
-
     # Valid values for classification
     VALID_REGIONS = ["South Asia", "East Asia", "Indo-Pacific", "Middle East", "Europe", "Africa", "Americas", "Central Asia", "Global"]
     VALID_THEMES = ["Great Power Competition", "Border Security", "Maritime Security", "Defense Technology", "Nuclear Affairs", "Terrorism", "Cyber Security", "Space", "Economic Security", "Diplomacy", "Internal Security", "General Security"]
@@ -276,77 +252,210 @@ Only include significant entities. Types: country, leader, organization, militar
             return normalizations[lower]
         return country
 
-    def classify_article(self, title: str, content: str) -> Dict[str, str]:
-        """
-        Classify article by region, theme, and domain.
+    def _parse_entities(self, entities) -> list:
+        """Keep only well-formed entries so stored entities always match EntityModel"""
+        if not isinstance(entities, list):
+            return []
+        valid = []
+        for entity in entities:
+            try:
+                valid.append(EntityModel.model_validate(entity).model_dump())
+            except ValidationError:
+                continue
+        return valid
+
+    def _parse_classification(self, result: Dict[str, Any]) -> Dict[str, str]:
+        """Validate and normalize all classification fields, defaulting what is missing"""
+        if not isinstance(result, dict):
+            result = {}
+        return {
+            "region": self._validate_and_normalize(result.get("region", ""), self.VALID_REGIONS, "Global"),
+            "country": self._normalize_country(result.get("country", "")),
+            "theme": self._validate_and_normalize(result.get("theme", ""), self.VALID_THEMES, "General Security"),
+            "domain": self._validate_and_normalize(result.get("domain", ""), self.VALID_DOMAINS, "multi-domain")
+        }
 
-        Returns:
-            Dict with keys: region, country, theme, domain
-        """
-        system_prompt = """You are a geopolitical classification specialist.
-Classify news articles into predefined categories. Respond only with valid JSON.
-IMPORTANT: You MUST choose values from the exact lists provided. Do not make up new categories."""
+    def _parse_analysis(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a parsed analysis JSON object into summary, entities and classification"""
+        if not isinstance(result, dict):
+            result = {}
+        bullets = result.get("bullets") or []
+        if isinstance(bullets, str):
+            bullets = bullets.split('\n')
+        return {
+            "summary": {
+                "bullets": self._format_bullets(bullets),
+                "what_happened": result.get("what_happened") or "",
+                "why_matters": result.get("why_matters") or "",
+                "india_implications": result.get("india_implications") or "",
+                "future_developments": result.get("future_developments") or ""
+            },
+            "entities": self._parse_entities(result.get("entities")),
+            "classification": self._parse_classification(result.get("classification"))
+        }
 
-        prompt = f"""Classify this news article.
+    # One system prompt for the analyst, entity-extractor and classifier roles
+    ANALYSIS_SYSTEM_PROMPT = """You are a strategic analyst specializing in geopolitical and defense affairs.
+You summarize news articles for defense analysts, military officers, and policy researchers,
+extract their key entities, and classify them into predefined categories.
 
-Title: {title}
-Content: {content[:2000]}
+Focus on:
+- Factual accuracy
+- Strategic implications
+- Relevance to India's security environment
+- Professional, briefing-style language
 
-Respond with a JSON object. You MUST use these exact values:
+For classification you MUST choose values from the exact lists provided. Do not make up new categories.
+Always respond in valid JSON format."""
 
-{{
-    "region": "MUST be one of: South Asia, East Asia, Indo-Pacific, Middle East, Europe, Africa, Americas, Central Asia, Global",
-    "country": "The PRIMARY country this article is about. Use standard names: India, China, Pakistan, USA, Russia, Ukraine, Israel, Iran, etc. If multiple countries, pick the main one.",
-    "theme": "MUST be one of: Great Power Competition, Border Security, Maritime Security, Defense Technology, Nuclear Affairs, Terrorism, Cyber Security, Space, Economic Security, Diplomacy, Internal Security",
-    "domain": "MUST be one of: land, maritime, air, cyber, space, nuclear, diplomatic, economic, multi-domain"
-}}
+    # JSON fields requested for each analyzed article
+    ANALYSIS_FIELDS = """{
+    "bullets": ["Exactly 5 factual bullet points, max 15 words each (who, what, where, when, why/impact)"],
+    "what_happened": "A concise 2-3 sentence factual summary of the event",
+    "why_matters": "Strategic context and significance (2-3 sentences)",
+    "india_implications": "Specific implications for India's security, diplomacy, or interests (2-3 sentences)",
+    "future_developments": "Likely next steps or developments to watch (2-3 sentences)",
+    "entities": [
+        {"type": "country", "name": "China"},
+        {"type": "leader", "name": "Xi Jinping"}
+    ],
+    "classification": {
+        "region": "MUST be one of: South Asia, East Asia, Indo-Pacific, Middle East, Europe, Africa, Americas, Central Asia, Global",
+        "country": "The PRIMARY country this article is about. Use standard names: India, China, Pakistan, USA, Russia, Ukraine, Israel, Iran, etc. If multiple countries, pick the main one.",
+        "theme": "MUST be one of: Great Power Competition, Border Security, Maritime Security, Defense Technology, Nuclear Affairs, Terrorism, Cyber Security, Space, Economic Security, Diplomacy, Internal Security",
+        "domain": "MUST be one of: land, maritime, air, cyber, space, nuclear, diplomatic, economic, multi-domain"
+    }
+}
+
+Only include significant entities. Entity types: country, leader, organization, military, location, weapon, event.
+If the article has no relevance to India, still provide analysis but note limited direct implications."""
+
+    def _analysis_prompt(self, title: str, content: str) -> str:
+        """User prompt for the full analysis of one article"""
+        return f"""Analyze this news article.
 
-If unsure about country, analyze which country is the PRIMARY subject of the article."""
+Title: {title}
 
+Content: {content[:3000]}
+
+Respond with a JSON object containing exactly these keys:
+{self.ANALYSIS_FIELDS}"""
+
+    def _parse_analysis_response(self, response: str) -> Dict[str, Any]:
+        """Parse the LLM's reply to _analysis_prompt"""
         try:
-            response = self._call_llm(prompt, system_prompt)
-
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0]
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0]
-
-            result = json.loads(response.strip())
-
-            # Validate and normalize all fields
-            region = self._validate_and_normalize(result.get("region", ""), self.VALID_REGIONS, "Global")
-            country = self._normalize_country(result.get("country", ""))
-            theme = self._validate_and_normalize(result.get("theme", ""), self.VALID_THEMES, "General Security")
-            domain = self._validate_and_normalize(result.get("domain", ""), self.VALID_DOMAINS, "multi-domain")
-
-            return {
-                "region": region,
-                "country": country,
-                "theme": theme,
-                "domain": domain
-            }
-        except Exception as e:
-            logger.error(f"Error classifying article: {e}")
-            return {
-                "region": "Global",
-                "country": "",
-                "theme": "General Security",
-                "domain": "multi-domain"
-            }
+            result = json.loads(self._extract_json(response))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM analysis as JSON: {e}")
+            result = {}
+        return self._parse_analysis(result)
 
     def analyze_article(self, title: str, content: str) -> Dict[str, Any]:
         """
-        Full analysis of an article: summary, entities, and classification.
+        Full analysis of an article: summary, entities, and classification,
+        requested from the LLM in a single call.
         """
-        summary = self.generate_strategic_summary(title, content)
-        entities = self.extract_entities(title, content)
-        classification = self.classify_article(title, content)
-
-        return {
-            "summary": summary,
-            "entities": entities,
-            "classification": classification
-        }
+        response = self._call_llm(
+            self._analysis_prompt(title, content), self.ANALYSIS_SYSTEM_PROMPT,
+            cache_if=self._parses_as(dict)
+        )
+        return self._parse_analysis_response(response)
+
+    async def aanalyze_article(self, title: str, content: str, client) -> Dict[str, Any]:
+        """Async variant of analyze_article; client comes from async_client()"""
+        response = await self._acall_llm(
+            self._analysis_prompt(title, content), self.ANALYSIS_SYSTEM_PROMPT, client,
+            cache_if=self._parses_as(dict)
+        )
+        return self._parse_analysis_response(response)
+
+    # Output budget per article in a batched analysis call
+    BATCH_TOKENS_PER_ARTICLE = 900
+
+    def _batch_prompt(self, items: List[Tuple[str, str]]) -> str:
+        """User prompt analyzing several articles under ### ARTICLE {i} headers"""
+        articles = "\n\n".join(
+            f"### ARTICLE {i}\nTitle: {title}\n\nContent: {content[:2000]}"
+            for i, (title, content) in enumerate(items)
+        )
+        return f"""Analyze each of these {len(items)} news articles independently.
+
+{articles}
+
+Respond with a JSON array holding one object per article. Each object has an "id" key
+set to the article's number from its ### ARTICLE header, plus exactly these keys:
+{self.ANALYSIS_FIELDS}"""
+
+    def _parse_batch_response(self, response: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """Route a batched reply back by id; None marks an article the model left out"""
+        results: List[Optional[Dict[str, Any]]] = [None] * count
+        try:
+            parsed = json.loads(self._extract_json(response))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse batched LLM analysis as JSON: {e}")
+            return results
+        if not isinstance(parsed, list):
+            logger.error("Batched LLM analysis was not a JSON array")
+            return results
+
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("id"))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < count and results[index] is None:
+                results[index] = self._parse_analysis(entry)
+        return results
+
+    async def _aanalyze_batch(self, items: List[Tuple[str, str]], client) -> List[Any]:
+        """
+        Analyze one batch in a single LLM call, then retry one at a time any article
+        missing from the reply (or all of them if the batch call failed). An article
+        whose retry fails gets the exception in place of its analysis.
+        """
+        results: List[Any] = [None] * len(items)
+        if len(items) > 1:
+            try:
+                response = await self._acall_llm(
+                    self._batch_prompt(items), self.ANALYSIS_SYSTEM_PROMPT, client,
+                    max_tokens=self.BATCH_TOKENS_PER_ARTICLE * len(items),
+                    cache_if=self._parses_as(list)
+                )
+                results = self._parse_batch_response(response, len(items))
+            except Exception as e:
+                logger.warning(f"Batched analysis of {len(items)} articles failed, analyzing individually: {e}")
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        retried = await asyncio.gather(
+            *(self.aanalyze_article(*items[i], client) for i in missing),
+            return_exceptions=True
+        )
+        for i, result in zip(missing, retried):
+            results[i] = result
+        return results
+
+    async def aanalyze_articles_batch(
+        self, items: List[Tuple[str, str]], client, batch_size: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Analyze (title, content) pairs batch_size articles per LLM call, running
+        up to llm_max_concurrency calls at once. Results come back in input order;
+        an article whose analysis failed gets the exception instead.
+        """
+        batch_size = batch_size or settings.llm_batch_size
+        batches = [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+        semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+        async def run(batch):
+            async with semaphore:
+                return await self._aanalyze_batch(batch, client)
+
+        results = []
+        for batch, outcome in zip(batches, await asyncio.gather(*(run(b) for b in batches), return_exceptions=True)):
+            results.extend([outcome] * len(batch) if isinstance(outcome, Exception) else outcome)
+        return results
 
 
 # Singleton instance
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import datetime, timedelta
 
-from app.models.article import Article
+from app.models.article import Article, canonical_url_matches
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,9 @@ class Deduplicator:
     title similarity and URL matching.
     """
 
+    # Most trigram candidates verified per lookup
+    MAX_CANDIDATES = 50
+
     def __init__(self, db: Session, similarity_threshold: float = 0.8):
         self.db = db
         self.similarity_threshold = similarity_threshold
@@ -52,7 +55,7 @@ class Deduplicator:
 
         Args:
             title: Title to check
-            url: URL to check (exact match)
+            url: URL to check (exact match, ignoring tracking parameters)
             hours_lookback: How many hours back to check
 
         Returns:
@@ -60,21 +63,26 @@ class Deduplicator:
         """
         duplicates = []
 
-        # Check for exact URL match first
-        url_match = self.db.query(Article).filter(Article.url == url).first()
+        # Check for a URL match first; also catches retries with different utm_*/fbclid/gclid
+        url_match = self.db.query(Article).filter(canonical_url_matches(url)).first()
         if url_match:
             duplicates.append(url_match)
             return duplicates
 
-        # Get recent articles for title comparison
+        # Candidate titles sharing enough trigrams with this one (pg_trgm's
+        # similarity_threshold), found through ix_articles_title_trgm rather
+        # than by scanning every recent article
         cutoff_time = datetime.utcnow() - timedelta(hours=hours_lookback)
 
-        recent_articles = self.db.query(Article).filter(
+        candidates = self.db.query(Article).filter(
+            Article.title.op("%")(title),
             Article.created_at >= cutoff_time
-        ).all()
+        ).order_by(
+            func.similarity(Article.title, title).desc()
+        ).limit(self.MAX_CANDIDATES).all()
 
-        # Check title similarity
-        for article in recent_articles:
+        # Verify the short candidate list with the exact title similarity
+        for article in candidates:
             similarity = self.calculate_similarity(title, article.title)
             if similarity >= self.similarity_threshold:
                 duplicates.append(article)
@@ -110,7 +118,7 @@ class Deduplicator:
         # This is a simplified check - in production you'd want
         # more sophisticated duplicate detection
 
-        total = self.db.query(Article).count()
+        total = self.db.query(func.count(Article.id)).scalar()
 
         # Count articles with very similar titles (using first 50 chars)
         # This is approximate
@@ -0,0 +1,122 @@
+"""
+LLM Response Cache
+
+Stores raw LLM responses in Redis keyed by a SHA256 of (provider, model, system
+prompt, prompt, max_tokens), so re-ingested articles, retries and reprocessing
+runs skip the API call. Only responses the caller's cache_if check accepts are
+stored, so a truncated or malformed reply is never replayed. Responses are
+zlib-compressed; Redis errors fall through to the LLM.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import zlib
+from typing import Callable, Optional
+
+import redis
+
+from app.cache import get_redis
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_PREFIX = "llm"
+LLM_CACHE_STATS_KEY = f"{LLM_CACHE_PREFIX}:stats"
+
+
+def llm_cache_key(provider: str, model: str, system_prompt: str, prompt: str, max_tokens: int) -> str:
+    digest = hashlib.sha256(
+        f"{provider}|{model}|{max_tokens}|{system_prompt}|{prompt}".encode()
+    ).hexdigest()
+    return f"{LLM_CACHE_PREFIX}:{digest}"
+
+
+def _record(outcome: str):
+    try:
+        get_redis().hincrby(LLM_CACHE_STATS_KEY, outcome, 1)
+    except redis.RedisError:
+        pass
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """Cached response for key, or None on a miss"""
+    try:
+        hit = get_redis().get(key)
+    except redis.RedisError as e:
+        logger.warning(f"LLM cache read failed: {e}")
+        return None
+    _record("hits" if hit is not None else "misses")
+    return zlib.decompress(hit).decode() if hit is not None else None
+
+
+def store_response(key: str, response: str):
+    """Cache a response for llm_cache_ttl_hours"""
+    try:
+        get_redis().setex(key, settings.llm_cache_ttl_hours * 3600, zlib.compress(response.encode()))
+    except redis.RedisError as e:
+        logger.warning(f"LLM cache write failed: {e}")
+
+
+def cache_stats() -> dict:
+    """Hit and miss counts across all workers"""
+    try:
+        stats = get_redis().hgetall(LLM_CACHE_STATS_KEY)
+    except redis.RedisError as e:
+        logger.warning(f"Could not read LLM cache stats: {e}")
+        stats = {}
+    return {
+        "cache_hits": int(stats.get(b"hits", 0)),
+        "cache_misses": int(stats.get(b"misses", 0))
+    }
+
+
+def cached_call(func):
+    """
+    Cache an AIAnalyzer LLM call method, sync or async, taking (prompt, system_prompt, ...).
+    Callers opt in per call with cache_if=<predicate on the response>: only then is
+    the cache read, and only responses passing the predicate are stored.
+    Disabled when llm_cache_ttl_hours is 0.
+    """
+    signature = inspect.signature(func)
+
+    def cache_key(self, args, kwargs) -> str:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        return llm_cache_key(
+            self.provider, self.model, arguments["system_prompt"],
+            arguments["prompt"], arguments.get("max_tokens")
+        )
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, cache_if: Optional[Callable[[str], bool]] = None, **kwargs):
+            if cache_if is None or not settings.llm_cache_ttl_hours:
+                return await func(self, *args, **kwargs)
+            key = cache_key(self, args, kwargs)
+            # The Redis client is synchronous; keep it off the event loop
+            hit = await asyncio.to_thread(get_cached_response, key)
+            if hit is not None:
+                return hit
+            response = await func(self, *args, **kwargs)
+            if cache_if(response):
+                await asyncio.to_thread(store_response, key, response)
+            return response
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, cache_if: Optional[Callable[[str], bool]] = None, **kwargs):
+        if cache_if is None or not settings.llm_cache_ttl_hours:
+            return func(self, *args, **kwargs)
+        key = cache_key(self, args, kwargs)
+        hit = get_cached_response(key)
+        if hit is not None:
+            return hit
+        response = func(self, *args, **kwargs)
+        if cache_if(response):
+            store_response(key, response)
+        return response
+    return wrapper
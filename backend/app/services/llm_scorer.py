@@ -7,11 +7,12 @@ for strategic/geopolitical relevance. Much more accurate than keyword matching.
 
 import json
 import logging
-import re
 import time
 from typing import Dict, Optional
-from groq import Groq
+from groq import Groq, AsyncGroq
 from app.config import settings
+from app.models.article import INDIA_NEIGHBOR_COUNTRIES, INDIA_NEIGHBOR_COUNTRIES_LC
+from app.services.relevance_scorer import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +20,9 @@ logger = logging.getLogger(__name__)
 _last_call_time = 0
 _min_call_interval = 0.5  # Min 500ms between calls to avoid rate limits
 
-# HIGHEST PRIORITY - India and immediate neighbors (always show first)
-INDIA_NEIGHBORS = [
-    "India", "Pakistan", "China", "Bangladesh", "Nepal", "Sri Lanka",
-    "Myanmar", "Afghanistan", "Maldives", "Bhutan"
-]
-
-# Priority countries - any news involving these should be HIGH relevance
-PRIORITY_COUNTRIES = INDIA_NEIGHBORS
+# Priority countries (India and immediate neighbors) - any news involving these
+# should be HIGH relevance
+PRIORITY_COUNTRIES = INDIA_NEIGHBOR_COUNTRIES
 
 # Strategic topics that should be HIGH relevance
 STRATEGIC_TOPICS = [
@@ -40,6 +36,10 @@ STRATEGIC_TOPICS = [
     "maritime", "south china sea", "indian ocean"
 ]
 
+# Single-pass word-boundary matchers for the fallback checks
+_PRIORITY_MATCHER = KeywordMatcher(INDIA_NEIGHBOR_COUNTRIES_LC)
+_STRATEGIC_MATCHER = KeywordMatcher(STRATEGIC_TOPICS)
+
 SCORING_PROMPT = """You are a strategic intelligence analyst specializing in India's national security and geopolitical interests.
 
 Analyze this news article and provide a JSON response with the following:
@@ -97,37 +97,21 @@ class LLMScorer:
 
     def _quick_priority_check(self, text: str) -> bool:
         """Quick check if text mentions priority countries using word boundaries"""
-        text_lower = text.lower()
-        for country in PRIORITY_COUNTRIES:
-            pattern = r'\b' + re.escape(country.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return _PRIORITY_MATCHER.contains_any(text.lower())
 
     def _quick_strategic_check(self, text: str) -> bool:
         """Quick check if text mentions strategic topics using word boundaries"""
-        text_lower = text.lower()
-        for topic in STRATEGIC_TOPICS:
-            pattern = r'\b' + re.escape(topic) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return _STRATEGIC_MATCHER.contains_any(text.lower())
 
-    def score_article(self, title: str, content: str = "") -> Dict:
-        """
-        Score an article using LLM for intelligent relevance assessment.
-
-        Returns:
-            Dict with relevance_score, relevance_level, classification, etc.
-        """
+    def _fallback_response(self, title: str, content: str) -> Dict:
+        """Keyword-based default response, also used when the LLM call fails"""
         full_text = f"{title} {content or ''}"
 
         # Quick checks for priority content
         has_priority_country = self._quick_priority_check(full_text)
         has_strategic_topic = self._quick_strategic_check(full_text)
 
-        # Default response (fallback)
-        default_response = {
+        return {
             "relevance_score": 0.3 if has_priority_country else 0.1,
             "relevance_level": "medium" if has_priority_country else "low",
             "priority_reason": "Keyword-based fallback scoring",
@@ -141,6 +125,81 @@ class LLMScorer:
             "is_india_relevant": has_priority_country or has_strategic_topic
         }
 
+    def _request_kwargs(self, title: str, content: str) -> Dict:
+        """Chat completion arguments for scoring one article"""
+        # Truncate content to avoid token limits
+        truncated_content = content[:3000] if content else ""
+
+        prompt = SCORING_PROMPT.format(
+            title=title,
+            content=truncated_content or "(No content available, score based on title)"
+        )
+
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a strategic intelligence analyst. Respond only with valid JSON."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.1,  # Low temperature for consistent scoring
+            "max_tokens": 500
+        }
+
+    def _parse_response(self, result_text: str, default_response: Dict) -> Dict:
+        """Validate and normalize the LLM's JSON answer"""
+        has_priority_country = default_response["involves_priority_country"]
+        result_text = result_text.strip()
+
+        # Parse JSON response
+        # Handle potential markdown code blocks
+        if result_text.startswith("```"):
+            result_text = result_text.split("```")[1]
+            if result_text.startswith("json"):
+                result_text = result_text[4:]
+
+        result = json.loads(result_text)
+
+        # Validate and normalize response
+        relevance_score = float(result.get("relevance_score", 0.3))
+        relevance_score = max(0.0, min(1.0, relevance_score))
+
+        # Boost score if priority country is involved but LLM scored low
+        if has_priority_country and relevance_score < 0.5:
+            relevance_score = max(relevance_score, 0.5)
+            result["priority_reason"] = f"Boosted: involves priority country. {result.get('priority_reason', '')}"
+
+        # Determine level from score
+        if relevance_score >= 0.5:
+            relevance_level = "high"
+        elif relevance_score >= 0.25:
+            relevance_level = "medium"
+        else:
+            relevance_level = "low"
+
+        return {
+            "relevance_score": round(relevance_score, 3),
+            "relevance_level": relevance_level,
+            "priority_reason": result.get("priority_reason", ""),
+            "classification": result.get("classification", default_response["classification"]),
+            "involves_priority_country": result.get("involves_priority_country", has_priority_country),
+            "is_india_relevant": result.get("is_india_relevant", True)
+        }
+
+    def score_article(self, title: str, content: str = "") -> Dict:
+        """
+        Score an article using LLM for intelligent relevance assessment.
+
+        Returns:
+            Dict with relevance_score, relevance_level, classification, etc.
+        """
+        default_response = self._fallback_response(title, content)
+
         if not self.client:
             logger.warning("Groq client not initialized, using fallback scoring")
             return default_response
@@ -152,66 +211,28 @@ class LLMScorer:
             if elapsed < _min_call_interval:
                 time.sleep(_min_call_interval - elapsed)
             _last_call_time = time.time()
-            # Truncate content to avoid token limits
-            truncated_content = content[:3000] if content else ""
-
-            prompt = SCORING_PROMPT.format(
-                title=title,
-                content=truncated_content or "(No content available, score based on title)"
-            )
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a strategic intelligence analyst. Respond only with valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for consistent scoring
-                max_tokens=500
-            )
-
-            result_text = response.choices[0].message.content.strip()
-
-            # Parse JSON response
-            # Handle potential markdown code blocks
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-
-            result = json.loads(result_text)
-
-            # Validate and normalize response
-            relevance_score = float(result.get("relevance_score", 0.3))
-            relevance_score = max(0.0, min(1.0, relevance_score))
-
-            # Boost score if priority country is involved but LLM scored low
-            if has_priority_country and relevance_score < 0.5:
-                relevance_score = max(relevance_score, 0.5)
-                result["priority_reason"] = f"Boosted: involves priority country. {result.get('priority_reason', '')}"
-
-            # Determine level from score
-            if relevance_score >= 0.5:
-                relevance_level = "high"
-            elif relevance_score >= 0.25:
-                relevance_level = "medium"
-            else:
-                relevance_level = "low"
-
-            return {
-                "relevance_score": round(relevance_score, 3),
-                "relevance_level": relevance_level,
-                "priority_reason": result.get("priority_reason", ""),
-                "classification": result.get("classification", default_response["classification"]),
-                "involves_priority_country": result.get("involves_priority_country", has_priority_country),
-                "is_india_relevant": result.get("is_india_relevant", True)
-            }
+
+            response = self.client.chat.completions.create(**self._request_kwargs(title, content))
+            return self._parse_response(response.choices[0].message.content, default_response)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM response as JSON: {e}")
+            return default_response
+        except Exception as e:
+            logger.error(f"LLM scoring failed: {e}")
+            return default_response
+
+    async def score_article_async(self, title: str, content: str = "", *, client: AsyncGroq) -> Dict:
+        """
+        Async variant of score_article for scoring many articles concurrently.
+        Callers bound concurrency themselves (see settings.llm_max_concurrency)
+        and pass an AsyncGroq client scoped to the running event loop.
+        """
+        default_response = self._fallback_response(title, content)
+
+        try:
+            response = await client.chat.completions.create(**self._request_kwargs(title, content))
+            return self._parse_response(response.choices[0].message.content, default_response)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response as JSON: {e}")
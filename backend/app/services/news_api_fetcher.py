@@ -22,7 +22,7 @@ from sqlalchemy.orm import Session
 from app.models.article import Article
 from app.models.source import Source, SourceType, SourceCategory
 from app.services.relevance_filter import is_relevant_article
-from app.services.news_fetcher import titles_are_similar
+from app.services.news_fetcher import SimilarTitleIndex, article_row, insert_new_articles
 
 logger = logging.getLogger(__name__)
 
@@ -86,8 +86,6 @@ class NewsAPIFetcher:
 
     def fetch_strategic_news(self, db: Session) -> int:
         """Fetch news for all strategic keywords"""
-        saved_count = 0
-
         # Get or create NewsAPI source
         source = db.query(Source).filter(Source.name == "NewsAPI").first()
         if not source:
@@ -101,6 +99,7 @@ class NewsAPIFetcher:
             db.add(source)
             db.commit()
 
+        rows = []
         for keyword in self.KEYWORDS:
             articles = self.fetch_everything(keyword, page_size=10)
 
@@ -109,11 +108,6 @@ class NewsAPIFetcher:
                 if not url:
                     continue
 
-                # Check if exists
-                existing = db.query(Article).filter(Article.url == url).first()
-                if existing:
-                    continue
-
                 # Parse date
                 published_at = None
                 if article_data.get("publishedAt"):
@@ -124,7 +118,7 @@ class NewsAPIFetcher:
                     except:
                         pass
 
-                article = Article(
+                rows.append(article_row(
                     title=article_data.get("title", "")[:500],
                     url=url,
                     original_content=article_data.get("content") or article_data.get("description"),
@@ -132,13 +126,10 @@ class NewsAPIFetcher:
                     author=article_data.get("author"),
                     image_url=article_data.get("urlToImage"),
                     source_id=source.id,
-                    is_processed=0
-                )
-                db.add(article)
-                saved_count += 1
+                ))
 
-        db.commit()
-        return saved_count
+        # Existing URLs, and ones repeated across keywords, are skipped by the insert
+        return insert_new_articles(db, rows)
 
 
 class GDELTFetcher:
@@ -217,8 +208,6 @@ class GDELTFetcher:
 
     def fetch_strategic_news(self, db: Session) -> int:
         """Fetch strategic news from GDELT"""
-        saved_count = 0
-
         # Get or create GDELT source
         source = db.query(Source).filter(Source.name == "GDELT").first()
         if not source:
@@ -236,10 +225,11 @@ class GDELTFetcher:
 
         # Get recent articles for title-based deduplication (last 7 days)
         recent_cutoff = datetime.utcnow() - timedelta(days=7)
-        recent_articles = db.query(Article).filter(
+        recent_titles = SimilarTitleIndex()
+        for (recent_title,) in db.query(Article.title).filter(
             Article.created_at >= recent_cutoff
-        ).all()
-        recent_titles = [a.title for a in recent_articles]
+        ):
+            recent_titles.add(recent_title)
 
         # Collect all articles first to deduplicate
         all_articles = {}  # url -> article_data
@@ -253,6 +243,7 @@ class GDELTFetcher:
                     all_articles[url] = article_data
 
         # Now save unique articles (with relevance filtering)
+        rows = []
         filtered_count = 0
         duplicate_count = 0
         for url, article_data in all_articles.items():
@@ -264,21 +255,9 @@ class GDELTFetcher:
                 filtered_count += 1
                 continue
 
-            # Check if exists in DB (by URL)
-            existing = db.query(Article).filter(Article.url == url).first()
-            if existing:
-                duplicate_count += 1
-                continue
-
             # Check for similar title in recent articles
-            is_duplicate = False
-            for recent_title in recent_titles:
-                if titles_are_similar(title, recent_title):
-                    is_duplicate = True
-                    duplicate_count += 1
-                    break
-
-            if is_duplicate:
+            if recent_titles.has_similar(title):
+                duplicate_count += 1
                 continue
 
             # Parse date
@@ -290,20 +269,20 @@ class GDELTFetcher:
                 except:
                     pass
 
-            article = Article(
+            rows.append(article_row(
                 title=title[:500],
                 url=url,
                 original_content=title,  # GDELT doesn't provide content
                 published_at=published_at,
                 image_url=article_data.get("socialimage"),
                 source_id=source.id,
-                is_processed=0
-            )
-            db.add(article)
-            recent_titles.append(title)  # Add to recent titles for this batch
-            saved_count += 1
+            ))
+            recent_titles.add(title)  # Add to recent titles for this batch
+
+        # URLs already stored are skipped by the insert itself
+        saved_count = insert_new_articles(db, rows)
+        duplicate_count += len(rows) - saved_count
 
-        db.commit()
         if filtered_count > 0:
             logger.info(f"GDELT: Filtered out {filtered_count} non-relevant articles")
         if duplicate_count > 0:
@@ -321,7 +300,7 @@ class GDELTFetcher:
             "India defence deal",
         ]
 
-        saved_count = 0
+        rows = []
         source = db.query(Source).filter(Source.name == "GDELT").first()
 
         for query in queries:
@@ -332,10 +311,6 @@ class GDELTFetcher:
                 if not url:
                     continue
 
-                existing = db.query(Article).filter(Article.url == url).first()
-                if existing:
-                    continue
-
                 published_at = None
                 if article_data.get("seendate"):
                     try:
@@ -345,19 +320,15 @@ class GDELTFetcher:
                     except:
                         pass
 
-                article = Article(
+                rows.append(article_row(
                     title=article_data.get("title", "")[:500],
                     url=url,
                     original_content=article_data.get("title"),
                     published_at=published_at,
                     source_id=source.id if source else 1,
-                    is_processed=0
-                )
-                db.add(article)
-                saved_count += 1
+                ))
 
-        db.commit()
-        return saved_count
+        return insert_new_articles(db, rows)
 
 
 class MediastackFetcher:
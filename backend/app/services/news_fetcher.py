@@ -1,15 +1,18 @@
 import logging
+import math
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 import feedparser
 import requests
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
+from sqlalchemy import Text, exists, func, select
+from sqlalchemy.dialects.postgresql import array, insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.models.source import Source, SourceType
-from app.models.article import Article
+from app.models.article import Article, canonical_url, canonical_url_matches
 from app.services.relevance_filter import is_relevant_article
 
 logger = logging.getLogger(__name__)
@@ -52,6 +55,58 @@ def titles_are_similar(title1: str, title2: str, threshold: float = 0.85) -> boo
     return similarity >= threshold
 
 
+class SimilarTitleIndex:
+    """
+    Set of titles answering "is any stored title similar to this one?" with the
+    same result as calling titles_are_similar against each stored title.
+
+    Uses prefix filtering: if two word sets have Jaccard >= threshold, their
+    sorted first len - ceil(threshold * len) + 1 words must share a word, so only
+    titles sharing one of those words are compared.
+    """
+
+    def __init__(self, threshold: float = 0.85):
+        self.threshold = threshold
+        self._normalized = set()
+        self._word_sets: List[frozenset] = []
+        self._by_word: Dict[str, List[int]] = {}
+
+    def _prefix(self, words) -> List[str]:
+        # Slightly undershoot the required overlap so float rounding can only lengthen the prefix
+        min_overlap = math.ceil(self.threshold * len(words) - 1e-9)
+        return sorted(words)[:len(words) - min_overlap + 1]
+
+    def add(self, title: str):
+        norm = normalize_title(title)
+        self._normalized.add(norm)
+        words = frozenset(norm.split())
+        if not words:
+            return
+        self._word_sets.append(words)
+        index = len(self._word_sets) - 1
+        for word in self._prefix(words):
+            self._by_word.setdefault(word, []).append(index)
+
+    def has_similar(self, title: str) -> bool:
+        norm = normalize_title(title)
+        if norm in self._normalized:
+            return True
+        words = set(norm.split())
+        if not words:
+            return False
+
+        checked = set()
+        for word in self._prefix(words):
+            for index in self._by_word.get(word, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                other = self._word_sets[index]
+                if len(words & other) / len(words | other) >= self.threshold:
+                    return True
+        return False
+
+
 class NewsFetcher:
     """
     Fetches news from various sources (RSS feeds, APIs, web scraping).
@@ -176,16 +231,17 @@ class NewsFetcher:
 
     def save_articles(self, articles: List[Dict[str, Any]]) -> int:
         """Save fetched articles to database, filtering for relevance and skipping duplicates"""
-        saved_count = 0
+        rows = []
         filtered_count = 0
         duplicate_count = 0
 
         # Get recent articles for title-based deduplication (last 7 days)
         recent_cutoff = datetime.utcnow() - timedelta(days=7)
-        recent_articles = self.db.query(Article).filter(
+        recent_titles = SimilarTitleIndex()
+        for (recent_title,) in self.db.query(Article.title).filter(
             Article.created_at >= recent_cutoff
-        ).all()
-        recent_titles = [a.title for a in recent_articles]
+        ):
+            recent_titles.add(recent_title)
 
         for article_data in articles:
             # FILTER: Check if article is relevant to defence/security topics
@@ -197,29 +253,13 @@ class NewsFetcher:
                 filtered_count += 1
                 continue
 
-            # Check if article already exists (by URL)
-            existing = self.db.query(Article).filter(
-                Article.url == article_data["url"]
-            ).first()
-
-            if existing:
-                duplicate_count += 1
-                continue
-
             # Check for similar title in recent articles
-            is_duplicate = False
-            for recent_title in recent_titles:
-                if titles_are_similar(title, recent_title):
-                    is_duplicate = True
-                    duplicate_count += 1
-                    logger.debug(f"Title duplicate detected: '{title}' similar to '{recent_title}'")
-                    break
-
-            if is_duplicate:
+            if recent_titles.has_similar(title):
+                duplicate_count += 1
+                logger.debug(f"Title duplicate detected: '{title}'")
                 continue
 
-            # Create new article
-            article = Article(
+            rows.append(article_row(
                 title=article_data["title"],
                 url=article_data["url"],
                 original_content=article_data.get("original_content"),
@@ -227,15 +267,12 @@ class NewsFetcher:
                 author=article_data.get("author"),
                 image_url=article_data.get("image_url"),
                 source_id=article_data["source_id"],
-                is_processed=0
-            )
+            ))
+            recent_titles.add(title)  # Add to recent titles for this batch
 
-            self.db.add(article)
-            recent_titles.append(title)  # Add to recent titles for this batch
-            saved_count += 1
-
-        if saved_count > 0:
-            self.db.commit()
+        # URLs already stored are skipped by the insert itself
+        saved_count = insert_new_articles(self.db, rows)
+        duplicate_count += len(rows) - saved_count
 
         if filtered_count > 0:
             logger.info(f"Filtered out {filtered_count} non-relevant articles")
@@ -272,101 +309,186 @@ class NewsFetcher:
         return results
 
 
-# Default news sources to seed the database
-DEFAULT_SOURCES = [
-    {
-        "name": "Reuters World News",
-        "url": "https://www.reuters.com",
-        "feed_url": "https://www.reutersagency.com/feed/?best-topics=political-general&post_type=best",
-        "source_type": "rss",
-        "category": "news_agency",
-        "country": "International",
-        "reliability_score": 9
-    },
-    {
-        "name": "Al Jazeera",
-        "url": "https://www.aljazeera.com",
-        "feed_url": "https://www.aljazeera.com/xml/rss/all.xml",
-        "source_type": "rss",
-        "category": "news_agency",
-        "country": "Qatar",
-        "reliability_score": 7
-    },
-    {
-        "name": "The Diplomat",
-        "url": "https://thediplomat.com",
-        "feed_url": "https://thediplomat.com/feed/",
-        "source_type": "rss",
-        "category": "think_tank",
-        "country": "USA",
-        "reliability_score": 8
-    },
-    {
-        "name": "Defense News",
-        "url": "https://www.defensenews.com",
-        "feed_url": "https://www.defensenews.com/arc/outboundfeeds/rss/?outputType=xml",
-        "source_type": "rss",
-        "category": "military",
-        "country": "USA",
-        "reliability_score": 8
-    },
-    {
-        "name": "CSIS",
-        "url": "https://www.csis.org",
-        "feed_url": "https://www.csis.org/analysis/feed",
-        "source_type": "rss",
-        "category": "think_tank",
-        "country": "USA",
-        "reliability_score": 9
-    },
-    {
-        "name": "The Hindu - International",
-        "url": "https://www.thehindu.com",
-        "feed_url": "https://www.thehindu.com/news/international/feeder/default.rss",
-        "source_type": "rss",
-        "category": "news_agency",
-        "country": "India",
-        "reliability_score": 8
-    },
-    {
-        "name": "Times of India - Defence",
-        "url": "https://timesofindia.indiatimes.com",
-        "feed_url": "https://timesofindia.indiatimes.com/rssfeeds/4719161.cms",
-        "source_type": "rss",
-        "category": "news_agency",
-        "country": "India",
-        "reliability_score": 7
-    },
-    {
-        "name": "South China Morning Post",
-        "url": "https://www.scmp.com",
-        "feed_url": "https://www.scmp.com/rss/91/feed",
-        "source_type": "rss",
-        "category": "news_agency",
-        "country": "Hong Kong",
-        "reliability_score": 7
+def article_row(
+    title: str,
+    url: str,
+    source_id: int,
+    original_content: Optional[str] = None,
+    published_at: Optional[datetime] = None,
+    author: Optional[str] = None,
+    image_url: Optional[str] = None,
+) -> Dict[str, Any]:
+    """A fetched article as a row for insert_new_articles (every row has the same keys)"""
+    return {
+        "title": title,
+        "url": url,
+        "source_id": source_id,
+        "original_content": original_content,
+        "published_at": published_at,
+        "author": author,
+        "image_url": image_url,
     }
-]
 
 
-def seed_default_sources(db: Session):
-    """Seed database with default news sources"""
-    from app.models.source import Source, SourceType, SourceCategory
-
-    for source_data in DEFAULT_SOURCES:
-        existing = db.query(Source).filter(Source.name == source_data["name"]).first()
-        if not existing:
-            source = Source(
-                name=source_data["name"],
-                url=source_data["url"],
-                feed_url=source_data["feed_url"],
-                source_type=SourceType(source_data["source_type"]),
-                category=SourceCategory(source_data["category"]),
-                country=source_data["country"],
-                reliability_score=source_data["reliability_score"],
-                is_active=True
-            )
-            db.add(source)
+def insert_new_articles(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert fetched articles in bulk, skipping URLs that are already stored or
+    repeated within the batch, also under different tracking parameters.
+    Bypasses the ORM unit of work; the remaining columns take their server
+    defaults. Returns the number of articles added.
+    """
+    # Keep the first of several tracking-link variants within the batch
+    by_canonical = {}
+    for row in rows:
+        by_canonical.setdefault(canonical_url(row["url"]), row)
+    rows = list(by_canonical.values())
+    if not rows:
+        return 0
+
+    # Skip re-ingests of stored articles under another tracking link (utm_*,
+    # fbclid, gclid), found through ix_articles_url_canon_hash
+    incoming = func.unnest(array([row["url"] for row in rows], type_=Text)).table_valued("url")
+    stored = set(db.scalars(
+        select(incoming.c.url).where(exists().where(canonical_url_matches(incoming.c.url)))
+    ))
+    rows = [row for row in rows if row["url"] not in stored]
+    if not rows:
+        return 0
+
+    stmt = pg_insert(Article).on_conflict_do_nothing(
+        index_elements=[Article.url_hash]
+    ).returning(Article.id)
+    added = len(db.execute(stmt, rows).all())
+    db.commit()
+    return added
+
+
+class SourceSeed(NamedTuple):
+    """A source to seed the database with (see insert_missing_sources)"""
+    name: str
+    url: str
+    feed_url: Optional[str] = None
+    source_type: str = "rss"
+    category: str = "news_agency"
+    country: Optional[str] = None
+    reliability_score: int = 5
+    bias_rating: Optional[str] = None
+    description: Optional[str] = None
+
 
+# Default news sources to seed the database
+DEFAULT_SOURCES: Tuple[SourceSeed, ...] = (
+    SourceSeed(
+        name="Reuters World News",
+        url="https://www.reuters.com",
+        feed_url="https://www.reutersagency.com/feed/?best-topics=political-general&post_type=best",
+        source_type="rss",
+        category="news_agency",
+        country="International",
+        reliability_score=9
+    ),
+    SourceSeed(
+        name="Al Jazeera",
+        url="https://www.aljazeera.com",
+        feed_url="https://www.aljazeera.com/xml/rss/all.xml",
+        source_type="rss",
+        category="news_agency",
+        country="Qatar",
+        reliability_score=7
+    ),
+    SourceSeed(
+        name="The Diplomat",
+        url="https://thediplomat.com",
+        feed_url="https://thediplomat.com/feed/",
+        source_type="rss",
+        category="think_tank",
+        country="USA",
+        reliability_score=8
+    ),
+    SourceSeed(
+        name="Defense News",
+        url="https://www.defensenews.com",
+        feed_url="https://www.defensenews.com/arc/outboundfeeds/rss/?outputType=xml",
+        source_type="rss",
+        category="military",
+        country="USA",
+        reliability_score=8
+    ),
+    SourceSeed(
+        name="CSIS",
+        url="https://www.csis.org",
+        feed_url="https://www.csis.org/analysis/feed",
+        source_type="rss",
+        category="think_tank",
+        country="USA",
+        reliability_score=9
+    ),
+    SourceSeed(
+        name="The Hindu - International",
+        url="https://www.thehindu.com",
+        feed_url="https://www.thehindu.com/news/international/feeder/default.rss",
+        source_type="rss",
+        category="news_agency",
+        country="India",
+        reliability_score=8
+    ),
+    SourceSeed(
+        name="Times of India - Defence",
+        url="https://timesofindia.indiatimes.com",
+        feed_url="https://timesofindia.indiatimes.com/rssfeeds/4719161.cms",
+        source_type="rss",
+        category="news_agency",
+        country="India",
+        reliability_score=7
+    ),
+    SourceSeed(
+        name="South China Morning Post",
+        url="https://www.scmp.com",
+        feed_url="https://www.scmp.com/rss/91/feed",
+        source_type="rss",
+        category="news_agency",
+        country="Hong Kong",
+        reliability_score=7
+    )
+)
+
+
+def insert_missing_sources(db: Session, sources: Iterable[SourceSeed]) -> int:
+    """
+    Insert seed sources in one statement, skipping names that already exist.
+    Returns the number of sources added.
+    """
+    from app.models.source import SourceCategory
+
+    rows = [
+        {
+            "name": seed.name,
+            "url": seed.url,
+            "feed_url": seed.feed_url,
+            "source_type": SourceType(seed.source_type),
+            "category": SourceCategory(seed.category),
+            "country": seed.country,
+            "language": "en",
+            "reliability_score": seed.reliability_score,
+            "bias_rating": seed.bias_rating,
+            "description": seed.description,
+            "is_active": True,
+            "fetch_interval_minutes": 30,
+        }
+        for seed in sources
+    ]
+    if not rows:
+        return 0
+
+    stmt = pg_insert(Source).values(rows).on_conflict_do_nothing(
+        index_elements=[Source.name]
+    ).returning(Source.id)
+    added = len(db.execute(stmt).all())
     db.commit()
+    return added
+
+
+def seed_default_sources(db: Session):
+    """Seed database with default news sources"""
+    insert_missing_sources(db, DEFAULT_SOURCES)
     logger.info("Default sources seeded")
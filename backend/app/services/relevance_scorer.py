@@ -1,11 +1,61 @@
 import re
 import logging
-from typing import Dict, Tuple
+from typing import Dict, FrozenSet, Iterable, Tuple
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """
+    Finds which keywords occur in a text (each matched as r'\bkeyword\b') in a
+    single regex pass, with the same result as one re.search per keyword.
+
+    The keywords are compiled into a prefix trie inside a lookahead, so every
+    text position yields its longest matching keyword; shorter keywords that
+    match at the same position are the ones that are word-bounded prefixes of
+    it, which are precomputed.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        keywords = set(keywords)
+        trie: Dict = {}
+        for kw in keywords:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        alternatives = [r"\b" + re.escape(ch) + self._node_pattern(child) for ch, child in sorted(trie.items())]
+        self._pattern = re.compile("(?=(" + "|".join(alternatives) + "))")
+        self._implied = {
+            kw: frozenset(
+                other for other in keywords
+                if other == kw or (kw.startswith(other) and re.match(re.escape(other) + r"\b", kw))
+            )
+            for kw in keywords
+        }
+
+    def _node_pattern(self, node: Dict) -> str:
+        # Longer continuations are tried before ending here, so the match is the longest keyword
+        branches = [re.escape(ch) + self._node_pattern(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            branches.append(r"\b")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    def contains_any(self, text: str) -> bool:
+        """Whether any keyword occurs in text (stops at the first match)"""
+        return self._pattern.search(text) is not None
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Keywords present in text (callers lower-case both sides)"""
+        found = set()
+        for match in self._pattern.finditer(text):
+            found |= self._implied[match.group(1)]
+        return frozenset(found)
+
+
 class RelevanceScorer:
     """
     Calculates strategic relevance scores for news articles.
@@ -13,12 +63,12 @@ class RelevanceScorer:
     """
 
     # HIGHEST PRIORITY - India and immediate neighbors (always prioritize)
-    INDIA_NEIGHBORS = [
+    INDIA_NEIGHBORS = frozenset({
         "india", "indian", "pakistan", "pakistani", "china", "chinese",
         "bangladesh", "bangladeshi", "nepal", "nepalese", "nepali",
         "sri lanka", "sri lankan", "myanmar", "burmese",
         "afghanistan", "afghan", "maldives", "maldivian", "bhutan", "bhutanese"
-    ]
+    })
 
     # Geographic relevance keywords (India-centric)
     GEO_KEYWORDS = {
@@ -104,28 +154,28 @@ class RelevanceScorer:
         self.diplomatic_weight = settings.diplomatic_weight
         self.economic_weight = settings.economic_weight
 
-    def _count_keyword_matches(self, text: str, keywords: Dict[str, list]) -> Tuple[int, int, int]:
-        """Count high, medium, and low priority keyword matches using word boundaries"""
-        text_lower = text.lower()
+        # One matcher over every scoring keyword, so each article is scanned once
+        keywords = set(self.INDIA_NEIGHBORS)
+        for category in (self.GEO_KEYWORDS, self.MILITARY_KEYWORDS,
+                         self.DIPLOMATIC_KEYWORDS, self.ECONOMIC_KEYWORDS):
+            for keyword_list in category.values():
+                keywords.update(keyword_list)
+        self._matcher = KeywordMatcher(keywords)
 
-        def count_with_boundary(keyword_list):
-            count = 0
-            for kw in keyword_list:
-                # Use word boundary matching to avoid false positives
-                pattern = r'\b' + re.escape(kw) + r'\b'
-                if re.search(pattern, text_lower):
-                    count += 1
-            return count
+    def _count_keyword_matches(self, found: FrozenSet[str], keywords: Dict[str, list]) -> Tuple[int, int, int]:
+        """Count high, medium, and low priority keywords among those found in the text"""
+        def count_found(keyword_list):
+            return sum(1 for kw in keyword_list if kw in found)
 
-        high_count = count_with_boundary(keywords.get("high", []))
-        medium_count = count_with_boundary(keywords.get("medium", []))
-        low_count = count_with_boundary(keywords.get("low", []))
+        high_count = count_found(keywords.get("high", []))
+        medium_count = count_found(keywords.get("medium", []))
+        low_count = count_found(keywords.get("low", []))
 
         return high_count, medium_count, low_count
 
-    def _calculate_category_score(self, text: str, keywords: Dict[str, list]) -> float:
+    def _calculate_category_score(self, found: FrozenSet[str], keywords: Dict[str, list]) -> float:
         """Calculate score for a category (0-1 scale)"""
-        high, medium, low = self._count_keyword_matches(text, keywords)
+        high, medium, low = self._count_keyword_matches(found, keywords)
 
         # Weighted scoring
         raw_score = (high * 1.0) + (medium * 0.5) + (low * 0.2)
@@ -136,14 +186,9 @@ class RelevanceScorer:
 
         return round(normalized, 3)
 
-    def _is_india_neighbor_article(self, text: str) -> bool:
+    def _is_india_neighbor_article(self, found: FrozenSet[str]) -> bool:
         """Check if article mentions India or its neighbors"""
-        text_lower = text.lower()
-        for keyword in self.INDIA_NEIGHBORS:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        return False
+        return not found.isdisjoint(self.INDIA_NEIGHBORS)
 
     def calculate_scores(self, title: str, content: str) -> Dict[str, float]:
         """
@@ -153,16 +198,16 @@ class RelevanceScorer:
             Dict with geo_score, military_score, diplomatic_score,
             economic_score, relevance_score, relevance_level, and is_priority
         """
-        full_text = f"{title} {content}"
+        found = self._matcher.find(f"{title} {content}".lower())
 
         # Check if this is about India or neighbors (HIGHEST PRIORITY)
-        is_priority = self._is_india_neighbor_article(full_text)
+        is_priority = self._is_india_neighbor_article(found)
 
         # Calculate individual category scores
-        geo_score = self._calculate_category_score(full_text, self.GEO_KEYWORDS)
-        military_score = self._calculate_category_score(full_text, self.MILITARY_KEYWORDS)
-        diplomatic_score = self._calculate_category_score(full_text, self.DIPLOMATIC_KEYWORDS)
-        economic_score = self._calculate_category_score(full_text, self.ECONOMIC_KEYWORDS)
+        geo_score = self._calculate_category_score(found, self.GEO_KEYWORDS)
+        military_score = self._calculate_category_score(found, self.MILITARY_KEYWORDS)
+        diplomatic_score = self._calculate_category_score(found, self.DIPLOMATIC_KEYWORDS)
+        economic_score = self._calculate_category_score(found, self.ECONOMIC_KEYWORDS)
 
         # Calculate weighted total score
         relevance_score = (
@@ -17,8 +17,8 @@ import httpx
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.models.article import Article
 from app.models.source import Source
+from app.services.news_fetcher import article_row, insert_new_articles
 
 logger = logging.getLogger(__name__)
 
@@ -167,7 +167,7 @@ class TwitterFetcher:
                     continue
 
                 tweets = self.get_user_tweets(user_id, max_results=5, hours_back=24)
-                saved = 0
+                rows = []
 
                 for tweet in tweets:
                     # Check if tweet is significant (has engagement)
@@ -178,11 +178,6 @@ class TwitterFetcher:
                     # Create unique URL
                     tweet_url = f"https://twitter.com/{username}/status/{tweet['id']}"
 
-                    # Check if already exists
-                    existing = db.query(Article).filter(Article.url == tweet_url).first()
-                    if existing:
-                        continue
-
                     # Get or create source
                     source = db.query(Source).filter(
                         Source.name == f"Twitter: @{username}"
@@ -201,20 +196,17 @@ class TwitterFetcher:
                         db.commit()
 
                     # Create article from tweet
-                    article = Article(
+                    rows.append(article_row(
                         title=tweet["text"][:200] + ("..." if len(tweet["text"]) > 200 else ""),
                         url=tweet_url,
                         original_content=tweet["text"],
                         published_at=datetime.fromisoformat(tweet["created_at"].replace("Z", "+00:00")),
                         author=f"@{username}",
                         source_id=source.id,
-                        is_processed=0
-                    )
-                    db.add(article)
-                    saved += 1
+                    ))
 
-                db.commit()
-                results[username] = saved
+                # Tweets already stored are skipped by the insert itself
+                results[username] = insert_new_articles(db, rows)
 
             except Exception as e:
                 logger.error(f"Error fetching tweets from @{username}: {e}")
@@ -3,6 +3,7 @@ from app.celery_app import celery_app
 from app.database import SessionLocal
 from app.services.news_fetcher import NewsFetcher, seed_default_sources
 from app.models.source import Source
+from app.cache import invalidate_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +17,7 @@ def fetch_all_news(self):
     db = SessionLocal()
     try:
         # Ensure default sources exist
-        source_count = db.query(Source).count()
-        if source_count == 0:
+        if db.query(Source.id).limit(1).first() is None:
             logger.info("No sources found, seeding defaults...")
             seed_default_sources(db)
 
@@ -27,6 +27,8 @@ def fetch_all_news(self):
 
         total_fetched = sum(results.values())
         logger.info(f"Fetch complete. Total new articles: {total_fetched}")
+        if total_fetched:
+            invalidate_response_cache()
 
         return {
             "status": "success",
@@ -61,6 +63,8 @@ def fetch_from_source(self, source_id: int):
         saved = fetcher.save_articles(articles)
 
         logger.info(f"Fetched {saved} articles from {source.name}")
+        if saved:
+            invalidate_response_cache()
 
         return {
             "status": "success",
@@ -121,6 +125,8 @@ def fetch_gdelt_news(self):
         fetcher = GDELTFetcher()
         count = fetcher.fetch_strategic_news(db)
         logger.info(f"GDELT fetch complete. New articles: {count}")
+        if count:
+            invalidate_response_cache()
         return {"status": "success", "articles_fetched": count}
     except Exception as e:
         logger.error(f"Error fetching from GDELT: {e}")
@@ -148,6 +154,8 @@ def fetch_twitter_news(self):
         results = fetcher.fetch_strategic_tweets(db)
         total = sum(results.values())
         logger.info(f"Twitter fetch complete. New tweets: {total}")
+        if total:
+            invalidate_response_cache()
         return {"status": "success", "tweets_fetched": total, "by_account": results}
     except Exception as e:
         logger.error(f"Error fetching from Twitter: {e}")
@@ -174,6 +182,8 @@ def fetch_newsapi_news(self):
         fetcher = NewsAPIFetcher(settings.newsapi_key)
         count = fetcher.fetch_strategic_news(db)
         logger.info(f"NewsAPI fetch complete. New articles: {count}")
+        if count:
+            invalidate_response_cache()
         return {"status": "success", "articles_fetched": count}
     except Exception as e:
         logger.error(f"Error fetching from NewsAPI: {e}")
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+from typing import List
+from groq import AsyncGroq
+from sqlalchemy import select, text, update
+from sqlalchemy.orm import Session
+from app.celery_app import celery_app
+from app.database import SessionLocal, engine
+from app.models.article import Article, RelevanceLevel
+from app.cache import invalidate_response_cache
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Articles rescored per bulk UPDATE/commit when reprocessing
+REPROCESS_BATCH_SIZE = 500
+
+
+def _delete_articles(db: Session, article_ids: List[int], batch_size: int = 10000) -> int:
+    """Delete articles by id with bulk DELETE statements and commit"""
+    for start in range(0, len(article_ids), batch_size):
+        db.query(Article).filter(
+            Article.id.in_(article_ids[start:start + batch_size])
+        ).delete(synchronize_session=False)
+    db.commit()
+
+    if article_ids:
+        invalidate_response_cache()
+    return len(article_ids)
+
+
+def _bulk_update_articles(db: Session, rows: List[dict]):
+    """Apply per-article column values (each dict includes "id") and commit"""
+    if rows:
+        db.execute(update(Article), rows)
+    db.commit()
+
+
+@celery_app.task(name="app.tasks.maintenance.refresh_country_hotspots")
+def refresh_country_hotspots():
+    """
+    Refresh mv_country_hotspots once per processing cycle (scheduled by beat)
+    rather than after every commit. Errors propagate, so a stale view shows up
+    as a failed task instead of a warning.
+    """
+    with engine.connect() as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_country_hotspots"))
+        conn.commit()
+
+
+@celery_app.task(bind=True, name="app.tasks.maintenance.cleanup_irrelevant_articles")
+def cleanup_irrelevant_articles(self):
+    """
+    Remove articles that fail the relevance filter.
+    """
+    from app.services.relevance_filter import is_relevant_article
+
+    db = SessionLocal()
+    try:
+        # Stream only the columns the filter needs, then delete in bulk
+        rows = db.query(Article.id, Article.title, Article.original_content).yield_per(1000)
+        to_delete = []
+        kept_count = 0
+
+        for article_id, title, content in rows:
+            is_relevant, reason = is_relevant_article(title, content)
+            if not is_relevant:
+                to_delete.append(article_id)
+            else:
+                kept_count += 1
+
+        deleted_count = _delete_articles(db, to_delete)
+        logger.info(f"Irrelevant cleanup: deleted {deleted_count}, kept {kept_count}")
+        return {"status": "success", "deleted": deleted_count, "kept": kept_count}
+
+    except Exception as e:
+        logger.error(f"Error in cleanup_irrelevant_articles: {e}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, name="app.tasks.maintenance.cleanup_duplicate_articles")
+def cleanup_duplicate_articles(self):
+    """
+    Remove articles whose title is similar to an older article's.
+    """
+    from app.services.news_fetcher import SimilarTitleIndex
+
+    db = SessionLocal()
+    try:
+        rows = db.query(Article.id, Article.title).order_by(Article.created_at.asc()).yield_per(1000)
+        seen_titles = SimilarTitleIndex()
+        to_delete = []
+        kept_count = 0
+
+        for article_id, title in rows:
+            if seen_titles.has_similar(title):
+                to_delete.append(article_id)
+            else:
+                seen_titles.add(title)
+                kept_count += 1
+
+        deleted_count = _delete_articles(db, to_delete)
+        logger.info(f"Duplicate cleanup: deleted {deleted_count}, kept {kept_count}")
+        return {"status": "success", "deleted": deleted_count, "kept": kept_count}
+
+    except Exception as e:
+        logger.error(f"Error in cleanup_duplicate_articles: {e}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+@celery_app.task(bind=True, name="app.tasks.maintenance.reprocess_article_scores")
+def reprocess_article_scores(self):
+    """
+    Recalculate keyword relevance scores for all articles.
+    """
+    from app.services.relevance_scorer import get_relevance_scorer
+
+    db = SessionLocal()
+    try:
+        scorer = get_relevance_scorer()
+        updated_count = 0
+
+        # Read through one server-side cursor on its own connection, since the
+        # session commits each batch (which would close a cursor it owned), and
+        # write each batch with one bulk UPDATE
+        query = select(
+            Article.id, Article.title, Article.original_content,
+            Article.region, Article.country, Article.theme, Article.domain
+        ).order_by(Article.id)
+
+        with engine.connect() as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=REPROCESS_BATCH_SIZE
+            ).execute(query)
+
+            for rows in result.partitions():
+                batch = []
+                for row in rows:
+                    content = row.original_content or ""
+                    scores = scorer.calculate_scores(row.title, content)
+                    values = {
+                        "id": row.id,
+                        "geo_score": scores["geo_score"],
+                        "military_score": scores["military_score"],
+                        "diplomatic_score": scores["diplomatic_score"],
+                        "economic_score": scores["economic_score"],
+                        "relevance_score": scores["relevance_score"],
+                        "relevance_level": RelevanceLevel(scores["relevance_level"]),
+                        "region": row.region,
+                        "country": row.country,
+                        "theme": row.theme,
+                        "domain": row.domain,
+                    }
+
+                    # Update region/theme if empty
+                    if not row.region or not row.theme:
+                        classification = scorer.extract_region_theme(row.title, content)
+                        for field in ("region", "country", "theme", "domain"):
+                            if not values[field]:
+                                values[field] = classification.get(field)
+
+                    batch.append(values)
+
+                _bulk_update_articles(db, batch)
+                updated_count += len(batch)
+
+        invalidate_response_cache()
+
+        logger.info(f"Reprocessed {updated_count} articles with keyword scoring")
+        return {"status": "success", "updated": updated_count}
+
+    except Exception as e:
+        logger.error(f"Error in reprocess_article_scores: {e}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
+
+
+async def _score_with_llm(llm_scorer, rows):
+    """Score rows concurrently, bounded by llm_max_concurrency"""
+    semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+    # Each asyncio.run gets its own loop, so use a client scoped to it
+    async with AsyncGroq(api_key=settings.groq_api_key) as client:
+        async def score(row):
+            async with semaphore:
+                return await llm_scorer.score_article_async(
+                    row.title, row.original_content or "", client=client
+                )
+
+        return await asyncio.gather(*(score(row) for row in rows), return_exceptions=True)
+
+
+@celery_app.task(bind=True, name="app.tasks.maintenance.reprocess_with_llm")
+def reprocess_with_llm(self, limit: int = 50):
+    """
+    Rescore the lowest-scored articles with the LLM scorer.
+    """
+    from app.services.llm_scorer import get_llm_scorer
+    from app.services.relevance_scorer import get_relevance_scorer
+
+    if not settings.groq_api_key:
+        return {"status": "skipped", "reason": "Groq API key not configured"}
+
+    db = SessionLocal()
+    try:
+        llm_scorer = get_llm_scorer()
+        keyword_scorer = get_relevance_scorer()
+
+        # Get articles to reprocess (prioritize unprocessed or low-scored)
+        rows = db.query(
+            Article.id, Article.title, Article.original_content,
+            Article.region, Article.country, Article.theme, Article.domain
+        ).order_by(
+            Article.relevance_score.asc()
+        ).limit(limit).all()
+
+        results = asyncio.run(_score_with_llm(llm_scorer, rows))
+
+        high_count = 0
+        errors = []
+        batch = []
+
+        for row, result in zip(rows, results):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                content = row.original_content or ""
+
+                # Update keyword scores for display
+                keyword_scores = keyword_scorer.calculate_scores(row.title, content)
+
+                classification = result.get("classification", {})
+                batch.append({
+                    "id": row.id,
+                    "relevance_score": result["relevance_score"],
+                    "relevance_level": RelevanceLevel(result["relevance_level"]),
+                    "region": classification.get("region", row.region),
+                    "country": classification.get("country", row.country),
+                    "theme": classification.get("theme", row.theme),
+                    "domain": classification.get("domain", row.domain),
+                    "geo_score": keyword_scores["geo_score"],
+                    "military_score": keyword_scores["military_score"],
+                    "diplomatic_score": keyword_scores["diplomatic_score"],
+                    "economic_score": keyword_scores["economic_score"],
+                })
+
+                if result["relevance_level"] == "high":
+                    high_count += 1
+
+            except Exception as e:
+                errors.append(f"Article {row.id}: {str(e)[:100]}")
+                continue
+
+        _bulk_update_articles(db, batch)
+        invalidate_response_cache()
+
+        logger.info(f"LLM reprocessed {len(batch)} articles ({len(errors)} errors)")
+        return {
+            "status": "success",
+            "updated": len(batch),
+            "high_relevance": high_count,
+            "errors": len(errors),
+            "error_details": errors[:5] if errors else []
+        }
+
+    except Exception as e:
+        logger.error(f"Error in reprocess_with_llm: {e}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        db.close()
@@ -1,15 +1,133 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import func, text
+from sqlalchemy.orm import undefer
 from app.celery_app import celery_app
 from app.database import SessionLocal
 from app.models.article import Article, RelevanceLevel
 from app.services.ai_analyzer import get_ai_analyzer
 from app.services.relevance_scorer import get_relevance_scorer
 from app.services.llm_scorer import get_llm_scorer
+from app.services.llm_cache import cache_stats
 from app.config import settings
+from app.cache import invalidate_response_cache
 
 logger = logging.getLogger(__name__)
 
+# How far back to look for an analyzed near-duplicate to reuse, and how much of
+# its content has to match as well as the title
+ANALYSIS_REUSE_HOURS = 72
+ANALYSIS_REUSE_CONTENT_CHARS = 500
+
+
+def _apply_analysis(article: Article, analysis: dict):
+    """Store an AIAnalyzer analysis's summaries and entities on the article"""
+    summary = analysis.get("summary", {})
+    # Failed summaries are stored as NULL, never "" (see reprocess-without-summary)
+    article.summary_bullets = summary.get("bullets") or None
+    article.summary_what_happened = summary.get("what_happened", "")
+    article.summary_why_matters = summary.get("why_matters", "")
+    article.summary_india_implications = summary.get("india_implications", "")
+    article.summary_future_developments = summary.get("future_developments", "")
+    article.entities = analysis.get("entities", [])
+
+
+async def _analyze_with_llm(analyzer, items):
+    """Run the batched full analysis on a client scoped to this event loop"""
+    async with analyzer.async_client() as client:
+        return await analyzer.aanalyze_articles_batch(items, client)
+
+
+def _stored_analysis(article: Article) -> dict:
+    """An analyzed article's summaries and entities, in the shape _apply_analysis takes"""
+    return {
+        "summary": {
+            "bullets": article.summary_bullets,
+            "what_happened": article.summary_what_happened,
+            "why_matters": article.summary_why_matters,
+            "india_implications": article.summary_india_implications,
+            "future_developments": article.summary_future_developments
+        },
+        "entities": article.entities
+    }
+
+
+def _find_analyzed_near_duplicate(db, article: Article, content: str) -> Optional[Article]:
+    """
+    A recent, fully analyzed article that near-duplicates this one: pg_trgm similarity
+    >= analysis_reuse_similarity on the title (filtered by ix_articles_title_trgm, see
+    _set_trgm_threshold) and on the first ANALYSIS_REUSE_CONTENT_CHARS of content.
+    Trigrams ignore word order, so the content check keeps e.g. "India condemns
+    Pakistan strike" from matching "Pakistan condemns India strike".
+    """
+    prefix = content[:ANALYSIS_REUSE_CONTENT_CHARS]
+    if not prefix.strip():
+        return None
+
+    return db.query(Article).options(
+        undefer(Article.summary_what_happened),
+        undefer(Article.summary_why_matters),
+        undefer(Article.summary_india_implications),
+        undefer(Article.summary_future_developments)
+    ).filter(
+        Article.title.op("%")(article.title),
+        func.similarity(
+            func.left(Article.original_content, ANALYSIS_REUSE_CONTENT_CHARS), prefix
+        ) >= settings.analysis_reuse_similarity,
+        Article.id != article.id,
+        Article.is_processed == 1,
+        Article.summary_what_happened != "",
+        Article.created_at >= datetime.utcnow() - timedelta(hours=ANALYSIS_REUSE_HOURS)
+    ).order_by(func.similarity(Article.title, article.title).desc()).first()
+
+
+def _set_trgm_threshold(db, threshold: float):
+    """Make the % operator (and its index scan) filter at threshold for this transaction"""
+    db.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)}
+    )
+
+
+def _analyze_high_articles(db, analyzer, high_articles) -> int:
+    """
+    Run the full analysis over (article, content) pairs, several articles per
+    LLM call with the calls in parallel. Articles that near-duplicate a recently
+    analyzed one reuse its analysis instead. Returns the number analyzed.
+    """
+    analyzed = 0
+    if settings.analysis_reuse_similarity:
+        _set_trgm_threshold(db, settings.analysis_reuse_similarity)
+        remaining = []
+        for article, content in high_articles:
+            twin = _find_analyzed_near_duplicate(db, article, content)
+            if twin is None:
+                remaining.append((article, content))
+                continue
+            logger.debug(f"Reusing analysis of article {twin.id} for near-duplicate {article.id}")
+            _apply_analysis(article, _stored_analysis(twin))
+            analyzed += 1
+        high_articles = remaining
+        if not high_articles:
+            return analyzed
+
+    try:
+        analyses = asyncio.run(_analyze_with_llm(
+            analyzer, [(article.title, content) for article, content in high_articles]
+        ))
+    except Exception as e:
+        analyses = [e] * len(high_articles)
+
+    for (article, _), analysis in zip(high_articles, analyses):
+        if isinstance(analysis, Exception):
+            logger.warning(f"AI summary failed for article {article.id}: {analysis}")
+            continue
+        _apply_analysis(article, analysis)
+        analyzed += 1
+    return analyzed
+
 
 @celery_app.task(bind=True, name="app.tasks.process_articles.process_pending_articles")
 def process_pending_articles(self, batch_size: int = 10):
@@ -20,7 +138,7 @@ def process_pending_articles(self, batch_size: int = 10):
     db = SessionLocal()
     try:
         # Get unprocessed articles
-        articles = db.query(Article).filter(
+        articles = db.query(Article).options(undefer(Article.original_content)).filter(
             Article.is_processed == 0
         ).order_by(Article.created_at.desc()).limit(batch_size).all()
 
@@ -32,6 +150,9 @@ def process_pending_articles(self, batch_size: int = 10):
         llm_scorer = get_llm_scorer() if settings.groq_api_key else None
         keyword_scorer = get_relevance_scorer()  # Fallback
 
+        analyzer = get_ai_analyzer() if settings.groq_api_key else None
+        high_articles = []
+
         processed_count = 0
         llm_scored_count = 0
         ai_summarized_count = 0
@@ -114,27 +235,16 @@ def process_pending_articles(self, batch_size: int = 10):
 
                 # Generate AI summaries based on relevance level
                 if settings.groq_api_key:
-                    try:
-                        analyzer = get_ai_analyzer()
-
-                        # HIGH relevance: full analysis (bullets + strategic summary + entities)
-                        if article.relevance_level == RelevanceLevel.HIGH:
-                            analysis = analyzer.analyze_article(article.title, content)
-                            summary = analysis.get("summary", {})
-                            article.summary_bullets = summary.get("bullets", "")
-                            article.summary_what_happened = summary.get("what_happened", "")
-                            article.summary_why_matters = summary.get("why_matters", "")
-                            article.summary_india_implications = summary.get("india_implications", "")
-                            article.summary_future_developments = summary.get("future_developments", "")
-                            article.entities = analysis.get("entities", [])
-                        else:
-                            # MEDIUM and LOW: just bullet summary (lighter processing, saves API costs)
-                            article.summary_bullets = analyzer.generate_bullet_summary(article.title, content)
-
-                        ai_summarized_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"AI summary failed for article {article.id}: {e}")
+                    # HIGH relevance: full analysis, batched after the loop
+                    if article.relevance_level == RelevanceLevel.HIGH:
+                        high_articles.append((article, content))
+                    else:
+                        # MEDIUM and LOW: just bullet summary (lighter processing, saves API costs)
+                        try:
+                            article.summary_bullets = analyzer.generate_bullet_summary(article.title, content) or None
+                            ai_summarized_count += 1
+                        except Exception as e:
+                            logger.warning(f"AI summary failed for article {article.id}: {e}")
 
                 article.is_processed = 1
                 processed_count += 1
@@ -144,7 +254,12 @@ def process_pending_articles(self, batch_size: int = 10):
                 article.is_processed = 2  # Mark as failed
                 article.processing_error = str(e)[:500]
 
+        # Full analysis for HIGH articles, several per LLM call
+        if high_articles:
+            ai_summarized_count += _analyze_high_articles(db, analyzer, high_articles)
+
         db.commit()
+        invalidate_response_cache()
 
         logger.info(f"Processed {processed_count} articles: {llm_scored_count} LLM-scored, {ai_summarized_count} AI-summarized")
 
@@ -152,7 +267,8 @@ def process_pending_articles(self, batch_size: int = 10):
             "status": "success",
             "processed": processed_count,
             "llm_scored": llm_scored_count,
-            "ai_summarized": ai_summarized_count
+            "ai_summarized": ai_summarized_count,
+            "llm_cache": cache_stats()
         }
 
     except Exception as e:
@@ -169,7 +285,9 @@ def process_single_article(self, article_id: int):
     """
     db = SessionLocal()
     try:
-        article = db.query(Article).filter(Article.id == article_id).first()
+        article = db.query(Article).options(
+            undefer(Article.original_content)
+        ).filter(Article.id == article_id).first()
 
         if not article:
             return {"status": "error", "error": "Article not found"}
@@ -197,11 +315,7 @@ def process_single_article(self, article_id: int):
                 article.original_content or ""
             )
 
-            summary = analysis.get("summary", {})
-            article.summary_what_happened = summary.get("what_happened", "")
-            article.summary_why_matters = summary.get("why_matters", "")
-            article.summary_india_implications = summary.get("india_implications", "")
-            article.summary_future_developments = summary.get("future_developments", "")
+            _apply_analysis(article, analysis)
 
             classification = analysis.get("classification", {})
             article.region = classification.get("region")
@@ -209,10 +323,9 @@ def process_single_article(self, article_id: int):
             article.theme = classification.get("theme")
             article.domain = classification.get("domain")
 
-            article.entities = analysis.get("entities", [])
-
         article.is_processed = 1
         db.commit()
+        invalidate_response_cache()
 
         return {
             "status": "success",
@@ -243,6 +356,7 @@ def cleanup_old_articles(days: int = 90):
         ).delete()
 
         db.commit()
+        invalidate_response_cache()
 
         logger.info(f"Cleaned up {deleted} old articles")
 
@@ -270,6 +384,7 @@ def reprocess_all_articles():
         # Reset all articles to unprocessed
         updated = db.query(Article).update({Article.is_processed: 0})
         db.commit()
+        invalidate_response_cache()
 
         logger.info(f"Marked {updated} articles for reprocessing")
 
@@ -0,0 +1,323 @@
+"""Baseline schema (formerly applied by run_migrations on startup)
+
+Every statement is idempotent, so this upgrades both fresh databases and ones
+already migrated by the old startup checks; the latter can also just run
+`alembic stamp 0001`. The tables are spelled out as they stood at this
+revision rather than created from the live models, so later model changes
+only ever reach the database through their own revisions.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# Native enums store member names, as SQLAlchemy's Enum type does
+ENUM_TYPES = {
+    "relevancelevel": ("HIGH", "MEDIUM", "LOW"),
+    "sourcetype": ("RSS", "API", "SCRAPE"),
+    "sourcecategory": ("NEWS_AGENCY", "THINK_TANK", "GOVERNMENT", "MILITARY", "ACADEMIC"),
+    "alertfrequency": ("IMMEDIATE", "HOURLY", "DAILY", "WEEKLY"),
+    "userrole": ("ADMIN", "ANALYST"),
+}
+
+TABLES = [
+    """CREATE TABLE IF NOT EXISTS sources (
+    id SERIAL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL UNIQUE,
+    url VARCHAR(2000) NOT NULL,
+    feed_url VARCHAR(2000),
+    source_type sourcetype,
+    category sourcecategory,
+    country VARCHAR(100),
+    language VARCHAR(10),
+    description VARCHAR(1000),
+    reliability_score INTEGER,
+    bias_rating VARCHAR(50),
+    is_active BOOLEAN,
+    fetch_interval_minutes INTEGER,
+    last_fetched_at TIMESTAMP WITH TIME ZONE,
+    last_fetch_status VARCHAR(50),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE
+)""",
+    """CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    email VARCHAR(255) NOT NULL,
+    username VARCHAR(100) NOT NULL,
+    hashed_password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(255),
+    organization VARCHAR(255),
+    role userrole,
+    is_active BOOLEAN,
+    is_verified BOOLEAN,
+    preferred_regions VARCHAR(500),
+    preferred_themes VARCHAR(500),
+    dark_mode BOOLEAN,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    last_login_at TIMESTAMP WITH TIME ZONE
+)""",
+    """CREATE TABLE IF NOT EXISTS alerts (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    name VARCHAR(255) NOT NULL,
+    regions JSON,
+    countries JSON,
+    themes JSON,
+    domains JSON,
+    keywords JSON,
+    min_relevance VARCHAR(10),
+    frequency alertfrequency,
+    is_active BOOLEAN,
+    email_enabled BOOLEAN,
+    last_triggered_at TIMESTAMP WITH TIME ZONE,
+    trigger_count INTEGER,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE
+)""",
+    """CREATE TABLE IF NOT EXISTS articles (
+    id SERIAL PRIMARY KEY,
+    title VARCHAR(500) NOT NULL,
+    original_content TEXT,
+    url VARCHAR(2000) NOT NULL UNIQUE,
+    published_at TIMESTAMP WITH TIME ZONE,
+    author VARCHAR(255),
+    image_url VARCHAR(2000),
+    source_id INTEGER NOT NULL REFERENCES sources (id),
+    summary_bullets TEXT,
+    summary_what_happened TEXT,
+    summary_why_matters TEXT,
+    summary_india_implications TEXT,
+    summary_future_developments TEXT,
+    relevance_level relevancelevel,
+    relevance_score FLOAT,
+    geo_score FLOAT,
+    military_score FLOAT,
+    diplomatic_score FLOAT,
+    economic_score FLOAT,
+    is_priority BOOLEAN,
+    region VARCHAR(100),
+    country VARCHAR(100),
+    theme VARCHAR(100),
+    domain VARCHAR(50),
+    entities JSON,
+    is_processed INTEGER,
+    processing_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE
+)""",
+]
+
+# Column indexes the models declared with index=True / unique=True
+TABLE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_sources_id ON sources (id)",
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)",
+    "CREATE INDEX IF NOT EXISTS ix_alerts_id ON alerts (id)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_id ON articles (id)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_title ON articles (title)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_is_priority ON articles (is_priority)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_region ON articles (region)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_country ON articles (country)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_theme ON articles (theme)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_domain ON articles (domain)",
+]
+
+COUNTRY_HOTSPOTS_VIEW_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_country_hotspots AS "
+    "SELECT lower(trim(country)) AS country_key, count(*) AS total, "
+    "count(*) FILTER (WHERE relevance_level = 'HIGH') AS high_count "
+    "FROM articles WHERE is_processed = 1 AND country IS NOT NULL "
+    "GROUP BY lower(trim(country))"
+)
+
+# Running article totals for /dashboard/stats. Keys: total, pending, high,
+# medium, low (the relevance keys count processed articles only).
+#
+# Statement-level triggers: each INSERT/UPDATE/DELETE statement sums its
+# per-key deltas from the transition tables and applies them in one pass,
+# locking the counter rows in key order first so concurrent writers always
+# take those locks in the same order and cannot deadlock on them.
+ARTICLE_COUNTER_KEY_SQL = (
+    "CASE WHEN {row}.is_processed = 0 THEN 'pending' "
+    "WHEN {row}.is_processed = 1 THEN lower({row}.relevance_level::text) END"
+)
+
+ARTICLE_COUNTERS_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION article_counters_apply() RETURNS trigger AS $$
+DECLARE
+    keys text[];
+    deltas bigint[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(key ORDER BY key), array_agg(delta ORDER BY key) INTO keys, deltas
+        FROM (
+            SELECT 'total' AS key, count(*) AS delta FROM new_rows
+            UNION ALL
+            SELECT {ARTICLE_COUNTER_KEY_SQL.format(row="n")}, count(*) FROM new_rows n GROUP BY 1
+        ) d
+        WHERE key IS NOT NULL AND delta <> 0;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(key ORDER BY key), array_agg(delta ORDER BY key) INTO keys, deltas
+        FROM (
+            SELECT 'total' AS key, -count(*) AS delta FROM old_rows
+            UNION ALL
+            SELECT {ARTICLE_COUNTER_KEY_SQL.format(row="o")}, -count(*) FROM old_rows o GROUP BY 1
+        ) d
+        WHERE key IS NOT NULL AND delta <> 0;
+    ELSE
+        SELECT array_agg(key ORDER BY key), array_agg(delta ORDER BY key) INTO keys, deltas
+        FROM (
+            SELECT key, sum(delta) AS delta FROM (
+                SELECT {ARTICLE_COUNTER_KEY_SQL.format(row="o")} AS key, -1 AS delta FROM old_rows o
+                UNION ALL
+                SELECT {ARTICLE_COUNTER_KEY_SQL.format(row="n")}, 1 FROM new_rows n
+            ) c
+            WHERE key IS NOT NULL
+            GROUP BY key
+        ) d
+        WHERE delta <> 0;
+    END IF;
+
+    IF keys IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM 1 FROM article_counters WHERE key = ANY(keys) ORDER BY key FOR UPDATE;
+    UPDATE article_counters c SET value = c.value + d.delta
+    FROM unnest(keys, deltas) AS d(key, delta)
+    WHERE c.key = d.key;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Transition tables need one trigger per event and no column list
+ARTICLE_COUNTERS_TRIGGERS_SQL = """
+CREATE OR REPLACE TRIGGER trg_article_counters_insert
+    AFTER INSERT ON articles REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION article_counters_apply();
+CREATE OR REPLACE TRIGGER trg_article_counters_update
+    AFTER UPDATE ON articles REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION article_counters_apply();
+CREATE OR REPLACE TRIGGER trg_article_counters_delete
+    AFTER DELETE ON articles REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION article_counters_apply()
+"""
+
+# Attach the triggers and backfill with writers blocked, so the counters start out exact.
+# trg_article_counters is the row-level trigger the old startup checks installed.
+ARTICLE_COUNTERS_TRIGGER_SQL = f"""
+LOCK TABLE articles IN SHARE MODE;
+DROP TRIGGER IF EXISTS trg_article_counters ON articles;
+{ARTICLE_COUNTERS_TRIGGERS_SQL.strip()};
+INSERT INTO article_counters (key, value)
+SELECT kv.key, kv.value FROM (
+    SELECT count(*) AS total,
+           count(*) FILTER (WHERE is_processed = 0) AS pending,
+           count(*) FILTER (WHERE is_processed = 1 AND relevance_level = 'HIGH') AS high,
+           count(*) FILTER (WHERE is_processed = 1 AND relevance_level = 'MEDIUM') AS medium,
+           count(*) FILTER (WHERE is_processed = 1 AND relevance_level = 'LOW') AS low
+    FROM articles
+) c CROSS JOIN LATERAL (VALUES
+    ('total', c.total), ('pending', c.pending),
+    ('high', c.high), ('medium', c.medium), ('low', c.low)
+) AS kv(key, value)
+ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+"""
+
+INDEXES = [
+    # Article feed sort key (api/articles.py), partial on processed rows since
+    # every list endpoint filters is_processed = 1
+    "CREATE INDEX IF NOT EXISTS ix_articles_processed_feed_order ON articles ("
+    "COALESCE(is_priority, false) DESC, COALESCE(relevance_score, 0) DESC, "
+    "COALESCE(published_at, created_at) DESC, id DESC) "
+    "WHERE is_processed = 1",
+    # Trigram indexes so the substring ILIKE search can use an index
+    "CREATE INDEX IF NOT EXISTS ix_articles_title_trgm ON articles USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_content_trgm ON articles USING gin (original_content gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vec ON articles USING gin (search_vec)",
+    # Per-region/theme/country counts of processed articles (list and dashboard endpoints)
+    "CREATE INDEX IF NOT EXISTS ix_articles_processed_region ON articles (region) "
+    "WHERE is_processed = 1 AND region IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_articles_processed_theme ON articles (theme) "
+    "WHERE is_processed = 1 AND theme IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_articles_processed_country ON articles (country) "
+    "WHERE is_processed = 1 AND country IS NOT NULL",
+    # Dashboard relevance counts and recent-high-impact (newest first per level)
+    "CREATE INDEX IF NOT EXISTS ix_articles_processed_relevance ON articles "
+    "(relevance_level, published_at DESC) WHERE is_processed = 1",
+    # Time-window counts (/dashboard/stats, /dashboard/trends)
+    "CREATE INDEX IF NOT EXISTS ix_articles_created_relevance ON articles (created_at, relevance_level)",
+    # Per-source article counts (/api/sources) and source filters
+    "CREATE INDEX IF NOT EXISTS ix_articles_source_id ON articles (source_id)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_missing_summary ON articles (id) "
+    "WHERE summary_bullets IS NULL AND is_processed = 1",
+    # A user's alerts in list order (get_alerts), read without a sort step
+    "CREATE INDEX IF NOT EXISTS ix_alerts_user_created ON alerts (user_id, created_at DESC)",
+]
+
+
+def upgrade():
+    # CREATE TYPE has no IF NOT EXISTS
+    for name, values in ENUM_TYPES.items():
+        labels = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"DO $$ BEGIN CREATE TYPE {name} AS ENUM ({labels}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+    # Tables as of this revision (no-op for tables that already exist)
+    for ddl in TABLES:
+        op.execute(ddl)
+    for ddl in TABLE_INDEXES:
+        op.execute(ddl)
+
+    # Columns added after the first release
+    op.execute("ALTER TABLE articles ADD COLUMN IF NOT EXISTS is_priority BOOLEAN DEFAULT FALSE")
+    op.execute("ALTER TABLE articles ADD COLUMN IF NOT EXISTS summary_bullets TEXT")
+    op.execute(
+        "ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vec tsvector GENERATED ALWAYS AS "
+        "(to_tsvector('english', coalesce(title, '') || ' ' || coalesce(original_content, ''))) STORED"
+    )
+    # Missing summaries are stored as NULL; normalize legacy empty strings
+    op.execute("UPDATE articles SET summary_bullets = NULL WHERE summary_bullets = ''")
+
+    # Replaced by the partial ix_articles_processed_feed_order
+    op.execute("DROP INDEX IF EXISTS ix_articles_feed_order")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for ddl in INDEXES:
+        op.execute(ddl)
+
+    op.execute(COUNTRY_HOTSPOTS_VIEW_SQL)
+    # Required for REFRESH ... CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_country_hotspots_key "
+        "ON mv_country_hotspots (country_key)"
+    )
+
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS article_counters "
+        "(key TEXT PRIMARY KEY, value BIGINT NOT NULL DEFAULT 0)"
+    )
+    op.execute(ARTICLE_COUNTERS_FUNCTION_SQL)
+    op.execute(ARTICLE_COUNTERS_TRIGGER_SQL)
+
+
+def downgrade():
+    # Drops the derived objects; the tables and their data are left in place
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_article_counters_{event} ON articles")
+    op.execute("DROP FUNCTION IF EXISTS article_counters_apply()")
+    op.execute("DROP TABLE IF EXISTS article_counters")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_country_hotspots")
+    for ddl in INDEXES:
+        name = ddl.split("IF NOT EXISTS ", 1)[1].split(" ", 1)[0]
+        op.execute(f"DROP INDEX IF EXISTS {name}")
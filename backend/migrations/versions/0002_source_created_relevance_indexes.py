@@ -0,0 +1,40 @@
+"""Index articles by (source_id, created_at) and by relevance_score
+
+(source_id, created_at) backs the per-source article counts and source-filtered
+lists, and supersedes ix_articles_source_id. relevance_score backs the
+lowest-scored-first scan in the LLM reprocess task.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction, but avoids blocking writes
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_source_created "
+            "ON articles (source_id, created_at)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_relevance_score "
+            "ON articles (relevance_score)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_source_id")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_source_id "
+            "ON articles (source_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_relevance_score")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_source_created")
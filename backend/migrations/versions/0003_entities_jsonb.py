@@ -0,0 +1,33 @@
+"""Store Article.entities as JSONB with a jsonb_path_ops GIN index
+
+Containment lookups such as entities @> '[{"name": "China"}]' (the article
+list's entity filter) go through the index instead of scanning every row.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE articles ALTER COLUMN entities TYPE jsonb USING entities::jsonb")
+    op.execute("UPDATE articles SET entities = '[]'::jsonb WHERE entities IS NULL OR entities = 'null'::jsonb")
+    op.execute("ALTER TABLE articles ALTER COLUMN entities SET DEFAULT '[]'::jsonb")
+    op.execute("ALTER TABLE articles ALTER COLUMN entities SET NOT NULL")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_articles_entities_gin "
+        "ON articles USING gin (entities jsonb_path_ops)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_articles_entities_gin")
+    op.execute("ALTER TABLE articles ALTER COLUMN entities DROP NOT NULL")
+    op.execute("ALTER TABLE articles ALTER COLUMN entities DROP DEFAULT")
+    op.execute("ALTER TABLE articles ALTER COLUMN entities TYPE json USING entities::json")
@@ -0,0 +1,37 @@
+"""Index region-filtered feeds in feed order; drop the is_priority index
+
+ix_articles_processed_region_feed_order lets /api/articles?region=... read a
+page straight off the index in FEED_ORDER_BY order. The single-column boolean
+ix_articles_is_priority is dropped: is_priority is never filtered on alone, and
+the feed-order indexes already lead with it.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_processed_region_feed_order "
+            "ON articles (region, COALESCE(is_priority, false) DESC, "
+            "COALESCE(relevance_score, 0) DESC, COALESCE(published_at, created_at) DESC, id DESC) "
+            "WHERE is_processed = 1"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_is_priority")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_is_priority "
+            "ON articles (is_priority)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_processed_region_feed_order")
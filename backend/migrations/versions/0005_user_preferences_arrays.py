@@ -0,0 +1,48 @@
+"""Store user preferred regions/themes as text[] with GIN indexes
+
+Converts the comma-separated strings in place (whitespace around commas and
+empty entries are dropped; NULL becomes '{}').
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("preferred_regions", "preferred_themes")
+
+
+def upgrade():
+    bind = op.get_bind()
+    for column in COLUMNS:
+        data_type = bind.execute(sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'users' AND column_name = :column"
+        ), {"column": column}).scalar()
+        # Databases created from the current models already have the array type
+        if data_type != "ARRAY":
+            op.execute(
+                f"ALTER TABLE users ALTER COLUMN {column} TYPE varchar(100)[] USING "
+                f"array_remove(string_to_array(regexp_replace(btrim(coalesce({column}, '')), "
+                f"'\\s*,\\s*', ',', 'g'), ','), '')"
+            )
+        op.execute(f"ALTER TABLE users ALTER COLUMN {column} SET DEFAULT '{{}}'")
+        op.execute(f"ALTER TABLE users ALTER COLUMN {column} SET NOT NULL")
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_users_{column}_gin ON users USING gin ({column})")
+
+
+def downgrade():
+    for column in COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_users_{column}_gin")
+        op.execute(f"ALTER TABLE users ALTER COLUMN {column} DROP NOT NULL")
+        op.execute(f"ALTER TABLE users ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE users ALTER COLUMN {column} TYPE varchar(500) "
+            f"USING nullif(array_to_string({column}, ','), '')"
+        )
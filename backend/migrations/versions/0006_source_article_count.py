@@ -0,0 +1,53 @@
+"""Denormalize the per-source article count onto sources.article_count
+
+A row trigger on articles keeps the count current, so the sources list reads
+it off each row instead of joining and grouping articles.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+SOURCE_ARTICLE_COUNT_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION source_article_count_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE sources SET article_count = article_count - 1 WHERE id = OLD.source_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE sources SET article_count = article_count + 1 WHERE id = NEW.source_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Attach the trigger and backfill with writers blocked, so the counts start out exact
+SOURCE_ARTICLE_COUNT_TRIGGER_SQL = """
+LOCK TABLE articles IN SHARE MODE;
+CREATE OR REPLACE TRIGGER trg_source_article_count
+    AFTER INSERT OR DELETE OR UPDATE OF source_id ON articles
+    FOR EACH ROW EXECUTE FUNCTION source_article_count_apply();
+UPDATE sources s SET article_count = (
+    SELECT count(*) FROM articles a WHERE a.source_id = s.id
+)
+"""
+
+
+def upgrade():
+    op.execute("ALTER TABLE sources ADD COLUMN IF NOT EXISTS article_count INTEGER NOT NULL DEFAULT 0")
+    op.execute(SOURCE_ARTICLE_COUNT_FUNCTION_SQL)
+    op.execute(SOURCE_ARTICLE_COUNT_TRIGGER_SQL)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS trg_source_article_count ON articles")
+    op.execute("DROP FUNCTION IF EXISTS source_article_count_apply()")
+    op.execute("ALTER TABLE sources DROP COLUMN IF EXISTS article_count")
@@ -0,0 +1,40 @@
+"""Store the article relevance scores as real (float4) instead of double precision
+
+Scores are 0-1 rounded to three decimals, so float4 loses nothing that matters
+and halves the width of the five score columns and of ix_articles_relevance_score.
+All five columns change in one ALTER TABLE, i.e. a single table rewrite.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+COLUMNS = ("relevance_score", "geo_score", "military_score", "diplomatic_score", "economic_score")
+
+
+def _alter_scores(type_name: str):
+    op.execute(
+        "ALTER TABLE articles "
+        + ", ".join(f"ALTER COLUMN {column} TYPE {type_name}" for column in COLUMNS)
+    )
+
+
+def upgrade():
+    data_type = op.get_bind().execute(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'articles' AND column_name = 'relevance_score'"
+    )).scalar()
+    # Databases created from the current models already have real columns
+    if data_type != "real":
+        _alter_scores("real")
+
+
+def downgrade():
+    _alter_scores("double precision")
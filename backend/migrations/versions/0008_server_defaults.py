@@ -0,0 +1,71 @@
+"""Move column defaults from Python to the database (server defaults)
+
+INSERTs, ORM and bulk alike, can then leave these columns out and let
+Postgres fill them in, instead of SQLAlchemy sending every default value.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+# table -> {column: default expression}; enums are stored by member name
+SERVER_DEFAULTS = {
+    "articles": {
+        "relevance_level": "'LOW'",
+        "relevance_score": "0",
+        "geo_score": "0",
+        "military_score": "0",
+        "diplomatic_score": "0",
+        "economic_score": "0",
+        "is_priority": "false",
+        "is_processed": "0",
+    },
+    "sources": {
+        "source_type": "'RSS'",
+        "category": "'NEWS_AGENCY'",
+        "language": "'en'",
+        "reliability_score": "5",
+        "is_active": "true",
+        "fetch_interval_minutes": "30",
+    },
+    "users": {
+        "role": "'ANALYST'",
+        "is_active": "true",
+        "is_verified": "false",
+        "dark_mode": "true",
+    },
+    "alerts": {
+        "regions": "'[]'",
+        "countries": "'[]'",
+        "themes": "'[]'",
+        "domains": "'[]'",
+        "keywords": "'[]'",
+        "min_relevance": "'medium'",
+        "frequency": "'DAILY'",
+        "is_active": "true",
+        "email_enabled": "true",
+        "trigger_count": "0",
+    },
+}
+
+
+def upgrade():
+    for table, defaults in SERVER_DEFAULTS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} SET DEFAULT {value}" for column, value in defaults.items())
+        )
+
+
+def downgrade():
+    for table, defaults in SERVER_DEFAULTS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} DROP DEFAULT" for column in defaults)
+        )
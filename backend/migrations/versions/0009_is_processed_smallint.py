@@ -0,0 +1,70 @@
+"""Make articles.is_processed a NOT NULL smallint and index the pending backlog
+
+ix_articles_pending covers the worker's poll (is_processed = 0, newest first)
+and only holds the unprocessed backlog, so polling cost no longer grows with
+the table.
+
+mv_country_hotspots depends on is_processed and Postgres won't change the
+type of a column a view references, so it is dropped and recreated around
+the ALTER. The statement-level counters triggers have no column list, so
+they don't pin the column and stay in place.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+COUNTRY_HOTSPOTS_VIEW_SQL = (
+    "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_country_hotspots AS "
+    "SELECT lower(trim(country)) AS country_key, count(*) AS total, "
+    "count(*) FILTER (WHERE relevance_level = 'HIGH') AS high_count "
+    "FROM articles WHERE is_processed = 1 AND country IS NOT NULL "
+    "GROUP BY lower(trim(country))"
+)
+
+
+def _retype_is_processed(type_name: str):
+    op.execute("LOCK TABLE articles IN ACCESS EXCLUSIVE MODE")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_country_hotspots")
+    op.execute(f"ALTER TABLE articles ALTER COLUMN is_processed TYPE {type_name}")
+    op.execute(COUNTRY_HOTSPOTS_VIEW_SQL)
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_country_hotspots_key "
+        "ON mv_country_hotspots (country_key)"
+    )
+
+
+def upgrade():
+    # Goes through the counters trigger, so NULLs are counted as pending
+    op.execute("UPDATE articles SET is_processed = 0 WHERE is_processed IS NULL")
+
+    data_type = op.get_bind().execute(sa.text(
+        "SELECT data_type FROM information_schema.columns "
+        "WHERE table_name = 'articles' AND column_name = 'is_processed'"
+    )).scalar()
+    # Databases created from the current models already have smallint
+    if data_type != "smallint":
+        _retype_is_processed("smallint")
+    op.execute("ALTER TABLE articles ALTER COLUMN is_processed SET NOT NULL")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_pending "
+            "ON articles (created_at DESC) WHERE is_processed = 0"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_pending")
+
+    op.execute("ALTER TABLE articles ALTER COLUMN is_processed DROP NOT NULL")
+    _retype_is_processed("integer")
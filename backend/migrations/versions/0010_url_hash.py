@@ -0,0 +1,37 @@
+"""Enforce article URL uniqueness on a 64-bit hash instead of the full URL
+
+articles.url_hash is a stored generated column (hashtextextended(url, 0)).
+ux_articles_url_hash is unique on that 8-byte key and replaces the
+articles_url_key B-tree over URLs of up to 2000 characters. Lookups match
+url_hash and then recheck url, so a hash collision can't return the wrong row.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE articles ADD COLUMN IF NOT EXISTS url_hash BIGINT "
+        "GENERATED ALWAYS AS (hashtextextended(url, 0)) STORED NOT NULL"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_articles_url_hash "
+            "ON articles (url_hash)"
+        )
+    op.execute("ALTER TABLE articles DROP CONSTRAINT IF EXISTS articles_url_key")
+
+
+def downgrade():
+    op.execute("ALTER TABLE articles ADD CONSTRAINT articles_url_key UNIQUE (url)")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ux_articles_url_hash")
+    op.execute("ALTER TABLE articles DROP COLUMN IF EXISTS url_hash")
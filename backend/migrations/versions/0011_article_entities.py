@@ -0,0 +1,83 @@
+"""Normalize article entities into article_entities, kept in sync by trigger
+
+articles.entities stays as the API's denormalized copy. trg_article_entities
+rewrites an article's article_entities rows whenever its entities change, and
+"articles mentioning X" becomes an index probe on (name, type). This
+supersedes ix_articles_entities_gin, which is dropped.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+# Elements without a name, and non-array entities values, are skipped
+ARTICLE_ENTITIES_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION article_entities_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        IF OLD.entities IS NOT DISTINCT FROM NEW.entities THEN
+            RETURN NULL;
+        END IF;
+        DELETE FROM article_entities WHERE article_id = NEW.id;
+    END IF;
+    IF jsonb_typeof(NEW.entities) = 'array' THEN
+        INSERT INTO article_entities (article_id, type, name)
+        SELECT NEW.id, left(coalesce(e->>'type', ''), 20), left(e->>'name', 200)
+        FROM jsonb_array_elements(NEW.entities) AS e
+        WHERE jsonb_typeof(e) = 'object' AND e->>'name' IS NOT NULL
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Attach the trigger and backfill with writers blocked, so no change is missed
+ARTICLE_ENTITIES_TRIGGER_SQL = """
+LOCK TABLE articles IN SHARE MODE;
+CREATE OR REPLACE TRIGGER trg_article_entities
+    AFTER INSERT OR UPDATE OF entities ON articles
+    FOR EACH ROW EXECUTE FUNCTION article_entities_sync();
+INSERT INTO article_entities (article_id, type, name)
+SELECT a.id, left(coalesce(e->>'type', ''), 20), left(e->>'name', 200)
+FROM articles a
+CROSS JOIN LATERAL jsonb_array_elements(
+    CASE WHEN jsonb_typeof(a.entities) = 'array' THEN a.entities ELSE '[]'::jsonb END
+) AS e
+WHERE jsonb_typeof(e) = 'object' AND e->>'name' IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+
+def upgrade():
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS article_entities ("
+        "article_id INTEGER NOT NULL REFERENCES articles (id) ON DELETE CASCADE, "
+        "type VARCHAR(20) NOT NULL, "
+        "name VARCHAR(200) NOT NULL, "
+        "PRIMARY KEY (article_id, type, name))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_article_entities_name_type "
+        "ON article_entities (name, type)"
+    )
+    op.execute(ARTICLE_ENTITIES_FUNCTION_SQL)
+    op.execute(ARTICLE_ENTITIES_TRIGGER_SQL)
+    op.execute("DROP INDEX IF EXISTS ix_articles_entities_gin")
+
+
+def downgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_articles_entities_gin "
+        "ON articles USING gin (entities jsonb_path_ops)"
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_article_entities ON articles")
+    op.execute("DROP FUNCTION IF EXISTS article_entities_sync()")
+    op.execute("DROP TABLE IF EXISTS article_entities")
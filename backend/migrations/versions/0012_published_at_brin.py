@@ -0,0 +1,29 @@
+"""BRIN index on articles.published_at for date-range filters
+
+Articles are ingested roughly in publication order, so a BRIN index (one
+min/max summary per 32 heap pages) serves the list's start_date/end_date
+filters at a tiny fraction of a B-tree's size and write cost.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_published_brin "
+            "ON articles USING brin (published_at) WITH (pages_per_range = 32)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_published_brin")
@@ -0,0 +1,47 @@
+"""Index articles by a hash of their URL without tracking parameters
+
+articles.url_canon_hash is a stored generated column hashing the url's
+canonical form, so ingest finds re-ingests of a story under a different
+tracking link with one index probe. The canonical form lowercases only scheme
+and host (paths can be case-sensitive), removes utm_*, fbclid and gclid
+parameters with their trailing "&", then drops any "?" or "&" left dangling,
+so a?utm_source=x&id=5 matches a?id=5. The index is not unique: existing rows
+may already hold such variants.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+# Copy of app.models.article.URL_CANON_HASH_SQL as of this revision
+URL_CANON_HASH_SQL = (
+    "hashtextextended(regexp_replace(regexp_replace("
+    "coalesce(lower(substring(url from '^[^/?#]*//[^/?#]*')), '') || "
+    "substr(url, coalesce(length(substring(url from '^[^/?#]*//[^/?#]*')), 0) + 1), "
+    "'(?<=[?&])(utm_[^=&#]*|fbclid|gclid)=[^&#]*&?', '', 'g'), '[?&]+(#|$)', '\\1'), 0)"
+)
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE articles ADD COLUMN IF NOT EXISTS url_canon_hash BIGINT "
+        f"GENERATED ALWAYS AS ({URL_CANON_HASH_SQL}) STORED NOT NULL"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_articles_url_canon_hash "
+            "ON articles (url_canon_hash)"
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_articles_url_canon_hash")
+    op.execute("ALTER TABLE articles DROP COLUMN IF EXISTS url_canon_hash")
@@ -0,0 +1,68 @@
+"""Keyset pagination over articles tied on a REAL relevance_score"""
+import os
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.api.articles import (
+    FEED_ORDER_BY, LIST_COLUMNS, _after_cursor, _article_row_to_dict, _encode_cursor
+)
+from app.models.article import Article
+from app.models.source import Source
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def test_cursor_binds_score_as_real():
+    cursor = _encode_cursor({
+        "is_priority": False,
+        "relevance_score": 0.7,
+        "published_at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        "created_at": None,
+        "id": 42,
+    })
+    sql = str(_after_cursor(cursor).compile(dialect=postgresql.dialect()))
+    assert "AS REAL" in sql
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (a migrated database) not set")
+def test_cursor_pages_through_tied_non_dyadic_scores():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            db = Session(bind=conn)
+            source = Source(name="cursor-test", url="https://example.com")
+            db.add(source)
+            db.flush()
+            published = datetime(2026, 1, 1, tzinfo=timezone.utc)
+            db.add_all([
+                Article(
+                    title=f"Tied {i}", url=f"https://example.com/{i}", source_id=source.id,
+                    relevance_score=0.7, published_at=published, is_processed=1
+                )
+                for i in range(5)
+            ])
+            db.flush()
+
+            query = db.query(*LIST_COLUMNS).outerjoin(
+                Source, Source.id == Article.source_id
+            ).filter(Article.source_id == source.id).order_by(*FEED_ORDER_BY)
+
+            seen = []
+            cursor = None
+            for _ in range(10):
+                page = query.filter(_after_cursor(cursor)) if cursor else query
+                rows = [_article_row_to_dict(row) for row in page.limit(2).all()]
+                if not rows:
+                    break
+                seen.extend(row["id"] for row in rows)
+                cursor = _encode_cursor(rows[-1])
+
+            assert len(seen) == 5
+            assert len(set(seen)) == 5
+        finally:
+            trans.rollback()
@@ -0,0 +1,81 @@
+"""Canonical URL form behind articles.url_canon_hash and ingest deduplication"""
+import os
+
+import pytest
+from sqlalchemy import create_engine, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.models.article import Article, _canonical_url, canonical_url
+from app.models.source import Source
+from app.services.news_fetcher import article_row, insert_new_articles
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+CANONICAL_CASES = [
+    # Leading tracking parameter: the "?" before the next parameter survives
+    ("https://example.com/a?utm_source=x&id=5", "https://example.com/a?id=5"),
+    # Only scheme and host are lowercased; the path keeps its case
+    ("HTTPS://Example.COM/News/Story-A", "https://example.com/News/Story-A"),
+    ("https://example.com/A?utm_source=x", "https://example.com/A"),
+    ("https://example.com/a?id=5&fbclid=abc", "https://example.com/a?id=5"),
+    ("https://example.com/a?id=5&gclid=1#top", "https://example.com/a?id=5#top"),
+    ("https://example.com/a?utm_medium=rss&utm_campaign=feed#top", "https://example.com/a#top"),
+    # Parameters that merely contain a tracking name are kept
+    ("https://example.com/a?x_utm_source=1", "https://example.com/a?x_utm_source=1"),
+    ("https://example.com/a", "https://example.com/a"),
+]
+
+
+@pytest.mark.parametrize("url,expected", CANONICAL_CASES)
+def test_canonical_url(url, expected):
+    assert canonical_url(url) == expected
+
+
+def test_tracking_variant_matches_plain_url():
+    assert canonical_url("https://example.com/a?utm_source=x&id=5") == canonical_url("https://example.com/a?id=5")
+
+
+def test_path_case_is_preserved():
+    assert canonical_url("https://example.com/A") != canonical_url("https://example.com/a")
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (a migrated database) not set")
+def test_sql_canonical_url_matches_python():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as conn:
+        for url, expected in CANONICAL_CASES:
+            assert conn.scalar(select(_canonical_url(literal(url)))) == expected
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (a migrated database) not set")
+def test_insert_skips_tracking_variants_stored_and_within_batch():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            # insert_new_articles commits; keep that inside the outer transaction
+            db = Session(bind=conn, join_transaction_mode="create_savepoint")
+            source = Source(name="canonical-url-test", url="https://example.com")
+            db.add(source)
+            db.flush()
+            db.add(Article(title="Stored", url="https://example.com/stored?id=1", source_id=source.id))
+            db.flush()
+
+            added = insert_new_articles(db, [
+                article_row("Stored again", "https://example.com/stored?utm_source=x&id=1", source.id),
+                article_row("New", "https://example.com/new?utm_source=rss", source.id),
+                article_row("New again", "https://example.com/new?fbclid=abc", source.id),
+            ])
+
+            assert added == 1
+            titles = db.scalars(
+                select(Article.title).where(Article.source_id == source.id).order_by(Article.id)
+            ).all()
+            assert titles == ["Stored", "New"]
+            assert db.scalar(
+                select(func.count()).where(Article.url_canon_hash == func.hashtextextended(
+                    "https://example.com/new", 0
+                ))
+            ) == 1
+        finally:
+            trans.rollback()
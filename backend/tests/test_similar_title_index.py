@@ -0,0 +1,46 @@
+"""SimilarTitleIndex answers exactly like titles_are_similar against every stored title"""
+import random
+
+import pytest
+
+from app.services.news_fetcher import SimilarTitleIndex, titles_are_similar
+
+# A small vocabulary so random titles often overlap heavily
+WORDS = ["india", "china", "border", "talks", "navy", "drill", "Pakistan", "army",
+         "missile", "test", "summit", "trade", "deal", "sanctions", "strait", "patrol"]
+
+
+def _random_title(rng: random.Random) -> str:
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 9)))
+    # Exercise normalize_title: case, punctuation and "Breaking:"-style prefixes
+    if rng.random() < 0.3:
+        title = title.upper()
+    if rng.random() < 0.3:
+        title += rng.choice(["!", " - Reuters", "?", ","])
+    if rng.random() < 0.2:
+        title = "Breaking: " + title
+    return title
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.85, 1.0])
+def test_index_matches_pairwise_loop(threshold):
+    rng = random.Random(20261015)
+    for _ in range(200):
+        stored = [_random_title(rng) for _ in range(rng.randint(0, 30))]
+        index = SimilarTitleIndex(threshold)
+        for title in stored:
+            index.add(title)
+
+        for _ in range(15):
+            title = _random_title(rng) if rng.random() < 0.7 else rng.choice(stored or [""])
+            expected = any(titles_are_similar(title, other, threshold) for other in stored)
+            assert index.has_similar(title) == expected, (title, stored)
+
+
+def test_index_matches_exact_and_near_duplicates():
+    index = SimilarTitleIndex()
+    index.add("India and China hold border talks in Ladakh today")
+
+    assert index.has_similar("INDIA AND CHINA HOLD BORDER TALKS IN LADAKH TODAY!")
+    assert index.has_similar("India and China hold border talks in Ladakh")
+    assert not index.has_similar("Navy drill in the Arabian Sea")
@@ -2,7 +2,7 @@ import { useState } from 'react'
 import { useQuery } from '@tanstack/react-query'
 import { useSearchParams, Link } from 'react-router-dom'
 import { Filter, ExternalLink, ChevronLeft, ChevronRight, Newspaper } from 'lucide-react'
-import { getArticles, getRegionStats, getThemeStats } from '../services/api'
+import { getArticles, getDimensionStats } from '../services/api'
 import RelevanceBadge from '../components/articles/RelevanceBadge'
 import type { ArticleFilters, RelevanceLevel } from '../types'
 import { format } from 'date-fns'
@@ -27,15 +27,13 @@ export default function Articles() {
     queryFn: () => getArticles(filters),
   })
 
-  const { data: regions } = useQuery({
-    queryKey: ['regions'],
-    queryFn: getRegionStats,
-  })
-
-  const { data: themes } = useQuery({
-    queryKey: ['themes'],
-    queryFn: getThemeStats,
+  // Regions and themes come from one grouped query, shared with the Regions page
+  const { data: dimensions } = useQuery({
+    queryKey: ['dimension-stats', 15],
+    queryFn: () => getDimensionStats(15),
   })
+  const regions = dimensions?.regions
+  const themes = dimensions?.themes
 
   const updateFilter = (key: string, value: string | undefined) => {
     const newParams = new URLSearchParams(searchParams)
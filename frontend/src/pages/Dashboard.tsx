@@ -11,37 +11,22 @@ import {
   Radio,
 } from 'lucide-react'
 import { Link } from 'react-router-dom'
-import {
-  getDashboardStats,
-  getTrends,
-  getRegionStats,
-  getRecentHighImpact,
-} from '../services/api'
+import { getDashboardBundle } from '../services/api'
 import { LineChart, Line, XAxis, YAxis, Tooltip, ResponsiveContainer, AreaChart, Area } from 'recharts'
 import RelevanceBadge from '../components/articles/RelevanceBadge'
 
 export default function Dashboard() {
-  const { data: stats, isLoading: statsLoading } = useQuery({
-    queryKey: ['dashboard-stats'],
-    queryFn: getDashboardStats,
-  })
-
-  const { data: trends } = useQuery({
-    queryKey: ['dashboard-trends'],
-    queryFn: () => getTrends(7),
-  })
-
-  const { data: regions } = useQuery({
-    queryKey: ['region-stats'],
-    queryFn: getRegionStats,
-  })
-
-  const { data: recentHigh } = useQuery({
-    queryKey: ['recent-high-impact'],
-    queryFn: () => getRecentHighImpact(5),
+  // Stats, trends, regions and recent reports arrive in one round-trip
+  const { data: bundle, isLoading } = useQuery({
+    queryKey: ['dashboard-bundle', 7, 5],
+    queryFn: () => getDashboardBundle(7, 5),
   })
+  const stats = bundle?.stats
+  const trends = bundle?.trends
+  const regions = bundle?.regions
+  const recentHigh = bundle?.recent_high_impact
 
-  if (statsLoading) {
+  if (isLoading) {
     return (
       <div className="animate-pulse space-y-6">
         <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
@@ -1,7 +1,7 @@
 import { useQuery } from '@tanstack/react-query'
 import { Link } from 'react-router-dom'
 import { MapContainer, TileLayer, CircleMarker, Popup } from 'react-leaflet'
-import { getHotspots, getRegionStats, getCountryStats, getCountryHotspots } from '../services/api'
+import { getHotspots, getDimensionStats, getCountryHotspots } from '../services/api'
 import { ArrowUpRight, Globe2 } from 'lucide-react'
 import 'leaflet/dist/leaflet.css'
 
@@ -16,15 +16,13 @@ export default function Regions() {
     queryFn: () => getCountryHotspots(30),
   })
 
-  const { data: regions } = useQuery({
-    queryKey: ['region-stats'],
-    queryFn: getRegionStats,
-  })
-
-  const { data: countries } = useQuery({
-    queryKey: ['country-stats'],
-    queryFn: () => getCountryStats(15),
+  // Regions and top countries come from one grouped query, shared with the Articles page
+  const { data: dimensions } = useQuery({
+    queryKey: ['dimension-stats', 15],
+    queryFn: () => getDimensionStats(15),
   })
+  const regions = dimensions?.regions
+  const countries = dimensions?.countries
 
   return (
     <div className="space-y-6">
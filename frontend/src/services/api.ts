@@ -9,6 +9,7 @@ import type {
   TrendData,
   RegionStats,
   ThemeStats,
+  DimensionStats,
   Hotspot,
 } from '../types'
 
@@ -80,14 +81,24 @@ export const seedDefaultSources = async (): Promise<void> => {
 }
 
 // Dashboard
+
+// Columnar payload ({columns, rows}) used by the larger dashboard series
+interface ColumnarRows {
+  columns: string[]
+  rows: unknown[][]
+}
+
+const fromColumns = <T>({ columns, rows }: ColumnarRows): T[] =>
+  rows.map((row) => Object.fromEntries(columns.map((col, i) => [col, row[i]])) as T)
+
 export const getDashboardStats = async (): Promise<DashboardStats> => {
   const response = await api.get('/api/dashboard/stats')
   return response.data
 }
 
 export const getTrends = async (days: number = 7): Promise<TrendData[]> => {
-  const response = await api.get(`/api/dashboard/trends?days=${days}`)
-  return response.data
+  const response = await api.get(`/api/dashboard/trends?days=${days}&columnar=true`)
+  return fromColumns<TrendData>(response.data)
 }
 
 export const getRegionStats = async (): Promise<RegionStats[]> => {
@@ -101,7 +112,12 @@ export const getThemeStats = async (): Promise<ThemeStats[]> => {
 }
 
 export const getCountryStats = async (limit: number = 20): Promise<{ country: string; count: number }[]> => {
-  const response = await api.get(`/api/dashboard/countries?limit=${limit}`)
+  const response = await api.get(`/api/dashboard/countries?limit=${limit}&columnar=true`)
+  return fromColumns<{ country: string; count: number }>(response.data)
+}
+
+export const getDimensionStats = async (countryLimit: number = 20): Promise<DimensionStats> => {
+  const response = await api.get(`/api/dashboard/dimensions?country_limit=${countryLimit}`)
   return response.data
 }
 
@@ -117,11 +133,12 @@ export interface CountryHotspot {
   total_articles: number
   high_relevance: number
   intensity: number
+  share: number
 }
 
 export const getCountryHotspots = async (limit: number = 30): Promise<CountryHotspot[]> => {
-  const response = await api.get(`/api/dashboard/country-hotspots?limit=${limit}`)
-  return response.data
+  const response = await api.get(`/api/dashboard/country-hotspots?limit=${limit}&columnar=true`)
+  return fromColumns<CountryHotspot>(response.data)
 }
 
 export const getRecentHighImpact = async (limit: number = 5): Promise<Article[]> => {
@@ -129,6 +146,18 @@ export const getRecentHighImpact = async (limit: number = 5): Promise<Article[]>
   return response.data
 }
 
+export interface DashboardBundle {
+  stats: DashboardStats
+  trends: TrendData[]
+  regions: RegionStats[]
+  recent_high_impact: Article[]
+}
+
+export const getDashboardBundle = async (days: number = 7, recentLimit: number = 5): Promise<DashboardBundle> => {
+  const response = await api.get(`/api/dashboard/bundle?days=${days}&recent_limit=${recentLimit}`)
+  return response.data
+}
+
 // Alerts
 export const getAlerts = async (): Promise<Alert[]> => {
   const response = await api.get('/api/alerts/')
@@ -195,8 +224,8 @@ export interface User {
   role: 'admin' | 'analyst'
   is_active: boolean
   is_verified: boolean
-  preferred_regions: string | null
-  preferred_themes: string | null
+  preferred_regions: string[]
+  preferred_themes: string[]
   dark_mode: boolean
   created_at: string
   last_login_at: string | null
@@ -43,6 +43,8 @@ export interface ArticleListResponse {
   page: number
   page_size: number
   total_pages: number
+  next_cursor?: string | null
+  has_more: boolean
 }
 
 export interface Source {
@@ -121,6 +123,12 @@ export interface ThemeStats {
   avg_relevance: number
 }
 
+export interface DimensionStats {
+  regions: RegionStats[]
+  themes: ThemeStats[]
+  countries: { country: string; count: number }[]
+}
+
 export interface Hotspot {
   region: string
   lat: number